@@ -3,10 +3,10 @@ Base agent class with OpenRouter integration via LangChain.
 """
 
 from abc import ABC, abstractmethod
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL
+from src.config import DEFAULT_MODEL
+from src.story_agents.base_story_agent import get_llm
 
 
 class BaseAgent(ABC):
@@ -14,12 +14,8 @@ class BaseAgent(ABC):
 
     def __init__(self, model: str = DEFAULT_MODEL):
         self.model_name = model
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=0.7,
-        )
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, 0.7)
 
     @property
     @abstractmethod
@@ -2,11 +2,11 @@
 Supervisor agent that orchestrates debates and makes final card selections.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL, DEBATE_ROUNDS
+from src.config import DEFAULT_MODEL, DEBATE_ROUNDS
 from src.agents.card_agents import PlacerAgent, RotatorAgent, CriticAgent, SynthesizerAgent
+from src.story_agents.base_story_agent import get_llm
 
 
 class Supervisor:
@@ -32,12 +32,7 @@ class Supervisor:
         ]
 
         # Supervisor's own LLM for tiebreaking
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=0.5,
-        )
+        self.llm = get_llm(model, 0.5)
 
     def run_debate(self, context: str, cards: list[str], card_type: str) -> tuple[str, dict]:
         """
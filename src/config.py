@@ -24,6 +24,18 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 # Default model for all agents (supports tool calling)
 DEFAULT_MODEL = "openai/gpt-4o-mini"
 
+# Model for critic agents (scoring is a classification-style task, so a
+# cheaper model can be set here). Unset: critics use the creator's model.
+# When set, critiques it is unsure about are re-run on the creator's model.
+CRITIC_MODEL = os.environ.get("CRITIC_MODEL") or None
+
+# Two-stage structured output for creator agents with large nested schemas:
+# the agent's model writes freely, then PARSING_MODEL fills the schema from
+# that text. Off by default (it doubles the creators' LLM calls); set
+# TWO_STAGE_STRUCTURED=1 to opt in for a run
+TWO_STAGE_STRUCTURED = os.environ.get("TWO_STAGE_STRUCTURED", "0") == "1"
+PARSING_MODEL = os.environ.get("PARSING_MODEL", DEFAULT_MODEL)
+
 # Alternative models with tool calling support
 SUPPORTED_MODELS = [
     "openai/gpt-4o-mini",    # Reliable, fast
@@ -37,6 +49,16 @@ SUPPORTED_MODELS = [
 DEBATE_ROUNDS = 2  # Initial opinions + rebuttals, then vote
 NAME_DEBATE_ROUNDS = 2  # Critique rounds per character name
 
+# LLM concurrency (per-scene work dispatched in parallel, bounded for rate limits)
+MAX_CONCURRENT_LLM_REQUESTS = 8
+# Retries on rate limits (429), timeouts and 5xx, with exponential backoff
+LLM_MAX_RETRIES = 6
+
+# LLM response cache (content-addressed; set LLM_CACHE=0 to disable)
+# Responses are persisted under LLM_CACHE_DIR so reruns skip paid-for calls
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE", "1") != "0"
+LLM_CACHE_DIR = PROJECT_ROOT / ".llm_cache"
+
 # Card draw configuration (like physical deck's 4 options)
 CARDS_PER_DRAW = 4
 
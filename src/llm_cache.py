@@ -0,0 +1,158 @@
+"""
+LLM Response Cache - Content-addressed cache for structured LLM responses.
+
+Keys are sha256 hashes of everything that determines a response (model,
+temperature, prompts, codex fingerprint, output schema). Values are the
+structured response as a plain dict, kept in memory and, when a cache
+directory is configured, persisted as one JSON file per key so reruns of a
+phase skip calls they have already paid for.
+
+Usage:
+    cache = get_llm_cache()
+    key = make_cache_key(model=model, prompt=prompt, schema="SceneImageCritiqueSchema")
+    hit = cache.get(key)
+    if hit is None:
+        response = llm.invoke(...)
+        cache.set(key, response.model_dump())
+"""
+
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.config import LLM_CACHE_DIR, LLM_CACHE_ENABLED
+
+
+def make_cache_key(**parts) -> str:
+    """Hash keyword parts (JSON-serializable) into a stable cache key."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Thread-safe in-memory cache with optional JSON-file persistence."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.enabled = enabled
+        self._memory: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            value = self._memory.get(key)
+
+        if value is None and self.cache_dir:
+            path = self._path(key)
+            if path.exists():
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        value = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    value = None
+                if value is not None:
+                    with self._lock:
+                        self._memory[key] = value
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        """Store value under key (in memory, and on disk if configured)."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._memory[key] = value
+
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False)
+                tmp_path.replace(path)
+            except OSError as e:
+                print(f"    Warning: could not persist LLM cache entry: {e}")
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+_default_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the process-wide LLM response cache (configured from src.config)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LLMCache(cache_dir=LLM_CACHE_DIR, enabled=LLM_CACHE_ENABLED)
+    return _default_cache
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(schema: type[BaseModel]) -> str:
+    """Short hash of a schema's JSON schema, so entries cached under an older version of it miss."""
+    text = json.dumps(schema.model_json_schema(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def structured_cache_key(schema: type[BaseModel], **key_parts) -> str:
+    """Cache key for a structured response; shared by cached_structured_call and callers caching by hand."""
+    return make_cache_key(schema=schema.__name__, schema_version=schema_fingerprint(schema), **key_parts)
+
+
+def cached_instance(cache: LLMCache, key: str, schema: type[SchemaT]) -> Optional[SchemaT]:
+    """Look up key and validate it into schema; None on a miss or an entry the schema now rejects."""
+    hit = cache.get(key)
+    if hit is None:
+        return None
+    try:
+        return schema.model_validate(hit)
+    except ValidationError:
+        return None
+
+
+def cached_structured_call(schema: type[SchemaT], call: Callable[[], SchemaT], **key_parts) -> SchemaT:
+    """
+    Return a cached structured response, or run `call` and cache its result.
+
+    Args:
+        schema: Pydantic schema the response is validated into
+        call: Zero-argument function making the actual LLM call
+        **key_parts: Everything that determines the response (model,
+            temperature, prompts, codex fingerprint, ...)
+
+    Returns:
+        Instance of schema
+    """
+    cache = get_llm_cache()
+    key = structured_cache_key(schema, **key_parts)
+
+    # An entry the schema rejects is treated as a miss and overwritten
+    hit = cached_instance(cache, key, schema)
+    if hit is not None:
+        return hit
+
+    result = call()
+    cache.set(key, result.model_dump())
+    return result
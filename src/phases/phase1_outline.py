@@ -14,6 +14,7 @@ import sys
 import json
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, Any
@@ -307,11 +308,13 @@ def run_phase1_outline(
         else:
             outline_json = json.dumps(outline)
 
-            print(">>> Getting structure critique...")
-            structure_critique = structure_critic.critique(outline_json)
-
-            print(">>> Getting pacing critique...")
-            pacing_critique = pacing_critic.critique(outline_json)
+            # Independent critics on the same outline run concurrently
+            print(">>> Getting structure + pacing critiques (parallel)...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                structure_future = executor.submit(structure_critic.critique, outline_json)
+                pacing_future = executor.submit(pacing_critic.critique, outline_json)
+            structure_critique = structure_future.result()
+            pacing_critique = pacing_future.result()
 
             # Store critiques in metadata
             critique_data = {
@@ -14,6 +14,7 @@ import json
 import time
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -385,13 +386,15 @@ def run_phase3_narrative(
         else:
             current_narrative_json = json.dumps(current_narrative, indent=2, ensure_ascii=False)
 
-            print(">>> Getting style critique...")
-            style_critique = style_critic.critique(current_narrative_json)
-
-            print(">>> Getting continuity critique...")
-            continuity_critique = continuity_critic.critique(
-                current_narrative_json, characters_json, locations_json
-            )
+            # Independent critics on the same narrative run concurrently
+            print(">>> Getting style + continuity critiques (parallel)...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                style_future = executor.submit(style_critic.critique, current_narrative_json)
+                continuity_future = executor.submit(
+                    continuity_critic.critique, current_narrative_json, characters_json, locations_json
+                )
+            style_critique = style_future.result()
+            continuity_critique = continuity_future.result()
 
             # Store critiques in metadata
             critique_data = {
@@ -21,6 +21,7 @@ import sys
 import json
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -28,8 +29,12 @@ from typing import Optional
 # Add parent directory to path for proper package imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.story_agents.storyboard_agents import generate_scene_storyboard
-from src.config import DEFAULT_MODEL
+from src.story_agents.storyboard_agents import (
+    build_character_id_map,
+    build_location_id_map,
+    generate_scene_storyboard,
+)
+from src.config import DEFAULT_MODEL, MAX_CONCURRENT_LLM_REQUESTS
 
 
 @dataclass
@@ -60,6 +65,7 @@ def run_phase3b_storyboard(
     codex_path: Path,
     model: str = None,
     max_revisions: int = 2,
+    max_concurrent: int = MAX_CONCURRENT_LLM_REQUESTS,
 ) -> Phase3bStoryboardResult:
     """
     Generate storyboards for all narrative scenes.
@@ -71,6 +77,7 @@ def run_phase3b_storyboard(
         codex_path: Path to codex.json (must have narrative from Phase 3)
         model: LLM model to use (default: from codex config)
         max_revisions: Maximum critique-revision cycles per scene
+        max_concurrent: Maximum scenes processed in parallel
 
     Returns:
         Phase3bStoryboardResult with counts and status
@@ -115,6 +122,9 @@ def run_phase3b_storyboard(
     # Get characters and locations for context
     characters = story.get("characters", [])
     locations = story.get("locations", [])
+    # Name -> ID maps are the same for every scene, so build them once
+    char_id_map = build_character_id_map(characters)
+    loc_id_map = build_location_id_map(locations)
 
     print(f"\n{'='*60}")
     print("PHASE 3b: STORYBOARD GENERATION")
@@ -137,63 +147,94 @@ def run_phase3b_storyboard(
     scenes_processed = 0
     step_start = time.time()
 
-    # Process each act and scene
-    for act in acts:
-        act_num = act.get("act_number", 0)
-        act_name = act.get("act_name", f"Act {act_num}")
-        scenes = act.get("scenes", [])
+    # Critiques are streamed here as produced (the codex is only saved at the
+    # end); started fresh each run so reruns don't mix records
+    critique_log = codex_path.parent / "storyboard_critiques.jsonl"
+    critique_log.write_text("", encoding="utf-8")
 
-        print(f"\n>>> Act {act_num}: {act_name} ({len(scenes)} scenes)")
-
-        for scene in scenes:
-            scene_num = scene.get("scene_number", 0)
-            scene_id = f"act{act_num}_scene{scene_num}"
-            scene_text = scene.get("text", "")
-            scene_location = scene.get("location", "Unknown Location")
-            scene_characters = scene.get("characters", [])
-            scene_time = scene.get("time", "DAY")
-
-            if not scene_text:
-                print(f"    Skipping {scene_id}: No narrative text")
-                continue
-
-            print(f"\n>>> Scene {scene_num}: {scene_location}")
-            print(f"    Characters: {', '.join(scene_characters)}")
-            print(f"    Time: {scene_time}")
-
-            try:
-                result = generate_scene_storyboard(
+    # Scenes are independent, so dispatch them concurrently (bounded to
+    # respect rate limits) and collect results in scene order below
+    executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent))
+    try:
+        futures = {}
+        for act in acts:
+            act_num = act.get("act_number", 0)
+            for scene in act.get("scenes", []):
+                if not scene.get("text", ""):
+                    continue
+                scene_id = f"act{act_num}_scene{scene.get('scene_number', 0)}"
+                # Each scene's progress is printed as one block when it finishes,
+                # so concurrent scenes don't interleave
+                log_lines = [f"\n    [{scene_id}]"]
+                futures[id(scene)] = executor.submit(
+                    generate_scene_storyboard,
                     scene_id=scene_id,
-                    scene_text=scene_text,
-                    scene_location=scene_location,
-                    scene_characters=scene_characters,
+                    scene_text=scene["text"],
+                    scene_location=scene.get("location", "Unknown Location"),
+                    scene_characters=scene.get("characters", []),
                     all_characters=characters,
                     all_locations=locations,
                     model=model,
                     max_revisions=max_revisions,
+                    critique_log=critique_log,
+                    char_id_map=char_id_map,
+                    loc_id_map=loc_id_map,
+                    log=log_lines.append,
                 )
+                futures[id(scene)].add_done_callback(lambda _, lines=log_lines: print("\n".join(lines)))
+        print(f">>> Concurrency: {min(max_concurrent, len(futures))} scenes at a time")
 
-                # Embed shots directly in the scene (at same level as text)
-                scene["shots"] = result["storyboard"]["shots"]
-
-                # Store metadata
-                phase3b_metadata["storyboards"].append(result["metadata"])
-
-                # Update counts
-                num_shots = result["storyboard"]["shot_count"]
-                duration = result["storyboard"]["total_duration_seconds"]
-                total_shots += num_shots
-                total_duration += duration
-                scenes_processed += 1
-
-                print(f"    Generated {num_shots} shots ({duration}s) | Revisions: {result['revision_count']}")
-
-            except Exception as e:
-                print(f"    ERROR: {e}")
-                phase3b_metadata["storyboards"].append({
-                    "scene_id": scene_id,
-                    "error": str(e),
-                })
+        # Process each act and scene
+        for act in acts:
+            act_num = act.get("act_number", 0)
+            act_name = act.get("act_name", f"Act {act_num}")
+            scenes = act.get("scenes", [])
+
+            print(f"\n>>> Act {act_num}: {act_name} ({len(scenes)} scenes)")
+
+            for scene in scenes:
+                scene_num = scene.get("scene_number", 0)
+                scene_id = f"act{act_num}_scene{scene_num}"
+                scene_text = scene.get("text", "")
+                scene_location = scene.get("location", "Unknown Location")
+                scene_characters = scene.get("characters", [])
+                scene_time = scene.get("time", "DAY")
+
+                if not scene_text:
+                    print(f"    Skipping {scene_id}: No narrative text")
+                    continue
+
+                print(f"\n>>> Scene {scene_num}: {scene_location}")
+                print(f"    Characters: {', '.join(scene_characters)}")
+                print(f"    Time: {scene_time}")
+
+                try:
+                    result = futures[id(scene)].result()
+
+                    # Embed shots directly in the scene (at same level as text)
+                    scene["shots"] = result["storyboard"]["shots"]
+
+                    # Store metadata
+                    phase3b_metadata["storyboards"].append(result["metadata"])
+
+                    # Update counts
+                    num_shots = result["storyboard"]["shot_count"]
+                    duration = result["storyboard"]["total_duration_seconds"]
+                    total_shots += num_shots
+                    total_duration += duration
+                    scenes_processed += 1
+
+                    print(f"    Generated {num_shots} shots ({duration}s) | Revisions: {result['revision_count']}")
+
+                except Exception as e:
+                    print(f"    ERROR: {e}")
+                    phase3b_metadata["storyboards"].append({
+                        "scene_id": scene_id,
+                        "error": str(e),
+                    })
+    finally:
+        # On an early exit (e.g. Ctrl+C), drop scenes that haven't started
+        executor.shutdown(cancel_futures=True)
 
     # Update codex (shots are now embedded in narrative scenes)
     codex["story"] = story
@@ -246,6 +287,12 @@ def main():
         default=2,
         help="Maximum critique-revision cycles per scene (default: 2)"
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=MAX_CONCURRENT_LLM_REQUESTS,
+        help=f"Maximum scenes processed in parallel (default: {MAX_CONCURRENT_LLM_REQUESTS})"
+    )
     args = parser.parse_args()
 
     if not args.codex_path.exists():
@@ -257,6 +304,7 @@ def main():
             args.codex_path,
             model=args.model,
             max_revisions=args.max_revisions,
+            max_concurrent=args.max_concurrent,
         )
 
         if result.success:
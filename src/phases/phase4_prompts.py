@@ -16,6 +16,7 @@ import sys
 import json
 import time
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
@@ -33,11 +34,15 @@ from src.story_agents.image_prompt_agents import (
     StoryPosterPromptAgent,
     StoryPosterCriticAgent,
 )
-from src.story_agents.scene_image_prompt_agents import generate_scene_image_prompt
+from src.story_agents.codex_index import invalidate_codex_index
+from src.story_agents.scene_image_prompt_agents import (
+    generate_scene_image_prompt,
+    generate_scene_image_prompts_batch,
+)
 # from src.story_agents.shot_frame_prompt_agents import generate_shot_frame_prompts
 # from src.story_agents.video_prompt_agents import generate_video_prompt
 from src.visual_styles import get_default_style
-from src.config import DEFAULT_MODEL
+from src.config import DEFAULT_MODEL, MAX_CONCURRENT_LLM_REQUESTS
 
 
 @dataclass
@@ -140,6 +145,8 @@ def run_phase4_prompts(
     codex_path: Path,
     model: str = None,
     steps: list[int] = None,
+    max_concurrent: int = MAX_CONCURRENT_LLM_REQUESTS,
+    batch_critique: bool = False,
 ) -> Phase4PromptsResult:
     """
     Generate image prompts for story elements in codex.
@@ -154,6 +161,8 @@ def run_phase4_prompts(
         codex_path: Path to codex.json (must have characters/locations from Phase 2)
         model: LLM model to use (default: from codex config)
         steps: List of step numbers to run (default: all steps [1,2,3,4,5])
+        max_concurrent: Maximum scenes processed in parallel in Step 4
+        batch_critique: Run Step 4 in lockstep rounds, batching critiques across scenes
 
     Returns:
         Phase4PromptsResult with counts of generated prompts
@@ -252,6 +261,7 @@ def run_phase4_prompts(
 
         # Save after Step 1 to preserve progress
         codex["story"]["characters"] = characters
+        invalidate_codex_index(codex)  # Entries gained character_prompt in place
         step_timings["step1_characters"] = round(time.time() - step_start, 2)
         save_codex(codex, codex_path)
         print(f"\n>>> Step 1 complete: {char_prompt_count} character prompts generated ({step_timings['step1_characters']:.1f}s)")
@@ -316,6 +326,7 @@ def run_phase4_prompts(
 
         # Save after Step 2 to preserve progress
         codex["story"]["locations"] = locations
+        invalidate_codex_index(codex)  # Entries gained location_prompt in place
         step_timings["step2_locations"] = round(time.time() - step_start, 2)
         save_codex(codex, codex_path)
         print(f"\n>>> Step 2 complete: {loc_prompt_count} location prompts generated ({step_timings['step2_locations']:.1f}s)")
@@ -466,27 +477,59 @@ def run_phase4_prompts(
         print(f"    Total scenes to process: {total_scenes}")
 
         phase4_metadata["scene_image_prompts"] = []
-        scene_index = 0
 
+        # Scenes are independent, so dispatch them concurrently (bounded to
+        # respect rate limits). Each worker is a full composer/critic loop.
+        scene_jobs = []
         for act_idx, act in enumerate(acts):
             act_num = act.get("act_number", act_idx + 1)
-
             for scene_idx, scene in enumerate(act.get("scenes", [])):
-                scene_index += 1
-                scene_num = scene.get("scene_number", scene_idx + 1)
-                scene_location = scene.get("location", "Unknown")
+                scene_jobs.append((act_num, scene.get("scene_number", scene_idx + 1), scene))
+
+        print(f"    Concurrency: {min(max_concurrent, total_scenes)} scenes at a time")
+
+        executor = None
+        if batch_critique:
+            # Lockstep rounds: critiques for all scenes go out as one batch
+            print("    Mode: batched critiques across scenes")
+            outcomes = generate_scene_image_prompts_batch(
+                [(scene, act_num) for act_num, _, scene in scene_jobs],
+                codex=codex,
+                visual_style=visual_style,
+                model=model,
+                max_revisions=2,
+                max_concurrency=max_concurrent,
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max(1, max_concurrent))
+            outcomes = []
+            for act_num, scene_num, scene in scene_jobs:
+                # Each scene's progress is printed as one block when it
+                # finishes, so concurrent scenes don't interleave
+                log_lines = [f"\n    Act {act_num}, Scene {scene_num}:"]
+                future = executor.submit(
+                    generate_scene_image_prompt,
+                    scene_data=scene,
+                    act_number=act_num,
+                    codex=codex,
+                    visual_style=visual_style,
+                    model=model,
+                    max_revisions=2,
+                    log=log_lines.append,
+                )
+                future.add_done_callback(lambda _, lines=log_lines: print("\n".join(lines)))
+                outcomes.append(future)
 
+        try:
+            # Collect in scene order so metadata stays deterministic
+            for scene_index, ((act_num, scene_num, scene), outcome) in enumerate(zip(scene_jobs, outcomes), 1):
+                scene_location = scene.get("location", "Unknown")
                 print(f"\n    [{scene_index}/{total_scenes}] Act {act_num}, Scene {scene_num} ({scene_location})...")
 
                 try:
-                    result = generate_scene_image_prompt(
-                        scene_data=scene,
-                        act_number=act_num,
-                        codex=codex,
-                        visual_style=visual_style,
-                        model=model,
-                        max_revisions=2,
-                    )
+                    result = outcome.result() if isinstance(outcome, Future) else outcome
+                    if isinstance(result, Exception):
+                        raise result
 
                     # Add scene image prompt to scene data
                     scene["scene_image_prompt"] = {
@@ -524,6 +567,9 @@ def run_phase4_prompts(
                         "scene": scene_num,
                         "error": str(e),
                     })
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # Update narrative with modified scenes and save after Step 4
         codex["story"]["narrative"] = narrative
@@ -612,6 +658,17 @@ def main():
         choices=[1, 2, 3, 4, 5],
         help="Run specific steps (1: Characters, 2: Locations, 3: Posters, 4: Shot Frames, 5: Video). Example: --steps 1 2"
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=MAX_CONCURRENT_LLM_REQUESTS,
+        help=f"Maximum scenes processed in parallel (default: {MAX_CONCURRENT_LLM_REQUESTS})"
+    )
+    parser.add_argument(
+        "--batch-critique",
+        action="store_true",
+        help="Batch scene image critiques across all scenes instead of per-scene loops"
+    )
     args = parser.parse_args()
 
     if not args.codex_path.exists():
@@ -622,6 +679,8 @@ def main():
         args.codex_path,
         model=args.model,
         steps=args.steps,
+        max_concurrent=args.max_concurrent,
+        batch_critique=args.batch_critique,
     )
 
     print(f"\n>>> Prompts generated:")
@@ -2,30 +2,188 @@
 Base class for story builder agents with OpenRouter integration.
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Type, TypeVar
+from functools import lru_cache
+from typing import Optional, Type, TypeVar
 
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel
 
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL
+from src.config import (
+    OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL, LLM_MAX_RETRIES, MAX_CONCURRENT_LLM_REQUESTS,
+    PARSING_MODEL, TWO_STAGE_STRUCTURED,
+)
+from src.llm_cache import cached_structured_call
 
 T = TypeVar("T", bound=BaseModel)
 
 
+# One keep-alive connection pool shared by every agent, so TCP/TLS
+# connections to OpenRouter are reused instead of opened per agent instance
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(600.0, connect=10.0),
+)
+
+
+@lru_cache(maxsize=None)
+def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.7) -> ChatOpenAI:
+    """
+    Get the shared ChatOpenAI client for a (model, temperature) pair.
+
+    ChatOpenAI is stateless between calls and safe to share across agents and
+    threads, so one instance per configuration is enough. Rate-limited and
+    failed requests are retried with exponential backoff (LLM_MAX_RETRIES),
+    so concurrent callers back off instead of failing at the rate limit.
+
+    Args:
+        model: OpenRouter model name
+        temperature: Sampling temperature
+
+    Returns:
+        ChatOpenAI bound to the shared HTTP connection pool
+    """
+    return ChatOpenAI(
+        model=model,
+        api_key=OPENROUTER_API_KEY,
+        base_url=OPENROUTER_BASE_URL,
+        temperature=temperature,
+        http_client=_http_client,
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_structured_llm(model: str, temperature: float, schema: Type[BaseModel], max_tokens: Optional[int] = None):
+    """
+    Get the shared structured-output runnable for a (model, temperature, schema, max_tokens).
+
+    with_structured_output converts the Pydantic schema into a tool/JSON schema
+    and wraps the client in a parser chain; building that once per combination
+    keeps the conversion out of every call.
+
+    Args:
+        model: OpenRouter model name
+        temperature: Sampling temperature
+        schema: Pydantic model class to enforce
+        max_tokens: Maximum completion tokens bound on the runnable (None: provider default)
+
+    Returns:
+        Runnable returning schema instances
+    """
+    structured = get_llm(model, temperature).with_structured_output(schema)
+    return structured if max_tokens is None else structured.bind(max_tokens=max_tokens)
+
+
+@lru_cache(maxsize=None)
+def get_streaming_structured_llm(model: str, temperature: float, schema: Type[BaseModel]):
+    """
+    Get the shared streaming structured-output runnable for a (model, temperature, schema).
+
+    Built from the schema's JSON schema rather than the class, so .stream()
+    yields partial dicts as the response arrives (used for early abort).
+
+    Args:
+        model: OpenRouter model name
+        temperature: Sampling temperature
+        schema: Pydantic model class whose JSON schema is enforced
+
+    Returns:
+        Runnable streaming partial dicts
+    """
+    return get_llm(model, temperature).with_structured_output(json_schema_of(schema))
+
+
+@lru_cache(maxsize=None)
+def json_schema_of(schema: Type[BaseModel]) -> dict:
+    """
+    Get a schema class's JSON schema, generated once per class.
+
+    model_json_schema() rebuilds the dict on every call; callers share this
+    one, so treat it as read-only.
+    """
+    return schema.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def json_schema_text(schema: Type[BaseModel]) -> str:
+    """Compact JSON text of json_schema_of(schema), for embedding in prompts."""
+    return json.dumps(json_schema_of(schema), separators=(",", ":"))
+
+
+def cacheable_system_message(content: str, model: str) -> SystemMessage:
+    """
+    Build a system message that providers can serve from their prompt-prefix cache.
+
+    OpenAI-style backends cache identical prefixes automatically; Anthropic
+    models behind OpenRouter need an explicit cache_control breakpoint.
+
+    Args:
+        content: Static system prompt (keep it byte-identical across calls)
+        model: OpenRouter model name
+
+    Returns:
+        SystemMessage, with a cache_control breakpoint for Anthropic models
+    """
+    if model.startswith("anthropic/"):
+        return SystemMessage(content=[
+            {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}},
+        ])
+    return SystemMessage(content=content)
+
+
+def cacheable_human_message(prefix: str, content: str, model: str) -> HumanMessage:
+    """
+    Build a user message whose leading part providers can serve from their prompt-prefix cache.
+
+    Put context that repeats across calls (reference material) in `prefix` and
+    the per-call part in `content`. Anthropic models get a cache_control
+    breakpoint after the prefix; other backends get the plain concatenation,
+    which their automatic prefix caching already covers.
+
+    Args:
+        prefix: Repeated leading text (keep it byte-identical across calls)
+        content: Per-call remainder of the message
+        model: OpenRouter model name
+
+    Returns:
+        HumanMessage, with a cache_control breakpoint for Anthropic models
+    """
+    if not prefix:
+        return HumanMessage(content=content)
+    if model.startswith("anthropic/"):
+        return HumanMessage(content=[
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": content},
+        ])
+    return HumanMessage(content=prefix + content)
+
+
+PARSER_SYSTEM_PROMPT = """You convert a draft into JSON matching the given schema.
+Copy the draft's content faithfully: do not add, drop, summarize or rewrite anything.
+Use the schema's field names and fill each field from the draft."""
+
+
 class BaseStoryAgent(ABC):
     """Base class for all story builder agents."""
 
+    # Serve invoke_structured from the content-addressed LLM cache (src.llm_cache).
+    # Off by default: agents sampled repeatedly on the same prompt (juries,
+    # proposals) need fresh responses.
+    cache_structured_responses = False
+
+    # Route invoke_structured through invoke_two_stage (when TWO_STAGE_STRUCTURED
+    # is on). Meant for creators with large nested schemas, where forcing the
+    # schema on the creative call is slow and error-prone.
+    two_stage_structured = False
+
     def __init__(self, model: str = DEFAULT_MODEL, temperature: float = 0.7):
         self.model_name = model
         self.temperature = temperature
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
-        )
+        self.llm = get_llm(model, temperature)
 
     @property
     @abstractmethod
@@ -56,7 +214,7 @@ class BaseStoryAgent(ABC):
             The LLM's response content
         """
         messages = [
-            SystemMessage(content=self.system_prompt),
+            cacheable_system_message(self.system_prompt, self.model_name),
             HumanMessage(content=user_prompt),
         ]
         response = self.llm.invoke(messages)
@@ -79,7 +237,7 @@ class BaseStoryAgent(ABC):
         return self.invoke(user_prompt + json_instruction)
 
     def invoke_structured(self, user_prompt: str, schema: Type[T],
-                           max_tokens: int = 2000) -> T:
+                           max_tokens: int = 2000, cacheable_prefix: str = "") -> T:
         """
         Invoke LLM with structured output enforcement via Pydantic schema.
 
@@ -90,15 +248,86 @@ class BaseStoryAgent(ABC):
             user_prompt: The prompt to send
             schema: Pydantic model class to enforce
             max_tokens: Maximum completion tokens (prevents hitting model limits)
+            cacheable_prefix: Optional text sent ahead of the prompt and marked
+                for prompt caching (see cacheable_human_message)
 
         Returns:
             Parsed Pydantic model instance
         """
-        structured_llm = self.llm.with_structured_output(schema)
-        # Bind max_tokens to prevent hitting completion token limits
-        limited_llm = structured_llm.bind(max_tokens=max_tokens)
+        # Shared per schema; max_tokens is bound to prevent hitting completion token limits
+        limited_llm = get_structured_llm(self.model_name, self.temperature, schema, max_tokens)
         messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=user_prompt),
+            cacheable_system_message(self.system_prompt, self.model_name),
+            cacheable_human_message(cacheable_prefix, user_prompt, self.model_name),
         ]
-        return limited_llm.invoke(messages)
+        two_stage = self.two_stage_structured and TWO_STAGE_STRUCTURED
+        if two_stage:
+            call = lambda: self.invoke_two_stage(messages, schema, max_tokens)
+        else:
+            call = lambda: limited_llm.invoke(messages)
+
+        if not self.cache_structured_responses:
+            return call()
+
+        return cached_structured_call(
+            schema,
+            call,
+            model=self.model_name,
+            temperature=self.temperature,
+            system=self.system_prompt,
+            user=cacheable_prefix + user_prompt,
+            max_tokens=max_tokens,
+            # Two-stage responses differ from single-call ones (single-call
+            # keys are left as they were)
+            **({"two_stage": True, "parsing_model": PARSING_MODEL} if two_stage else {}),
+        )
+
+    def invoke_two_stage(self, messages: list, schema: Type[T], max_tokens: int = 2000) -> T:
+        """
+        Two-stage structured output: free-form draft, then schema extraction.
+
+        Stage 1 runs this agent's model with no response format. Stage 2 has
+        PARSING_MODEL (at temperature 0) fill the schema from the draft.
+
+        Args:
+            messages: System + user messages for the draft
+            schema: Pydantic model class to extract into
+            max_tokens: Maximum completion tokens for each stage
+
+        Returns:
+            Parsed Pydantic model instance
+        """
+        schema_json = json_schema_text(schema)
+        draft = self.llm.bind(max_tokens=max_tokens).invoke(messages + [HumanMessage(
+            content=f"Write your complete answer as plain text covering every field of this schema:\n{schema_json}"
+        )]).content
+
+        parser = get_structured_llm(PARSING_MODEL, 0.0, schema, max_tokens)
+        return parser.invoke([
+            cacheable_system_message(PARSER_SYSTEM_PROMPT, PARSING_MODEL),
+            HumanMessage(content=f"Extract JSON matching this schema from the draft below.\n\n## DRAFT:\n{draft}"),
+        ])
+
+    def invoke_structured_batch(self, user_prompts: list[str], schema: Type[T],
+                                max_tokens: int = 2000,
+                                max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS) -> list:
+        """
+        Invoke invoke_structured's call for many independent prompts in one batched submission.
+
+        Args:
+            user_prompts: The prompts to send
+            schema: Pydantic model class to enforce
+            max_tokens: Maximum completion tokens per response
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            List aligned with user_prompts: parsed model instance, or the
+            Exception raised for that prompt
+        """
+        limited_llm = get_structured_llm(self.model_name, self.temperature, schema, max_tokens)
+        system = cacheable_system_message(self.system_prompt, self.model_name)
+        return limited_llm.batch(
+            [[system, HumanMessage(content=prompt)] for prompt in user_prompts],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True,
+        )
@@ -0,0 +1,339 @@
+"""
+Codex Index - Name/role lookup tables built once per codex.
+
+Prompt agents look up characters and locations by name or story role many
+times per scene. Scanning codex["story"] lists on every call (and rebuilding
+the @tool closures and ReAct graphs per agent instance) adds up across a
+novel, so the lookup tables, tool lists and agents are built once per codex
+and shared.
+
+Usage:
+    index = get_codex_index(codex)
+    char = index.find_character("Yara Ridgewell")
+    invalidate_codex_index(codex)  # after editing entries in place
+    tools = get_codex_tools(codex, create_codex_tools)
+    agent = get_codex_memo(codex, (create_react_agent, Schema, model, temp), build_agent)
+"""
+
+import difflib
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Hashable, Optional, TypeVar
+
+
+# Fuzzy fallback threshold (difflib ratio on normalized, token-sorted names)
+FUZZY_MATCH_CUTOFF = 0.85
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def name_key(name: str) -> str:
+    """Normalize a name for fuzzy matching: lowercase, punctuation dropped, tokens sorted."""
+    return " ".join(sorted(_NON_ALNUM.sub(" ", name.lower()).split()))
+
+
+@lru_cache(maxsize=256)
+def compile_name_pattern(character_names: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Compile one whole-word, case-insensitive alternation over a set of character names.
+
+    Cached on the names tuple, so a scene's or shot's pattern is built once and
+    reused across revision cycles and critique requests.
+
+    Returns:
+        Compiled pattern, or None if there are no names to check
+    """
+    names = sorted({name.strip() for name in character_names if name.strip()}, key=len, reverse=True)
+    if not names:
+        return None
+    # Longest first, so "Yara Ridgewell" is reported rather than "Yara"
+    return re.compile(r"\b(?:" + "|".join(re.escape(name) for name in names) + r")\b", re.IGNORECASE)
+
+
+@dataclass
+class CodexIndex:
+    """Lookup tables over a codex's characters and locations."""
+    characters: list
+    locations: list
+    characters_by_name: dict = field(default_factory=dict)
+    characters_by_role: dict = field(default_factory=dict)
+    locations_by_name: dict = field(default_factory=dict)
+    character_names: list = field(default_factory=list)  # (name_lower, char) for partial matches
+    location_names: list = field(default_factory=list)  # (name_lower, loc) for partial matches
+    character_keys: dict = field(default_factory=dict)  # name_key -> char for fuzzy matches
+    location_keys: dict = field(default_factory=dict)  # name_key -> loc for fuzzy matches
+    tools: dict = field(default_factory=dict)  # tool factory -> tool list
+    memo: dict = field(default_factory=dict)  # derived per-codex values (e.g. prompt context blocks)
+    resolved: dict = field(default_factory=dict)  # (kind, query_lower) -> partial/fuzzy lookup result
+    sizes: tuple = (0, 0)  # (len(characters), len(locations)) when built
+    fingerprint: str = ""  # sha256 of characters + locations, for cache keys
+
+    @classmethod
+    def from_codex(cls, codex: dict) -> "CodexIndex":
+        """Build the index from codex["story"] characters and locations."""
+        story = codex.get("story", {})
+        index = cls(
+            characters=story.get("characters", []),
+            locations=story.get("locations", []),
+        )
+        index.sizes = (len(index.characters), len(index.locations))
+        index.fingerprint = _content_fingerprint(index.characters, index.locations)
+
+        for char in index.characters:
+            name_lower = char.get("name", "").lower().strip()
+            index.character_names.append((name_lower, char))
+            index.characters_by_name.setdefault(name_lower, char)
+            index.character_keys.setdefault(name_key(name_lower), char)
+            # First character per role wins, matching the original list scans
+            index.characters_by_role.setdefault(char.get("role_in_story", "").lower().strip(), char)
+
+        for loc in index.locations:
+            name_lower = loc.get("name", "").lower().strip()
+            index.location_names.append((name_lower, loc))
+            index.locations_by_name.setdefault(name_lower, loc)
+            index.location_keys.setdefault(name_key(name_lower), loc)
+
+        return index
+
+    def find_character(self, name: str) -> Optional[dict]:
+        """Find a character by exact name, falling back to partial match (case-insensitive)."""
+        name_lower = name.lower().strip()
+        char = self.characters_by_name.get(name_lower)
+        if char is not None:
+            return char
+
+        key = ("character", name_lower)
+        if key not in self.resolved:
+            self.resolved[key] = next(
+                (char for char_name, char in self.character_names if name_lower in char_name),
+                None,
+            ) or _fuzzy_lookup(name_lower, self.character_keys)
+        return self.resolved[key]
+
+    def match_character(self, description: str) -> Optional[dict]:
+        """Find a character by exact name, or where name and description contain one another."""
+        desc_lower = description.lower().strip()
+        char = self.characters_by_name.get(desc_lower)
+        if char is not None:
+            return char
+
+        key = ("match", desc_lower)
+        if key not in self.resolved:
+            self.resolved[key] = next(
+                (char for char_name, char in self.character_names
+                 if desc_lower in char_name or char_name in desc_lower),
+                None,
+            ) or _fuzzy_lookup(desc_lower, self.character_keys)
+        return self.resolved[key]
+
+    def find_character_by_role(self, role: str) -> Optional[dict]:
+        """Find the first character whose role_in_story matches (e.g. "the protagonist")."""
+        return self.characters_by_role.get(role.lower().replace("the ", "").strip())
+
+    def find_location(self, name: str) -> Optional[dict]:
+        """Find a location by exact name, falling back to partial match either way."""
+        name_lower = name.lower().strip()
+        loc = self.locations_by_name.get(name_lower)
+        if loc is not None:
+            return loc
+
+        key = ("location", name_lower)
+        if key not in self.resolved:
+            self.resolved[key] = next(
+                (loc for loc_name, loc in self.location_names
+                 if name_lower in loc_name or loc_name in name_lower),
+                None,
+            ) or _fuzzy_lookup(name_lower, self.location_keys)
+        return self.resolved[key]
+
+    def closest_character_names(self, name: str, n: int = 3) -> list[str]:
+        """Up to n codex character names closest to name (for not-found replies)."""
+        return _closest_names(name, self.character_names, n)
+
+    def closest_location_names(self, name: str, n: int = 3) -> list[str]:
+        """Up to n codex location names closest to name (for not-found replies)."""
+        return _closest_names(name, self.location_names, n)
+
+    def is_current(self, codex: dict) -> bool:
+        """
+        Check the codex still holds the same character/location lists, unresized.
+
+        Entries edited in place keep the lists' identity and length; callers
+        that do that must call invalidate_codex_index(codex) afterwards.
+        """
+        story = codex.get("story", {})
+        characters = story.get("characters", [])
+        locations = story.get("locations", [])
+        return (
+            characters is self.characters
+            and locations is self.locations
+            and (len(characters), len(locations)) == self.sizes
+        )
+
+
+def _content_fingerprint(characters: list, locations: list) -> str:
+    """sha256 of the characters and locations, for cache keys."""
+    return hashlib.sha256(json.dumps(
+        {"characters": characters, "locations": locations},
+        sort_keys=True, ensure_ascii=False, default=str,
+    ).encode("utf-8")).hexdigest()
+
+
+def _fuzzy_lookup(name: str, entries_by_key: dict) -> Optional[dict]:
+    """
+    Match a name against normalized keys, tolerating punctuation, word order and typos.
+
+    Exact normalized matches are an O(1) dict hit; otherwise the closest key
+    above FUZZY_MATCH_CUTOFF wins.
+    """
+    key = name_key(name)
+    if not key:
+        return None
+
+    entry = entries_by_key.get(key)
+    if entry is not None:
+        return entry
+
+    close = difflib.get_close_matches(key, entries_by_key.keys(), n=1, cutoff=FUZZY_MATCH_CUTOFF)
+    return entries_by_key[close[0]] if close else None
+
+
+def _closest_names(name: str, names: list, n: int) -> list[str]:
+    """Match a query against (name_lower, entry) pairs and return the entries' display names."""
+    by_lower = {name_lower: entry.get("name") for name_lower, entry in names}
+    close = difflib.get_close_matches(name.lower().strip(), by_lower.keys(), n=n, cutoff=0.3)
+    return [by_lower[match] for match in close]
+
+
+# =============================================================================
+# Per-codex cache
+# =============================================================================
+
+_MAX_CACHED_CODEXES = 8
+
+# id(codex) -> (codex, index). Holding the codex keeps its id from being reused.
+_index_cache: dict[int, tuple[dict, CodexIndex]] = {}
+
+_MAX_CACHED_LISTS = 32
+
+# id(list) -> (list, len(list), memo) for values derived from a bare codex list
+_list_memo_cache: dict[int, tuple[list, int, dict]] = {}
+
+
+def get_codex_index(codex: dict) -> CodexIndex:
+    """
+    Get the CodexIndex for a codex, building it on first use.
+
+    The index is rebuilt if the codex's character or location lists have been
+    replaced or resized since it was built, or after invalidate_codex_index.
+
+    Args:
+        codex: The full codex dictionary
+
+    Returns:
+        CodexIndex shared by all agents working on this codex
+    """
+    entry = _index_cache.get(id(codex))
+    if entry is not None and entry[0] is codex and entry[1].is_current(codex):
+        return entry[1]
+
+    if len(_index_cache) >= _MAX_CACHED_CODEXES:
+        _index_cache.clear()
+
+    index = CodexIndex.from_codex(codex)
+    _index_cache[id(codex)] = (codex, index)
+    return index
+
+
+def invalidate_codex_index(codex: dict) -> None:
+    """
+    Drop a codex's index, its tools and memoized values (including list memos).
+
+    Call after editing character or location entries in place, so the next
+    lookup (and the fingerprint in LLM cache keys) sees the new content.
+
+    Args:
+        codex: The full codex dictionary
+    """
+    entry = _index_cache.get(id(codex))
+    if entry is not None and entry[0] is codex:
+        del _index_cache[id(codex)]
+
+    story = codex.get("story", {})
+    for items in (story.get("characters"), story.get("locations")):
+        entry = _list_memo_cache.get(id(items))
+        if entry is not None and entry[0] is items:
+            del _list_memo_cache[id(items)]
+
+
+def get_codex_tools(codex: dict, factory: Callable[[dict], list]) -> list:
+    """
+    Get the tool list built by `factory` for a codex, building it on first use.
+
+    Args:
+        codex: The full codex dictionary
+        factory: A module's create_codex_tools function
+
+    Returns:
+        List of LangChain tools shared by all agents working on this codex
+    """
+    index = get_codex_index(codex)
+    if factory not in index.tools:
+        index.tools[factory] = factory(codex)
+    return index.tools[factory]
+
+
+T = TypeVar("T")
+
+
+def get_codex_memo(codex: dict, key: tuple, build: Callable[[], T]) -> T:
+    """
+    Get a value derived from a codex (e.g. a compiled ReAct agent), building it on first use.
+
+    Values live on the codex's index, so they are dropped when the codex's
+    character or location lists change or the index is invalidated.
+
+    Args:
+        codex: The full codex dictionary
+        key: Hashable key identifying the value (include everything it depends on)
+        build: Zero-argument function producing the value
+
+    Returns:
+        The memoized value shared by all agents working on this codex
+    """
+    memo = get_codex_index(codex).memo
+    if key not in memo:
+        memo[key] = build()
+    return memo[key]
+
+
+def get_codex_list_memo(items: list, key: Hashable, build: Callable[[], T]) -> T:
+    """
+    Get a value derived from one codex list (e.g. codex["story"]["characters"]), building it on first use.
+
+    For callers handed the character or location list rather than the codex.
+    Values are dropped when the list is replaced or resized, or when
+    invalidate_codex_index is called for the codex holding it.
+
+    Args:
+        items: A codex character or location list
+        key: Hashable key identifying the value (include everything it depends on)
+        build: Zero-argument function producing the value
+
+    Returns:
+        The memoized value shared by all callers working on this list
+    """
+    entry = _list_memo_cache.get(id(items))
+    if entry is None or entry[0] is not items or entry[1] != len(items):
+        if len(_list_memo_cache) >= _MAX_CACHED_LISTS:
+            _list_memo_cache.clear()
+        entry = (items, len(items), {})
+        _list_memo_cache[id(items)] = entry
+
+    memo = entry[2]
+    if key not in memo:
+        memo[key] = build()
+    return memo[key]
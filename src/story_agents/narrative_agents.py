@@ -6,17 +6,22 @@ Phase 3 Agents: Narrative Writing
 - ContinuityCriticAgent: Checks character/location consistency in prose
 """
 
-from src.story_agents.base_story_agent import BaseStoryAgent
+from src.story_agents.base_story_agent import BaseStoryAgent, get_llm
 from src.story_schemas import SceneProseSchema, CritiqueSchema
 
 
 class WriterAgent(BaseStoryAgent):
     """Writes narrative prose scene by scene with enforced structure."""
 
+    # Prose drafted freely, then parsed into SceneProseSchema
+    two_stage_structured = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Use slightly higher temperature for creative writing
-        self.llm.temperature = 0.8
+        # Use slightly higher temperature for creative writing (its own shared
+        # client; the 0.7 client is shared with other agents)
+        self.temperature = 0.8
+        self.llm = get_llm(self.model_name, self.temperature)
 
     @property
     def name(self) -> str:
@@ -13,6 +13,9 @@ from src.story_schemas import OutlineSchema, CritiqueSchema
 class OutlinerAgent(BaseStoryAgent):
     """Creates story outlines following 3-act structure."""
 
+    # Outline drafted freely, then parsed into OutlineSchema
+    two_stage_structured = True
+
     @property
     def name(self) -> str:
         return "OUTLINER"
@@ -1,30 +1,77 @@
 """
 Scene Image Prompt Agents - Generate one representative image prompt per scene.
 
-Uses LangGraph ReAct agents with tools to retrieve character and location descriptions
-from the codex, then generates hyper-detailed cinematic prompts without using
-character names (only physical descriptions, since the model doesn't know who is who).
+The composer is a LangGraph ReAct agent with tools to retrieve character and location
+descriptions from the codex; the critic receives the same codex data inline. Both
+produce hyper-detailed cinematic prompts without using character names (only physical
+descriptions, since the model doesn't know who is who).
 
 Key Features:
-- Uses `response_format` for guaranteed structured output
+- Uses `response_format` / `with_structured_output` for guaranteed structured output
 - Tools for retrieving character/location data from codex
 - Composer + Critic workflow with revision loop
 
 Workflow:
 1. SceneImageComposerAgent - Uses tools to fetch char/loc data, generates prompt
-2. SceneImageCriticAgent - Uses tools to validate prompts against codex data
+2. SceneImageCriticAgent - Validates prompts against codex data resolved up-front
 3. Composer revises based on critique
 """
 
 import json
-from typing import Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
 
-from src.story_schemas import SceneImagePromptSchema, SceneImageCritiqueSchema
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL
+from src.llm_cache import cached_instance, cached_structured_call, get_llm_cache, structured_cache_key
+from src.story_agents.base_story_agent import (
+    cacheable_system_message, get_llm, get_streaming_structured_llm, get_structured_llm,
+)
+from src.story_agents.codex_index import compile_name_pattern, get_codex_index, get_codex_memo, get_codex_tools
+from src.story_schemas import (
+    ComposedAndCritiquedSchema,
+    SceneImagePromptSchema,
+    SceneImageCritiqueSchema,
+)
+from src.config import DEFAULT_MODEL, MAX_CONCURRENT_LLM_REQUESTS
+
+
+# =============================================================================
+# Codex Data Helpers
+# =============================================================================
+
+def _character_profile(char: dict) -> dict:
+    """Extract the visual fields of a codex character used for image prompts."""
+    physical = char.get("physical", {})
+    return {
+        "id": char.get("id", ""),
+        "name": char.get("name"),
+        "gender": char.get("gender", ""),
+        "age": char.get("age", ""),
+        "height": physical.get("height", ""),
+        "build": physical.get("build", ""),
+        "hair_color": physical.get("hair_color", ""),
+        "eye_color": physical.get("eye_color", ""),
+        "distinguishing_features": physical.get("distinguishing_features", ""),
+        "clothing": char.get("clothing", ""),
+        "personality_traits": char.get("personality_traits", []),
+    }
+
+
+def _location_profile(loc: dict) -> dict:
+    """Extract the visual fields of a codex location used for image prompts."""
+    return {
+        "id": loc.get("id", ""),
+        "name": loc.get("name"),
+        "type": loc.get("type", ""),
+        "description": loc.get("description", ""),
+        "atmosphere": loc.get("atmosphere", ""),
+        "key_features": loc.get("key_features", []),
+        "sensory_details": loc.get("sensory_details", ""),
+    }
 
 
 # =============================================================================
@@ -41,8 +88,27 @@ def create_codex_tools(codex: dict) -> list:
     Returns:
         List of tool functions with codex data in closure
     """
-    characters = codex.get("story", {}).get("characters", [])
-    locations = codex.get("story", {}).get("locations", [])
+    index = get_codex_index(codex)
+    characters = index.characters
+    locations = index.locations
+
+    # Tool responses are static per codex, so serialize them once up front
+    # (keyed by id() of the codex entry; the index keeps the entries alive)
+    role_json = {
+        id(char): json.dumps({
+            "id": char.get("id", ""),
+            "name": char.get("name", ""),
+            "role_in_story": char.get("role_in_story", ""),
+            "gender": char.get("gender", ""),
+            "age": char.get("age", ""),
+        }, separators=(",", ":"))
+        for char in characters
+    }
+    char_json = {id(char): json.dumps(_character_profile(char), separators=(",", ":")) for char in characters}
+    loc_json = {id(loc): json.dumps(_location_profile(loc), separators=(",", ":")) for loc in locations}
+    available_roles = [c.get('role_in_story') for c in characters]
+    all_characters_text = f"Available characters: {[c.get('name', 'Unknown') for c in characters]}"
+    all_locations_text = f"Available locations: {[l.get('name', 'Unknown') for l in locations]}"
 
     @tool
     def lookup_character_by_role(role: str) -> str:
@@ -56,20 +122,11 @@ def create_codex_tools(codex: dict) -> list:
         Returns:
             Character name, ID, and basic info if found.
         """
-        role_lower = role.lower().replace("the ", "").strip()
-
-        for char in characters:
-            char_role = char.get("role_in_story", "").lower()
-            if char_role == role_lower:
-                return json.dumps({
-                    "id": char.get("id", ""),
-                    "name": char.get("name", ""),
-                    "role_in_story": char.get("role_in_story", ""),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                }, indent=2)
+        char = index.find_character_by_role(role)
+        if char:
+            return role_json[id(char)]
 
-        return f"No character found with role '{role}'. Available roles: {[c.get('role_in_story') for c in characters]}"
+        return f"No character found with role '{role}'. Available roles: {available_roles}"
 
     @tool
     def get_character_description(character_name: str) -> str:
@@ -81,46 +138,15 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             character_name: The character's name (case-insensitive search)
         """
-        name_lower = character_name.lower().strip()
-
-        for char in characters:
-            if char.get("name", "").lower().strip() == name_lower:
-                physical = char.get("physical", {})
-                result = {
-                    "id": char.get("id", ""),
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        # Try partial match
-        for char in characters:
-            if name_lower in char.get("name", "").lower():
-                physical = char.get("physical", {})
-                result = {
-                    "id": char.get("id", ""),
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Character '{character_name}' not found in codex. Available characters: {[c.get('name') for c in characters]}"
+        char = index.find_character(character_name)
+        if char:
+            return char_json[id(char)]
+
+        # Closest names only; list_all_characters has the full cast
+        return (
+            f"Character '{character_name}' not found in codex. "
+            f"Closest matches: {index.closest_character_names(character_name)}"
+        )
 
     @tool
     def get_location_description(location_name: str) -> str:
@@ -132,23 +158,14 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             location_name: The location name (case-insensitive, partial match)
         """
-        name_lower = location_name.lower().strip()
-
-        for loc in locations:
-            loc_name = loc.get("name", "").lower().strip()
-            if loc_name == name_lower or name_lower in loc_name or loc_name in name_lower:
-                result = {
-                    "id": loc.get("id", ""),
-                    "name": loc.get("name"),
-                    "type": loc.get("type", ""),
-                    "description": loc.get("description", ""),
-                    "atmosphere": loc.get("atmosphere", ""),
-                    "key_features": loc.get("key_features", []),
-                    "sensory_details": loc.get("sensory_details", ""),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Location '{location_name}' not found in codex. Available locations: {[l.get('name') for l in locations]}"
+        loc = index.find_location(location_name)
+        if loc:
+            return loc_json[id(loc)]
+
+        return (
+            f"Location '{location_name}' not found in codex. "
+            f"Closest matches: {index.closest_location_names(location_name)}"
+        )
 
     @tool
     def list_all_characters() -> str:
@@ -156,8 +173,7 @@ def create_codex_tools(codex: dict) -> list:
         List all character names in the codex.
         Use this to see what characters are available before fetching details.
         """
-        names = [c.get("name", "Unknown") for c in characters]
-        return f"Available characters: {names}"
+        return all_characters_text
 
     @tool
     def list_all_locations() -> str:
@@ -165,8 +181,7 @@ def create_codex_tools(codex: dict) -> list:
         List all location names in the codex.
         Use this to see what locations are available before fetching details.
         """
-        names = [l.get("name", "Unknown") for l in locations]
-        return f"Available locations: {names}"
+        return all_locations_text
 
     return [lookup_character_by_role, get_character_description, get_location_description, list_all_characters, list_all_locations]
 
@@ -241,7 +256,7 @@ CRITIC_SYSTEM_PROMPT = """You are a CRITICAL reviewer of AI scene image prompts.
 
 Your job is to validate prompts against the original codex data and ensure quality standards.
 
-## USE THE TOOLS to verify:
+## USE THE CODEX DATA provided with each prompt to verify:
 1. Character descriptions match their codex profiles
 2. Location details match the codex location data
 3. Physical descriptions are accurate (hair color, eye color, distinguishing features)
@@ -280,8 +295,7 @@ Your job is to validate prompts against the original codex data and ensure quali
 - Do visual descriptions match the style aesthetic?
 
 ## DECISION RULES:
-- If ANY score is below 7, mark needs_revision = true
-- If no_names_score < 10, DEFINITELY needs_revision = true
+- Any score below 7 (or no_names_score below 10) sends the prompt back for revision
 - Provide SPECIFIC suggestions referencing codex data"""
 
 
@@ -299,22 +313,44 @@ class SceneImageComposerAgent:
         self.temperature = temperature
         self.codex = codex
 
-        # Create LLM
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
+
+        # Tools are built once per codex and shared across agent instances
+        self.tools = get_codex_tools(codex, create_codex_tools)
+
+        # Compiled ReAct graph (tools + response_format for guaranteed structured
+        # output), built once per (codex, model, temperature) and shared
+        self.agent = get_codex_memo(
+            codex,
+            (create_react_agent, SceneImagePromptSchema, model, temperature),
+            lambda: create_react_agent(
+                model=self.llm,
+                tools=self.tools,
+                response_format=SceneImagePromptSchema,
+            ),
         )
 
-        # Create tools with codex in closure
-        self.tools = create_codex_tools(codex)
-
-        # Create ReAct agent with tools AND response_format for guaranteed structured output
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=SceneImagePromptSchema,
+    def _invoke(self, user_prompt: str) -> SceneImagePromptSchema:
+        """Run the ReAct agent, reusing cached responses for identical requests."""
+        def call():
+            # Run the ReAct agent - structured_response is guaranteed via response_format
+            result = self.agent.invoke({
+                "messages": [
+                    cacheable_system_message(COMPOSER_SYSTEM_PROMPT, self.model_name),
+                    HumanMessage(content=user_prompt),
+                ]
+            })
+            return result["structured_response"]
+
+        return cached_structured_call(
+            SceneImagePromptSchema,
+            call,
+            model=self.model_name,
+            temperature=self.temperature,
+            system=COMPOSER_SYSTEM_PROMPT,
+            user=user_prompt,
+            codex=get_codex_index(self.codex).fingerprint,
         )
 
     def create_scene_prompt(
@@ -382,16 +418,82 @@ CRITICAL RULES:
 - START with style prefix, END with style suffix (if provided)
 - Include all characters present in the scene"""
 
-        # Run the ReAct agent - structured_response is guaranteed via response_format
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": COMPOSER_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ]
-        })
+        return self._invoke(user_prompt)
+
+    def compose_and_selfcritique(
+        self,
+        scene_data: dict,
+        act_number: int,
+        visual_style: dict = None
+    ) -> ComposedAndCritiquedSchema:
+        """
+        Generate a scene prompt and score it against the critic's criteria in one call.
+
+        Codex data is embedded in the request instead of fetched with tools, so
+        this is a single structured-output call rather than a ReAct loop.
+
+        Args:
+            scene_data: Scene dict with location, characters, text, paragraphs
+            act_number: Act number for context
+            visual_style: Visual style dict with name, prefix, suffix
+
+        Returns:
+            ComposedAndCritiquedSchema with the prompt and its self-critique
+        """
+        scene_json = json.dumps({
+            "scene_number": scene_data.get("scene_number"),
+            "location": scene_data.get("location"),
+            "characters": scene_data.get("characters", []),
+            "text": scene_data.get("text", "")[:1000],  # Truncate long prose
+        }, indent=2)
+
+        style_info = ""
+        if visual_style:
+            style_info = f"""
+## VISUAL STYLE: {visual_style.get("name", "Anime")}
+STYLE PREFIX (start the prompt with this): {visual_style.get("prefix", "")}
+STYLE SUFFIX (end the prompt with this): {visual_style.get("suffix", "")}
+"""
+
+        user_prompt = f"""Generate ONE representative image prompt for this scene, then critique it.
 
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+## SCENE DATA:
+Act {act_number}, Scene {scene_data.get("scene_number")}
+
+{scene_json}
+
+{_scene_codex_data(scene_data, self.codex)}{style_info}
+## STEP 1 - COMPOSE (field: prompt)
+Follow the prompt structure and rules from your instructions, using the CODEX DATA
+above in place of the tools. Fill location_id, characters_in_scene (actual names)
+and character_ids from the CODEX DATA.
+
+## STEP 2 - SELF-CRITIQUE (field: critique)
+Score your prompt strictly (1-10 each) as an independent reviewer would:
+1. CHARACTER_ACCURACY: Do descriptions match the codex profiles?
+2. LOCATION_ACCURACY: Does the setting match the codex location?
+3. NO_NAMES: 10 if NO character names appear in the prompt text, 1 if ANY do
+4. VISUAL_DETAIL: Enough detail for image generation?
+5. COMPOSITION: Clear framing and focal point?
+
+Do not inflate scores."""
+
+        # Shared runnable per (model, temperature); room for a 500-word prompt plus its critique
+        structured_llm = get_structured_llm(
+            self.model_name, self.temperature, ComposedAndCritiquedSchema, max_tokens=3000
+        )
+        return cached_structured_call(
+            ComposedAndCritiquedSchema,
+            lambda: structured_llm.invoke([
+                cacheable_system_message(COMPOSER_SYSTEM_PROMPT, self.model_name),
+                HumanMessage(content=user_prompt),
+            ]),
+            model=self.model_name,
+            temperature=self.temperature,
+            system=COMPOSER_SYSTEM_PROMPT,
+            user=user_prompt,
+            max_tokens=3000,
+        )
 
     def revise_scene_prompt(
         self,
@@ -432,11 +534,11 @@ REMINDER: The prompt must END with: {style_suffix}
 {original.prompt}
 
 ## CRITIC SCORES:
-- Character Accuracy: {critique.character_accuracy_score}/10
-- Location Accuracy: {critique.location_accuracy_score}/10
+- Character Accuracy: {critique.character_accuracy_score or "?"}/10
+- Location Accuracy: {critique.location_accuracy_score or "?"}/10
 - No Names (CRITICAL): {critique.no_names_score}/10
-- Visual Detail: {critique.visual_detail_score}/10
-- Composition: {critique.composition_score}/10
+- Visual Detail: {critique.visual_detail_score or "?"}/10
+- Composition: {critique.composition_score or "?"}/10
 
 ## SUGGESTIONS FOR IMPROVEMENT:
 {suggestions}
@@ -453,71 +555,43 @@ CRITICAL: Ensure style prefix at START and style suffix at END of the prompt.
 
 Maintain 300-500 words, single paragraph."""
 
-        # Run agent with tools for revision - structured_response guaranteed
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": COMPOSER_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-        })
-
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+        return self._invoke(prompt)
 
 
 # =============================================================================
-# Scene Image Critic Agent (with Tools)
+# Scene Image Critic Agent (Codex Data Inline)
 # =============================================================================
 
 class SceneImageCriticAgent:
     """
     Critiques scene image prompts for accuracy against codex data.
 
-    Uses LangGraph ReAct agent with:
-    - Tools for character/location verification from codex
-    - response_format for guaranteed structured output (SceneImageCritiqueSchema)
+    The codex entries for the scene are resolved in Python and embedded in the
+    prompt, so a single structured-output call (SceneImageCritiqueSchema)
+    replaces the ReAct tool loop. Scoring against a rubric runs at temperature 0,
+    so identical prompts get identical (and cacheable) critiques.
     """
 
-    def __init__(self, codex: dict, model: str = DEFAULT_MODEL, temperature: float = 0.3):
+    def __init__(self, codex: dict, model: str = DEFAULT_MODEL, temperature: float = 0.0):
         self.model_name = model
         self.temperature = temperature
         self.codex = codex
 
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
-        )
-
-        self.tools = create_codex_tools(codex)
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
 
-        # Create ReAct agent with tools AND response_format for guaranteed structured output
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=SceneImageCritiqueSchema,
-        )
+        # Shared runnables per (model, temperature); the streaming one yields
+        # partial dicts (used for early abort)
+        self.structured_llm = get_structured_llm(model, temperature, SceneImageCritiqueSchema)
+        self.stream_llm = get_streaming_structured_llm(model, temperature, SceneImageCritiqueSchema)
 
-    def critique(
+    def _critique_messages(
         self,
         scene_prompt: SceneImagePromptSchema,
         scene_data: dict,
         visual_style: dict = None
-    ) -> SceneImageCritiqueSchema:
-        """
-        Evaluate scene prompt for accuracy and quality.
-
-        Uses tools to verify descriptions match codex data with guaranteed structured output.
-
-        Args:
-            scene_prompt: The prompt to critique
-            scene_data: Original scene data for reference
-            visual_style: Visual style dict with name, prefix, suffix
-
-        Returns:
-            SceneImageCritiqueSchema with scores and suggestions
-        """
+    ) -> list:
+        """Build the system/user messages for one critique request."""
         # Extract style requirements
         style_check = ""
         if visual_style:
@@ -538,20 +612,19 @@ CHECK STYLE ADHERENCE:
 
         characters = scene_data.get("characters", [])
 
-        prompt = f"""CRITICALLY EVALUATE this scene image prompt.
+        # Host-side name check, passed to the critic as a hint
+        character_names, _ = _map_roles_to_characters(characters, self.codex)
+        name_pattern = compile_name_pattern(tuple(character_names))
+        no_names_prescreen = name_pattern is None or not name_pattern.search(scene_prompt.prompt)
 
-## SCENE IMAGE PROMPT:
-{scene_prompt.prompt}
+        # Ordered from most to least shared (static instructions, novel-wide
+        # style, scene codex data, the prompt itself) so consecutive critiques
+        # share the longest possible prefix for provider prompt caching
+        prompt = f"""CRITICALLY EVALUATE the scene image prompt at the end of this message.
 
-## SCENE DATA:
-Location: {scene_data.get("location")}
-Characters: {characters}
-{style_check}
 ## INSTRUCTIONS:
 
-1. FIRST: Use get_character_description tool to get ACTUAL character descriptions from codex for each character: {characters}
-2. SECOND: Use get_location_description tool to get ACTUAL location description from codex
-3. THIRD: Compare the prompt against the codex data and score
+Compare the prompt against the AUTHORITATIVE CODEX DATA below and score.
 
 SCORING CRITERIA (1-10 each):
 
@@ -561,23 +634,149 @@ SCORING CRITERIA (1-10 each):
 4. VISUAL_DETAIL: Is there enough detail for image generation?
 5. COMPOSITION: Is framing clear with good focal point?
 
-CRITICAL: Check if character names like {characters} appear in the prompt!
 If names are present, no_names_score MUST be 1!
 
 If visual style is provided, check style adherence and include in suggestions if missing.
 
-Set needs_revision=true if ANY score is below 7."""
+{style_check}
+{_scene_codex_data(scene_data, self.codex)}
+## SCENE DATA:
+Location: {scene_data.get("location")}
+Characters: {characters}
 
-        # Run agent - structured_response is guaranteed via response_format
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": CRITIC_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-        })
+CRITICAL: Check if character names like {characters} appear in the prompt!
+no_names_prescreen: {str(no_names_prescreen).lower()} (exact-match check of codex names {character_names}; false means a name was found)
 
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+## SCENE IMAGE PROMPT:
+{scene_prompt.prompt}"""
+
+        return [
+            cacheable_system_message(CRITIC_SYSTEM_PROMPT, self.model_name),
+            HumanMessage(content=prompt),
+        ]
+
+    def critique(
+        self,
+        scene_prompt: SceneImagePromptSchema,
+        scene_data: dict,
+        visual_style: dict = None,
+        early_abort: bool = False,
+    ) -> SceneImageCritiqueSchema:
+        """
+        Evaluate scene prompt for accuracy and quality.
+
+        Compares the prompt against codex data embedded in the request.
+
+        Args:
+            scene_prompt: The prompt to critique
+            scene_data: Original scene data for reference
+            visual_style: Visual style dict with name, prefix, suffix
+            early_abort: Stream the critique and stop as soon as no_names_score
+                fails; the returned critique then only has the scores seen so far
+
+        Returns:
+            SceneImageCritiqueSchema with scores and suggestions
+        """
+        messages = self._critique_messages(scene_prompt, scene_data, visual_style)
+        if early_abort:
+            cache = get_llm_cache()
+            key = structured_cache_key(SceneImageCritiqueSchema, **self._cache_key_parts(messages))
+            hit = cached_instance(cache, key, SceneImageCritiqueSchema)
+            if hit is not None:
+                return hit
+
+            critique, complete = self._critique_streaming(messages)
+            if complete:
+                cache.set(key, critique.model_dump())
+            return critique
+
+        return cached_structured_call(
+            SceneImageCritiqueSchema,
+            lambda: self.structured_llm.invoke(messages),
+            **self._cache_key_parts(messages),
+        )
+
+    def _critique_streaming(self, messages: list) -> tuple[SceneImageCritiqueSchema, bool]:
+        """
+        Stream a critique, stopping early once no_names_score is known to fail.
+
+        Returns:
+            (critique, complete) - complete is False if the stream was cut short
+        """
+        partial = {}
+        stream = self.stream_llm.stream(messages)
+        try:
+            for partial in stream:
+                # A streamed value is only final once the next key has started
+                # (e.g. a "1" may still become "10")
+                settled = list(partial)[:-1]
+                no_names = partial.get("no_names_score")
+                if "no_names_score" in settled and isinstance(no_names, int) and no_names < 10:
+                    return SceneImageCritiqueSchema.model_construct(
+                        **{field: partial.get(field) if field in settled else None for field in _SCORE_FIELDS},
+                        suggestions=[
+                            f"Character names appear in the prompt (no_names_score={no_names}). "
+                            "Replace every name with the character's physical description."
+                        ],
+                    ), False
+        finally:
+            stream.close()
+
+        return SceneImageCritiqueSchema.model_validate(partial), True
+
+    def _cache_key_parts(self, messages: list) -> dict:
+        """Cache key parts; the codex data is embedded in the messages themselves."""
+        return {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "messages": [m.content for m in messages],
+        }
+
+    def critique_batch(
+        self,
+        items: list[tuple[SceneImagePromptSchema, dict]],
+        visual_style: dict = None,
+        max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    ) -> list:
+        """
+        Evaluate many scene prompts in one batched submission.
+
+        Args:
+            items: (scene_prompt, scene_data) pairs to critique
+            visual_style: Visual style dict with name, prefix, suffix
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            List aligned with items: SceneImageCritiqueSchema, or the
+            Exception raised for that item
+        """
+        cache = get_llm_cache()
+        message_lists = [self._critique_messages(p, d, visual_style) for p, d in items]
+        keys = [
+            structured_cache_key(SceneImageCritiqueSchema, **self._cache_key_parts(m))
+            for m in message_lists
+        ]
+
+        results = []
+        misses = []
+        for i, key in enumerate(keys):
+            hit = cached_instance(cache, key, SceneImageCritiqueSchema)
+            results.append(hit)
+            if hit is None:
+                misses.append(i)
+
+        if misses:
+            responses = self.structured_llm.batch(
+                [message_lists[i] for i in misses],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+            for i, response in zip(misses, responses):
+                results[i] = response
+                if not isinstance(response, Exception):
+                    cache.set(keys[i], response.model_dump())
+
+        return results
 
 
 # =============================================================================
@@ -593,66 +792,63 @@ def _map_roles_to_characters(role_descriptions: list[str], codex: dict) -> tuple
     Returns:
         tuple of (character_names, character_ids)
     """
-    characters = codex.get("story", {}).get("characters", [])
+    index = get_codex_index(codex)
     names = []
     ids = []
 
     for desc in role_descriptions:
         desc_lower = desc.lower().strip()
-        matched = False
+        char = None
 
         # Try matching by role_in_story
         if "protagonist" in desc_lower:
-            for char in characters:
-                if char.get("role_in_story", "").lower() == "protagonist":
-                    names.append(char.get("name", desc))
-                    if char.get("id"):
-                        ids.append(char["id"])
-                    matched = True
-                    break
+            char = index.characters_by_role.get("protagonist")
         elif "antagonist" in desc_lower:
-            for char in characters:
-                if char.get("role_in_story", "").lower() == "antagonist":
-                    names.append(char.get("name", desc))
-                    if char.get("id"):
-                        ids.append(char["id"])
-                    matched = True
-                    break
+            char = index.characters_by_role.get("antagonist")
         elif "mentor" in desc_lower or "elder" in desc_lower or "wise" in desc_lower:
-            for char in characters:
-                if char.get("role_in_story", "").lower() == "supporting":
-                    names.append(char.get("name", desc))
-                    if char.get("id"):
-                        ids.append(char["id"])
-                    matched = True
-                    break
+            char = index.characters_by_role.get("supporting")
 
         # Try matching by actual name (for cases where scene has real names)
-        if not matched:
-            for char in characters:
-                char_name = char.get("name", "").lower()
-                if desc_lower == char_name or desc_lower in char_name or char_name in desc_lower:
-                    names.append(char.get("name", desc))
-                    if char.get("id"):
-                        ids.append(char["id"])
-                    matched = True
-                    break
+        if char is None:
+            char = index.match_character(desc_lower)
 
         # Skip if no match - don't keep generic descriptions like "community members"
         # This keeps names and ids lists synchronized and avoids generic text in character data
+        if char is not None:
+            names.append(char.get("name", desc))
+            if char.get("id"):
+                ids.append(char["id"])
 
     return names, ids
 
 
+def _scene_codex_data(scene_data: dict, codex: dict) -> str:
+    """Resolve a scene's characters and location to their codex profiles, formatted for a prompt."""
+    index = get_codex_index(codex)
+    character_names, _ = _map_roles_to_characters(scene_data.get("characters", []), codex)
+    character_profiles = [
+        _character_profile(index.characters_by_name[name.lower().strip()])
+        for name in character_names
+        if name.lower().strip() in index.characters_by_name
+    ]
+
+    location = index.find_location(scene_data.get("location", ""))
+    location_profile = _location_profile(location) if location else "Not found in codex."
+
+    return f"""## AUTHORITATIVE CODEX DATA:
+
+### Characters:
+{json.dumps(character_profiles, indent=2) if character_profiles else "No matching characters in codex."}
+
+### Location:
+{json.dumps(location_profile, indent=2)}
+"""
+
+
 def _lookup_location_id(location_name: str, codex: dict) -> str:
     """Look up location ID from codex by name (case-insensitive)."""
-    locations = codex.get("story", {}).get("locations", [])
-    name_lower = location_name.lower().strip()
-    for loc in locations:
-        loc_name = loc.get("name", "").lower().strip()
-        if loc_name == name_lower or name_lower in loc_name or loc_name in name_lower:
-            return loc.get("id", "")
-    return ""
+    loc = get_codex_index(codex).find_location(location_name)
+    return loc.get("id", "") if loc else ""
 
 
 def generate_scene_image_prompt(
@@ -662,11 +858,16 @@ def generate_scene_image_prompt(
     visual_style: dict = None,
     model: str = DEFAULT_MODEL,
     max_revisions: int = 2,
+    speculative_revision: bool = False,
+    self_critique_first_pass: bool = False,
+    early_abort_critique: bool = False,
+    log: Callable[[str], None] = print,
 ) -> dict:
     """
     Generate a representative image prompt for a scene using composer + critic workflow.
 
-    Uses ReAct agents with tools and guaranteed structured output via response_format.
+    The composer is a ReAct agent with codex tools; the critic gets codex data inline.
+    Both return guaranteed structured output.
 
     Args:
         scene_data: Scene dict with location, characters, text, paragraphs
@@ -675,6 +876,13 @@ def generate_scene_image_prompt(
         visual_style: Visual style dict with name, prefix, suffix, description
         model: LLM model to use
         max_revisions: Maximum revision cycles (default 2)
+        speculative_revision: From the second cycle on, revise against the previous
+            critique while the next critique runs (trades tokens for latency)
+        self_critique_first_pass: Compose and self-critique in one call; fall back to
+            the critic loop only if the self-critique asks for revision
+        early_abort_critique: Stream non-final critiques and cut them off as soon as
+            no_names_score fails, going straight to revision
+        log: Progress output (default print; concurrent callers pass a per-scene buffer)
 
     Returns:
         Dict with:
@@ -691,57 +899,281 @@ def generate_scene_image_prompt(
         - critique_history: All critiques for metadata
     """
     composer = SceneImageComposerAgent(codex=codex, model=model)
-    critic = SceneImageCriticAgent(codex=codex, model=model, temperature=0.3)
+    critic = SceneImageCriticAgent(codex=codex, model=model, temperature=0.0)
 
     scene_num = scene_data.get("scene_number", "?")
     location = scene_data.get("location", "Unknown")
-    print(f"      Creating scene image prompt for scene {scene_num} at {location}...")
-
-    # Initial prompt generation (guaranteed structured output)
-    current = composer.create_scene_prompt(scene_data, act_number, visual_style)
+    log(f"      Creating scene image prompt for scene {scene_num} at {location}...")
 
     critique_history = []
     revision_count = 0
+    last_critique = None
+    character_names, _ = _map_roles_to_characters(scene_data.get("characters", []), codex)
+    name_pattern = compile_name_pattern(tuple(character_names))
+
+    if self_critique_first_pass:
+        # One fused compose + self-critique call; the independent critic only
+        # runs if the self-critique already flags problems
+        fused = composer.compose_and_selfcritique(scene_data, act_number, visual_style)
+        current = fused.prompt
+        if not fused.critique.needs_revision and _min_score(fused.critique) >= 7:
+            log(f"        Self-critique approved! Overall: {fused.critique.overall_score:.1f}/10")
+            critique_history.append({**_critique_to_dict(fused.critique, 0), "self_critique": True})
+            return _build_scene_result(current, critique_history, revision_count, scene_data, codex)
+    else:
+        # Initial prompt generation (guaranteed structured output)
+        current = composer.create_scene_prompt(scene_data, act_number, visual_style)
+
+    # With speculation, a revision against the previous critique runs while the
+    # new critique is in flight; it is used only if the new critique rejects
+    # on nothing the previous one did not already flag.
+    executor = ThreadPoolExecutor(max_workers=1) if speculative_revision else None
+
+    try:
+        # Critique-revision loop
+        for i in range(max_revisions):
+            log(f"        Critique cycle {i + 1}/{max_revisions}...")
+
+            speculative = None
+            if executor is not None and last_critique is not None and i < max_revisions - 1:
+                speculative = executor.submit(
+                    composer.revise_scene_prompt, current, last_critique, scene_data, visual_style
+                )
+
+            # Get critique (guaranteed structured output). A leaked name or an
+            # early abort is only acted on when a revision follows, since both
+            # leave the other scores unfilled.
+            critique = None
+            if i < max_revisions - 1:
+                critique = _name_leak_critique(current.prompt, name_pattern)
+            if critique is None:
+                critique = critic.critique(
+                    current, scene_data, visual_style,
+                    early_abort=early_abort_critique and i < max_revisions - 1,
+                )
+            else:
+                log("        Character names in prompt, skipping critic...")
+
+            critique_dict = _critique_to_dict(critique, i + 1)
+            critique_history.append(critique_dict)
+
+            # Check if revision needed
+            min_score = _min_score(critique)
+
+            if not critique.needs_revision and min_score >= 7:
+                log(f"        Approved! Overall: {critique.overall_score:.1f}/10")
+                if speculative is not None:
+                    speculative.cancel()
+                break
+
+            # Revise if needed and not last cycle
+            if i < max_revisions - 1:
+                log(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
+                if speculative is not None and _speculation_covers(critique, last_critique):
+                    current = speculative.result()
+                else:
+                    if speculative is not None:
+                        speculative.cancel()
+                    current = composer.revise_scene_prompt(current, critique, scene_data, visual_style)
+                revision_count += 1
+
+            last_critique = critique
+    finally:
+        if executor is not None:
+            # Don't wait on a discarded speculative revision
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return _build_scene_result(current, critique_history, revision_count, scene_data, codex)
+
+
+def generate_scene_image_prompts_batch(
+    scenes: list[tuple[dict, int]],
+    codex: dict,
+    visual_style: dict = None,
+    model: str = DEFAULT_MODEL,
+    max_revisions: int = 2,
+    max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    log: Callable[[str], None] = print,
+) -> list:
+    """
+    Generate scene image prompts for many scenes, batching critiques across scenes.
 
-    # Critique-revision loop
-    for i in range(max_revisions):
-        print(f"        Critique cycle {i + 1}/{max_revisions}...")
-
-        # Get critique (guaranteed structured output)
-        critique = critic.critique(current, scene_data, visual_style)
-
-        critique_dict = {
-            "cycle": i + 1,
-            "character_accuracy_score": critique.character_accuracy_score,
-            "location_accuracy_score": critique.location_accuracy_score,
-            "no_names_score": critique.no_names_score,
-            "visual_detail_score": critique.visual_detail_score,
-            "composition_score": critique.composition_score,
-            "overall_score": critique.overall_score,
-            "needs_revision": critique.needs_revision,
-            "suggestions": critique.suggestions,
-        }
-        critique_history.append(critique_dict)
-
-        # Check if revision needed
-        min_score = min(
-            critique.character_accuracy_score,
-            critique.location_accuracy_score,
-            critique.no_names_score,
-            critique.visual_detail_score,
-            critique.composition_score,
-        )
+    Runs the same composer + critic workflow as generate_scene_image_prompt, but
+    in lockstep rounds: all scenes are composed, then every pending critique is
+    submitted as one batch, then only scenes that need it are revised.
 
-        if not critique.needs_revision and min_score >= 7:
-            print(f"        Approved! Overall: {critique.overall_score:.1f}/10")
+    Args:
+        scenes: (scene_data, act_number) pairs
+        codex: Full codex with characters and locations
+        visual_style: Visual style dict with name, prefix, suffix, description
+        model: LLM model to use
+        max_revisions: Maximum revision cycles (default 2)
+        max_concurrency: Maximum requests in flight at once
+        log: Progress output (default print)
+
+    Returns:
+        List aligned with scenes: result dict (same shape as
+        generate_scene_image_prompt), or the Exception raised for that scene
+    """
+    composer = SceneImageComposerAgent(codex=codex, model=model)
+    critic = SceneImageCriticAgent(codex=codex, model=model, temperature=0.0)
+
+    results: list = [None] * len(scenes)
+    current: dict[int, SceneImagePromptSchema] = {}
+    histories: dict[int, list] = {i: [] for i in range(len(scenes))}
+    revisions: dict[int, int] = {i: 0 for i in range(len(scenes))}
+
+    def _run_each(fn, indices: list[int]) -> dict:
+        """Run fn(i) concurrently, recording failures as scene results."""
+        outputs = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {i: executor.submit(fn, i) for i in indices}
+        for i, future in futures.items():
+            try:
+                outputs[i] = future.result()
+            except Exception as e:
+                results[i] = e
+        return outputs
+
+    log(f"      Composing {len(scenes)} scene image prompts...")
+    current.update(_run_each(
+        lambda i: composer.create_scene_prompt(scenes[i][0], scenes[i][1], visual_style),
+        list(range(len(scenes))),
+    ))
+    active = sorted(current)
+
+    for cycle in range(max_revisions):
+        if not active:
             break
+        # Prompts leaking character names go straight to revision (unless
+        # this is the last cycle, which needs full scores)
+        leaked = {}
+        if cycle < max_revisions - 1:
+            for i in active:
+                names, _ = _map_roles_to_characters(scenes[i][0].get("characters", []), codex)
+                critique = _name_leak_critique(current[i].prompt, compile_name_pattern(tuple(names)))
+                if critique is not None:
+                    leaked[i] = critique
+        to_critique = [i for i in active if i not in leaked]
+
+        log(f"      Critique cycle {cycle + 1}/{max_revisions}: batching {len(to_critique)} critiques...")
+
+        critiques = critic.critique_batch(
+            [(current[i], scenes[i][0]) for i in to_critique],
+            visual_style,
+            max_concurrency=max_concurrency,
+        ) if to_critique else []
+        critique_by_scene = {**leaked, **dict(zip(to_critique, critiques))}
+
+        to_revise = []
+        for i in active:
+            critique = critique_by_scene[i]
+            if isinstance(critique, Exception):
+                results[i] = critique
+                continue
+            histories[i].append(_critique_to_dict(critique, cycle + 1))
+            if critique.needs_revision or _min_score(critique) < 7:
+                to_revise.append((i, critique))
 
         # Revise if needed and not last cycle
-        if i < max_revisions - 1:
-            print(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
-            current = composer.revise_scene_prompt(current, critique, scene_data, visual_style)
-            revision_count += 1
+        if cycle == max_revisions - 1 or not to_revise:
+            break
+
+        log(f"      Revising {len(to_revise)} scene prompts...")
+        pending = dict(to_revise)
+        revised = _run_each(
+            lambda i: composer.revise_scene_prompt(current[i], pending[i], scenes[i][0], visual_style),
+            list(pending),
+        )
+        for i, prompt in revised.items():
+            current[i] = prompt
+            revisions[i] += 1
+        active = sorted(revised)
+
+    for i, (scene_data, _) in enumerate(scenes):
+        if results[i] is None:
+            results[i] = _build_scene_result(current[i], histories[i], revisions[i], scene_data, codex)
+
+    return results
+
+
+def _critique_to_dict(critique: SceneImageCritiqueSchema, cycle: int) -> dict:
+    """Flatten a critique into the critique_history entry format."""
+    # warnings=False: partial critiques (early abort, name check) leave scores None
+    return {"cycle": cycle, **critique.model_dump(warnings=False)}
+
 
+_SCORE_FIELDS = (
+    "no_names_score",
+    "character_accuracy_score",
+    "location_accuracy_score",
+    "visual_detail_score",
+    "composition_score",
+)
+
+
+def _name_leak_critique(prompt: str, name_pattern: Optional[re.Pattern]) -> Optional[SceneImageCritiqueSchema]:
+    """
+    Check a prompt for character names without calling the critic.
+
+    Args:
+        prompt: Scene image prompt text
+        name_pattern: Pattern from compile_name_pattern (None: nothing to check)
+
+    Returns:
+        A critique with no_names_score=1 and needs_revision=True (other scores
+        unset) if any name appears as a whole word, otherwise None
+    """
+    if name_pattern is None:
+        return None
+    name_hits = list(dict.fromkeys(match.group(0) for match in name_pattern.finditer(prompt)))
+    if not name_hits:
+        return None
+
+    return SceneImageCritiqueSchema.model_construct(
+        **{field: 1 if field == "no_names_score" else None for field in _SCORE_FIELDS},
+        suggestions=[
+            f"Remove name '{name}' and describe the character physically instead."
+            for name in name_hits
+        ],
+    )
+
+
+def _min_score(critique: SceneImageCritiqueSchema) -> int:
+    """Lowest of the five critique scores (ignoring any left unscored by an early abort)."""
+    return min(
+        getattr(critique, field) for field in _SCORE_FIELDS
+        if getattr(critique, field) is not None
+    )
+
+
+def _failing_fields(critique: SceneImageCritiqueSchema) -> set[str]:
+    """Scored fields below their pass mark (no_names_score needs 10, the rest 7)."""
+    return {
+        field for field in _SCORE_FIELDS
+        if getattr(critique, field) is not None
+        and getattr(critique, field) < (10 if field == "no_names_score" else 7)
+    }
+
+
+def _speculation_covers(critique: SceneImageCritiqueSchema, last_critique: SceneImageCritiqueSchema) -> bool:
+    """
+    True if a revision made for last_critique also answers critique.
+
+    A name leak always needs a revision against the new critique (the host-side
+    check only reports names there), as does any newly failing dimension.
+    """
+    return critique.no_names_score == 10 and _failing_fields(critique) <= _failing_fields(last_critique)
+
+
+def _build_scene_result(
+    current: SceneImagePromptSchema,
+    critique_history: list,
+    revision_count: int,
+    scene_data: dict,
+    codex: dict,
+) -> dict:
+    """Assemble the scene image prompt result dict returned by the orchestrators."""
     # Get final scores from last critique
     final_critique = critique_history[-1]
 
@@ -1,30 +1,160 @@
 """
 Shot Frame Prompt Agents - Generate first/last frame image prompts for video shots.
 
-Uses LangGraph ReAct agents with tools to retrieve character and location descriptions
-from the codex, then generates hyper-detailed cinematic prompts without using
+Character and location descriptions are resolved from the codex in Python and
+passed inline, then hyper-detailed cinematic prompts are generated without using
 character names (only physical descriptions, since the model doesn't know who is who).
 
 Key Features:
-- Uses `response_format` for guaranteed structured output
-- Tools for retrieving character/location data from codex
+- Uses `with_structured_output` for guaranteed structured output
+- Tools for retrieving character/location data from codex (for tool-calling agents)
 - Creator + Critic workflow with revision loop
 
 Workflow:
-1. FramePromptCreatorAgent - Uses tools to fetch char/loc data, generates prompts
-2. FramePromptCriticAgent - Uses tools to validate prompts against codex data
+1. FramePromptCreatorAgent - Gets char/loc data inline from the codex, generates prompts
+2. FramePromptCriticAgent - Validates prompts against codex data resolved up-front
 3. Creator revises based on critique
 """
 
 import json
-from typing import Optional
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Optional
 
-from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
-from langgraph.prebuilt import create_react_agent
 
+from src.llm_cache import cached_instance, cached_structured_call, get_llm_cache, structured_cache_key
+from src.story_agents.base_story_agent import (
+    cacheable_system_message, get_llm, get_streaming_structured_llm, get_structured_llm,
+)
+from src.story_agents.codex_index import compile_name_pattern, get_codex_index
 from src.story_schemas import ShotFramePromptSchema, ShotFrameCritiqueSchema
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL
+from src.config import DEFAULT_MODEL, MAX_CONCURRENT_LLM_REQUESTS
+
+
+# =============================================================================
+# Codex Data Helpers - Shared by tools and inline codex context
+# =============================================================================
+
+def _character_profile(char: dict) -> dict:
+    """Extract the visual profile of a codex character."""
+    physical = char.get("physical", {})
+    return {
+        "name": char.get("name"),
+        "gender": char.get("gender", ""),
+        "age": char.get("age", ""),
+        "height": physical.get("height", ""),
+        "build": physical.get("build", ""),
+        "hair_color": physical.get("hair_color", ""),
+        "eye_color": physical.get("eye_color", ""),
+        "distinguishing_features": physical.get("distinguishing_features", ""),
+        "clothing": char.get("clothing", ""),
+        "personality_traits": char.get("personality_traits", []),
+    }
+
+
+def _shot_json(shot_data: dict) -> str:
+    """Serialize shot data for a prompt (compact separators, no indentation)."""
+    return json.dumps(shot_data, separators=(",", ":"))
+
+
+def _location_profile(loc: dict) -> dict:
+    """Extract the visual profile of a codex location."""
+    return {
+        "name": loc.get("name"),
+        "type": loc.get("type", ""),
+        "description": loc.get("description", ""),
+        "atmosphere": loc.get("atmosphere", ""),
+        "key_features": loc.get("key_features", []),
+        "sensory_details": loc.get("sensory_details", ""),
+    }
+
+
+def build_visual_context(
+    codex: dict,
+    location: str,
+    character_names: list[str],
+    visual_style: dict = None,
+) -> str:
+    """
+    Format the codex data and visual style block shared by shots with the same cast and setting.
+
+    Blocks are memoized per codex, so shots that share a location, characters
+    and style reuse one string (and send an identical prompt prefix, which
+    lets providers reuse their prompt cache).
+
+    Args:
+        codex: The full codex dictionary
+        location: Location name
+        character_names: Character names to include
+        visual_style: Visual style dict with name, prefix, suffix
+
+    Returns:
+        Formatted CODEX DATA + VISUAL STYLE block
+    """
+    index = get_codex_index(codex)
+    style = visual_style or {}
+    memo_key = (
+        "frame_visual_context",
+        location,
+        tuple(character_names),
+        style.get("name"), style.get("prefix"), style.get("suffix"),
+    )
+    if memo_key in index.memo:
+        return index.memo[memo_key]
+
+    character_profiles = []
+    for name in character_names:
+        char = index.find_character(name)
+        if char:
+            character_profiles.append(_character_profile(char))
+
+    loc = index.find_location(location)
+    location_profile = _location_profile(loc) if loc else "Not found in codex."
+
+    block = f"""## CODEX DATA (authoritative):
+
+### Characters:
+{json.dumps(character_profiles, indent=2) if character_profiles else "No characters in frame."}
+
+### Location:
+{json.dumps(location_profile, indent=2)}
+"""
+    if visual_style:
+        block += f"""
+## VISUAL STYLE: {style.get("name", "Anime")}
+STYLE PREFIX (start each prompt with this): {style.get("prefix", "")}
+STYLE SUFFIX (end each prompt with this): {style.get("suffix", "")}
+"""
+
+    index.memo[memo_key] = block
+    return block
+
+
+def precompute_scene_context(scene_data: dict, codex: dict, visual_style: dict = None) -> str:
+    """
+    Build one visual context block covering every shot in a scene.
+
+    Pass the result as `visual_context` for each of the scene's shots so they
+    all share the same codex/style preamble.
+
+    Args:
+        scene_data: Scene dict with location, characters and shots
+        codex: The full codex dictionary
+        visual_style: Visual style dict with name, prefix, suffix
+
+    Returns:
+        Formatted CODEX DATA + VISUAL STYLE block
+    """
+    character_names = list(scene_data.get("characters", []))
+    for shot in scene_data.get("shots", []):
+        for name in shot.get("characters_in_frame", []):
+            if name not in character_names:
+                character_names.append(name)
+
+    return build_visual_context(codex, scene_data.get("location", ""), character_names, visual_style)
 
 
 # =============================================================================
@@ -41,8 +171,16 @@ def create_codex_tools(codex: dict) -> list:
     Returns:
         List of tool functions with codex data in closure
     """
-    characters = codex.get("story", {}).get("characters", [])
-    locations = codex.get("story", {}).get("locations", [])
+    index = get_codex_index(codex)
+    characters = index.characters
+    locations = index.locations
+
+    # Tool responses are static per codex, so serialize them once up front
+    # (keyed by id() of the codex entry; the index keeps the entries alive)
+    char_json = {id(char): json.dumps(_character_profile(char), separators=(",", ":")) for char in characters}
+    loc_json = {id(loc): json.dumps(_location_profile(loc), separators=(",", ":")) for loc in locations}
+    all_characters_text = f"Available characters: {[c.get('name', 'Unknown') for c in characters]}"
+    all_locations_text = f"Available locations: {[l.get('name', 'Unknown') for l in locations]}"
 
     @tool
     def get_character_description(character_name: str) -> str:
@@ -54,44 +192,15 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             character_name: The character's name (case-insensitive search)
         """
-        name_lower = character_name.lower().strip()
-
-        for char in characters:
-            if char.get("name", "").lower().strip() == name_lower:
-                physical = char.get("physical", {})
-                result = {
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        # Try partial match
-        for char in characters:
-            if name_lower in char.get("name", "").lower():
-                physical = char.get("physical", {})
-                result = {
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Character '{character_name}' not found in codex. Available characters: {[c.get('name') for c in characters]}"
+        char = index.find_character(character_name)
+        if char:
+            return char_json[id(char)]
+
+        # Closest names only; list_all_characters has the full cast
+        return (
+            f"Character '{character_name}' not found in codex. "
+            f"Closest matches: {index.closest_character_names(character_name)}"
+        )
 
     @tool
     def get_location_description(location_name: str) -> str:
@@ -103,22 +212,14 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             location_name: The location name (case-insensitive, partial match)
         """
-        name_lower = location_name.lower().strip()
-
-        for loc in locations:
-            loc_name = loc.get("name", "").lower().strip()
-            if loc_name == name_lower or name_lower in loc_name or loc_name in name_lower:
-                result = {
-                    "name": loc.get("name"),
-                    "type": loc.get("type", ""),
-                    "description": loc.get("description", ""),
-                    "atmosphere": loc.get("atmosphere", ""),
-                    "key_features": loc.get("key_features", []),
-                    "sensory_details": loc.get("sensory_details", ""),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Location '{location_name}' not found in codex. Available locations: {[l.get('name') for l in locations]}"
+        loc = index.find_location(location_name)
+        if loc:
+            return loc_json[id(loc)]
+
+        return (
+            f"Location '{location_name}' not found in codex. "
+            f"Closest matches: {index.closest_location_names(location_name)}"
+        )
 
     @tool
     def list_all_characters() -> str:
@@ -126,8 +227,7 @@ def create_codex_tools(codex: dict) -> list:
         List all character names in the codex.
         Use this to see what characters are available before fetching details.
         """
-        names = [c.get("name", "Unknown") for c in characters]
-        return f"Available characters: {names}"
+        return all_characters_text
 
     @tool
     def list_all_locations() -> str:
@@ -135,14 +235,13 @@ def create_codex_tools(codex: dict) -> list:
         List all location names in the codex.
         Use this to see what locations are available before fetching details.
         """
-        names = [l.get("name", "Unknown") for l in locations]
-        return f"Available locations: {names}"
+        return all_locations_text
 
     return [get_character_description, get_location_description, list_all_characters, list_all_locations]
 
 
 # =============================================================================
-# Frame Prompt Creator Agent (with Tools)
+# Frame Prompt Creator Agent (Codex Data Inline)
 # =============================================================================
 
 CREATOR_SYSTEM_PROMPT = """You are a MASTER cinematic image prompt engineer specializing in video frame generation.
@@ -162,9 +261,10 @@ These prompts will be used with AI image generation models (Flux, SDXL, Kling, R
    - "A tall woman in her late twenties with flowing auburn hair and emerald eyes"
    - NOT "Rhea stands in the square"
 
-2. **USE THE TOOLS** - Before writing prompts, use the tools to:
-   - Fetch character descriptions for each character in the shot
-   - Fetch location descriptions for the setting
+2. **USE THE CODEX DATA** - Each request includes the codex profiles for:
+   - Every character in the shot
+   - The location of the setting
+   Base all physical and setting details on this data.
 
 3. **SHOW PROGRESSION** - First frame and last frame should show the ACTION PROGRESSION:
    - First frame: Starting position/state of the action
@@ -200,7 +300,7 @@ CRITIC_SYSTEM_PROMPT = """You are a CRITICAL reviewer of AI video frame prompts.
 
 Your job is to validate prompts against the original codex data and ensure quality standards.
 
-## USE THE TOOLS to verify:
+## USE THE CODEX DATA provided with each prompt to verify:
 1. Character descriptions match their codex profiles
 2. Location details match the codex location data
 3. Physical descriptions are accurate (hair color, eye color, distinguishing features)
@@ -243,18 +343,17 @@ Your job is to validate prompts against the original codex data and ensure quali
 - Do visual descriptions match the style aesthetic?
 
 ## DECISION RULES:
-- If ANY score is below 7, mark needs_revision = true
-- If no_names_score < 10, DEFINITELY needs_revision = true
+- Any score below 7 (or no_names_score below 10) sends the prompt back for revision
 - Provide SPECIFIC suggestions referencing codex data"""
 
 
 class FramePromptCreatorAgent:
     """
-    Creates detailed first/last frame prompts using tools to fetch codex data.
+    Creates detailed first/last frame prompts from codex data.
 
-    Uses LangGraph ReAct agent with:
-    - Tools for character/location retrieval from codex
-    - response_format for guaranteed structured output (ShotFramePromptSchema)
+    The shot's characters and location are resolved from the codex in Python
+    and embedded in the prompt, so one structured-output call
+    (ShotFramePromptSchema) replaces the ReAct tool loop.
     """
 
     def __init__(self, codex: dict, model: str = DEFAULT_MODEL, temperature: float = 0.7):
@@ -262,66 +361,230 @@ class FramePromptCreatorAgent:
         self.temperature = temperature
         self.codex = codex
 
-        # Create LLM
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
-        )
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
+
+        # Name lookups shared with every other agent on this codex
+        self.index = get_codex_index(codex)
 
-        # Create tools with codex in closure
-        self.tools = create_codex_tools(codex)
+        # Shared runnables per (model, temperature); the streaming one yields
+        # partial dicts (used for early abort)
+        self.structured_llm = get_structured_llm(model, temperature, ShotFramePromptSchema)
+        self.stream_llm = get_streaming_structured_llm(model, temperature, ShotFramePromptSchema)
 
-        # Create ReAct agent with tools AND response_format for guaranteed structured output
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=ShotFramePromptSchema,
+    def _visual_context(self, shot_data: dict, visual_style: dict = None) -> str:
+        """Codex data + style block for the shot's characters and location (memoized per codex)."""
+        return build_visual_context(
+            self.codex,
+            shot_data.get("location", ""),
+            shot_data.get("characters_in_frame", []),
+            visual_style,
         )
 
-    def create_frame_prompts(self, shot_data: dict, scene_context: str = "", visual_style: dict = None) -> ShotFramePromptSchema:
+    def _messages(self, user_prompt: str) -> list:
+        return [
+            cacheable_system_message(CREATOR_SYSTEM_PROMPT, self.model_name),
+            HumanMessage(content=user_prompt),
+        ]
+
+    def _cache_key_parts(self, user_prompt: str) -> dict:
+        """Cache key parts; the codex data is embedded in the user prompt itself."""
+        return {
+            "model": self.model_name,
+            "temperature": self.temperature,
+            "system": CREATOR_SYSTEM_PROMPT,
+            "user": user_prompt,
+        }
+
+    def _invoke(
+        self,
+        user_prompt: str,
+        name_pattern: Optional[re.Pattern] = None,
+        log: Callable[[str], None] = print,
+    ) -> ShotFramePromptSchema:
+        """
+        Make one structured call, reusing cached responses for identical requests.
+
+        With name_pattern, the response is streamed and cut off as soon as the
+        finished first frame prompt contains a character name; the request is
+        then re-issued once with a correction listing the leaked names (noted via log).
+        """
+        if name_pattern is None:
+            return cached_structured_call(
+                ShotFramePromptSchema,
+                lambda: self.structured_llm.invoke(self._messages(user_prompt)),
+                **self._cache_key_parts(user_prompt),
+            )
+
+        cache = get_llm_cache()
+        key = structured_cache_key(ShotFramePromptSchema, **self._cache_key_parts(user_prompt))
+        hit = cached_instance(cache, key, ShotFramePromptSchema)
+        if hit is not None:
+            return hit
+
+        result, name_hits = self._invoke_streaming(user_prompt, name_pattern)
+        if result is not None:
+            cache.set(key, result.model_dump())
+            return result
+
+        log(f"        Names in first frame prompt ({', '.join(name_hits)}), re-issuing...")
+        return self._invoke(f"""{user_prompt}
+
+CORRECTION: A previous attempt used character names ({', '.join(name_hits)}).
+Do NOT use any character name - describe each character only by physical appearance.""")
+
+    def _invoke_streaming(
+        self,
+        user_prompt: str,
+        name_pattern: re.Pattern,
+    ) -> tuple[Optional[ShotFramePromptSchema], list[str]]:
+        """
+        Stream a response, stopping once the first frame prompt is known to leak names.
+
+        Returns:
+            (prompts, []) for a complete response, or (None, name_hits) if the
+            stream was cut short
+        """
+        partial = {}
+        checked = False
+        stream = self.stream_llm.stream(self._messages(user_prompt))
+        try:
+            for partial in stream:
+                # A streamed value is only final once the next key has started
+                if not checked and "firstframe_prompt" in list(partial)[:-1]:
+                    checked = True
+                    name_hits = list(dict.fromkeys(
+                        match.group(0) for match in name_pattern.finditer(partial["firstframe_prompt"])
+                    ))
+                    if name_hits:
+                        return None, name_hits
+        finally:
+            stream.close()
+
+        return ShotFramePromptSchema.model_validate(partial), []
+
+    def create_frame_prompts(
+        self,
+        shot_data: dict,
+        scene_context: str = "",
+        visual_style: dict = None,
+        visual_context: str = None,
+        shot_json: str = None,
+        early_abort: bool = False,
+        log: Callable[[str], None] = print,
+    ) -> ShotFramePromptSchema:
         """
         Generate first and last frame prompts for a shot.
 
-        The agent will use tools to fetch character/location descriptions,
-        then generate hyper-detailed prompts with guaranteed structured output.
+        Character/location descriptions are looked up from the codex and
+        passed inline, then hyper-detailed prompts are generated with
+        guaranteed structured output.
 
         Args:
             shot_data: Shot dict with characters_in_frame, location, action, etc.
             scene_context: Additional scene context (e.g., what happened before)
             visual_style: Visual style dict with name, prefix, suffix
+            visual_context: Shared codex/style block (e.g. from precompute_scene_context);
+                built from the shot when omitted
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
+            early_abort: Stream the response and re-issue it as soon as the
+                first frame prompt is found to contain a character name
+            log: Receives the re-issue notice (e.g. a per-shot log buffer)
 
         Returns:
             ShotFramePromptSchema with firstframe_prompt and lastframe_prompt
         """
-        shot_json = json.dumps(shot_data, indent=2)
-
-        # Extract style components
-        style_info = ""
-        if visual_style:
-            style_name = visual_style.get("name", "Anime")
-            style_prefix = visual_style.get("prefix", "")
-            style_suffix = visual_style.get("suffix", "")
-            style_info = f"""
-## VISUAL STYLE: {style_name}
-STYLE PREFIX (start each prompt with this): {style_prefix}
-STYLE SUFFIX (end each prompt with this): {style_suffix}
-"""
+        name_pattern = None
+        if early_abort:
+            name_pattern = compile_name_pattern(tuple(shot_data.get("characters_in_frame", [])))
+        return self._invoke(
+            self._create_prompt(shot_data, scene_context, visual_style, visual_context, shot_json),
+            name_pattern,
+            log,
+        )
+
+    def create_frame_prompts_batch(
+        self,
+        shots: list[dict],
+        scene_context: str = "",
+        visual_style: dict = None,
+        visual_context: str = None,
+        shot_jsons: list[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    ) -> list:
+        """
+        Generate initial first/last frame prompts for many shots in one batched submission.
+
+        Args:
+            shots: Shot dicts (see create_frame_prompts)
+            scene_context: Additional scene context shared by the shots
+            visual_style: Visual style dict with name, prefix, suffix
+            visual_context: Shared codex/style block for the scene
+            shot_jsons: Pre-serialized shots, aligned with shots
+            max_concurrency: Maximum requests in flight at once
 
-        user_prompt = f"""Generate FIRST FRAME and LAST FRAME image prompts for this video shot.
+        Returns:
+            List aligned with shots: ShotFramePromptSchema, or the Exception
+            raised for that shot
+        """
+        shot_jsons = shot_jsons or [None] * len(shots)
+        user_prompts = [
+            self._create_prompt(shot, scene_context, visual_style, visual_context, shot_json)
+            for shot, shot_json in zip(shots, shot_jsons)
+        ]
+
+        cache = get_llm_cache()
+        keys = [
+            structured_cache_key(ShotFramePromptSchema, **self._cache_key_parts(p))
+            for p in user_prompts
+        ]
+
+        results = []
+        misses = []
+        for i, key in enumerate(keys):
+            hit = cached_instance(cache, key, ShotFramePromptSchema)
+            results.append(hit)
+            if hit is None:
+                misses.append(i)
+
+        if misses:
+            responses = self.structured_llm.batch(
+                [self._messages(user_prompts[i]) for i in misses],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+            for i, response in zip(misses, responses):
+                results[i] = response
+                if not isinstance(response, Exception):
+                    cache.set(keys[i], response.model_dump())
+
+        return results
+
+    def _create_prompt(
+        self,
+        shot_data: dict,
+        scene_context: str = "",
+        visual_style: dict = None,
+        visual_context: str = None,
+        shot_json: str = None,
+    ) -> str:
+        """Build the user message for create_frame_prompts."""
+        shot_json = shot_json or _shot_json(shot_data)
+        visual_context = visual_context or self._visual_context(shot_data, visual_style)
+
+        # Shared context first so shots in a scene send an identical prefix
+        user_prompt = f"""{visual_context}
+Generate FIRST FRAME and LAST FRAME image prompts for this video shot.
 
 ## SHOT DATA:
 {shot_json}
 
 ## SCENE CONTEXT:
 {scene_context if scene_context else "Opening shot of scene."}
-{style_info}
+
 ## INSTRUCTIONS:
 
-1. FIRST: Use get_character_description tool for EACH character in characters_in_frame
-2. SECOND: Use get_location_description tool for the location
-3. THIRD: Generate the prompts based on the retrieved data
+Generate the prompts based on the CODEX DATA above.
 
 For the FIRST FRAME:
 - START WITH THE STYLE PREFIX if provided
@@ -338,28 +601,21 @@ For the LAST FRAME:
 - END WITH THE STYLE SUFFIX if provided
 
 CRITICAL RULES:
-- NEVER use character names - only physical descriptions from the tools
+- NEVER use character names - only physical descriptions from the codex data
 - Each prompt: 300-500 words, single paragraph
 - First frame shows START of action, last frame shows END of action
 - Use shot_size for framing, time_of_day for lighting"""
 
-        # Run the ReAct agent - structured_response is guaranteed via response_format
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": CREATOR_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ]
-        })
-
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+        return user_prompt
 
     def revise_frame_prompts(
         self,
         original: ShotFramePromptSchema,
         critique: ShotFrameCritiqueSchema,
         shot_data: dict,
-        visual_style: dict = None
+        visual_style: dict = None,
+        visual_context: str = None,
+        shot_json: str = None,
     ) -> ShotFramePromptSchema:
         """
         Revise frame prompts based on critic feedback.
@@ -369,25 +625,18 @@ CRITICAL RULES:
             critique: Critic's evaluation with scores and suggestions
             shot_data: Original shot data for reference
             visual_style: Visual style dict with name, prefix, suffix
+            visual_context: Shared codex/style block; built from the shot when omitted
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
         Returns:
             Revised ShotFramePromptSchema
         """
         suggestions = "\n".join(f"- {s}" for s in critique.suggestions)
+        shot_json = shot_json or _shot_json(shot_data)
+        visual_context = visual_context or self._visual_context(shot_data, visual_style)
 
-        # Extract style components
-        style_info = ""
-        if visual_style:
-            style_name = visual_style.get("name", "Anime")
-            style_prefix = visual_style.get("prefix", "")
-            style_suffix = visual_style.get("suffix", "")
-            style_info = f"""
-## VISUAL STYLE: {style_name}
-REMINDER: Each prompt must START with: {style_prefix}
-REMINDER: Each prompt must END with: {style_suffix}
-"""
-
-        prompt = f"""REVISE these frame prompts based on critic feedback.
+        prompt = f"""{visual_context}
+REVISE these frame prompts based on critic feedback.
 
 ## ORIGINAL FIRST FRAME PROMPT:
 {original.firstframe_prompt}
@@ -396,50 +645,80 @@ REMINDER: Each prompt must END with: {style_suffix}
 {original.lastframe_prompt}
 
 ## CRITIC SCORES:
-- Character Accuracy: {critique.character_accuracy_score}/10
-- Location Accuracy: {critique.location_accuracy_score}/10
-- Framing Accuracy: {critique.framing_accuracy_score}/10
-- Lighting/Mood: {critique.lighting_mood_score}/10
-- Action Continuity: {critique.action_continuity_score}/10
+- Character Accuracy: {critique.character_accuracy_score or "?"}/10
+- Location Accuracy: {critique.location_accuracy_score or "?"}/10
+- Framing Accuracy: {critique.framing_accuracy_score or "?"}/10
+- Lighting/Mood: {critique.lighting_mood_score or "?"}/10
+- Action Continuity: {critique.action_continuity_score or "?"}/10
 - No Names (CRITICAL): {critique.no_names_score}/10
 
 ## SUGGESTIONS FOR IMPROVEMENT:
 {suggestions}
 
 ## SHOT DATA (reference):
-{json.dumps(shot_data, indent=2)}
-{style_info}
-FIRST: Use the tools to re-fetch character and location data for accuracy.
-THEN: Create IMPROVED prompts addressing ALL the critic's concerns.
+{shot_json}
+
+Create IMPROVED prompts addressing ALL the critic's concerns, using the CODEX DATA for accuracy.
 
 CRITICAL: If no_names_score < 10, you MUST remove all character names and replace with physical descriptions!
 CRITICAL: Ensure style prefix at START and style suffix at END of each prompt.
 
 Maintain 300-500 words per prompt, single paragraph each."""
 
-        # Run agent with tools for revision - structured_response guaranteed
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": CREATOR_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-        })
-
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+        return self._invoke(prompt)
 
 
 # =============================================================================
-# Frame Prompt Critic Agent (with Tools)
+# Frame Prompt Critic Agent (Codex Data Inline)
 # =============================================================================
 
+# Scoring criteria and style rules live in CRITIC_SYSTEM_PROMPT; the user
+# message carries only the per-shot data, least shared last
+CRITIC_USER_PROMPT_TEMPLATE = """CRITICALLY EVALUATE the frame prompts at the end of this message.
+
+Compare the prompts against the CODEX DATA below and score each criterion from your instructions.
+{style_check}
+{codex_data}
+## SHOT DATA:
+{shot_json}
+
+Expected shot_size: {shot_size}
+Expected time_of_day: {time_of_day}
+CRITICAL: Check if character names like {characters_in_frame} appear in prompts!
+
+## FIRST FRAME PROMPT:
+{firstframe_prompt}
+
+## LAST FRAME PROMPT:
+{lastframe_prompt}"""
+
+
+@lru_cache(maxsize=32)
+def _critic_prompt_template(style_name: Optional[str], style_prefix: str, style_suffix: str) -> str:
+    """
+    CRITIC_USER_PROMPT_TEMPLATE with the (scene-invariant) style block baked in.
+
+    Built once per visual style; critique() then only fills the per-shot fields.
+    """
+    style_check = ""
+    if style_name is not None:
+        style_check = f"""
+## REQUIRED VISUAL STYLE: {style_name}
+Expected prefix: {style_prefix}
+Expected suffix keywords: {style_suffix}
+"""
+    # Escape braces so style text survives the later format_map
+    style_check = style_check.replace("{", "{{").replace("}", "}}")
+    return CRITIC_USER_PROMPT_TEMPLATE.replace("{style_check}", style_check)
+
+
 class FramePromptCriticAgent:
     """
     Critiques frame prompts for accuracy against codex data.
 
-    Uses LangGraph ReAct agent with:
-    - Tools for character/location verification from codex
-    - response_format for guaranteed structured output (ShotFrameCritiqueSchema)
+    The shot's characters and location are resolved from the codex in Python
+    and embedded in the prompt, so one structured-output call
+    (ShotFrameCritiqueSchema) replaces the ReAct tool loop.
     """
 
     def __init__(self, codex: dict, model: str = DEFAULT_MODEL, temperature: float = 0.3):
@@ -447,104 +726,66 @@ class FramePromptCriticAgent:
         self.temperature = temperature
         self.codex = codex
 
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
-        )
-
-        self.tools = create_codex_tools(codex)
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
 
-        # Create ReAct agent with tools AND response_format for guaranteed structured output
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=ShotFrameCritiqueSchema,
-        )
+        # Shared runnable per (model, temperature)
+        self.structured_llm = get_structured_llm(model, temperature, ShotFrameCritiqueSchema)
 
     def critique(
         self,
         frame_prompts: ShotFramePromptSchema,
         shot_data: dict,
-        visual_style: dict = None
+        visual_style: dict = None,
+        shot_json: str = None,
     ) -> ShotFrameCritiqueSchema:
         """
         Evaluate frame prompts for accuracy and quality.
 
-        Uses tools to verify descriptions match codex data with guaranteed structured output.
+        Compares the prompts against codex data embedded in the request.
 
         Args:
             frame_prompts: The prompts to critique
             shot_data: Original shot data for reference
             visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
         Returns:
             ShotFrameCritiqueSchema with scores and suggestions
         """
-        # Extract style requirements
-        style_check = ""
-        if visual_style:
-            style_name = visual_style.get("name", "Anime")
-            style_prefix = visual_style.get("prefix", "")
-            style_suffix = visual_style.get("suffix", "")
-            style_check = f"""
-
-## REQUIRED VISUAL STYLE: {style_name}
-Expected prefix: {style_prefix}
-Expected suffix keywords: {style_suffix}
-
-CHECK STYLE ADHERENCE:
-- Does FIRST FRAME prompt START with the style prefix?
-- Does FIRST FRAME prompt END with style-specific quality tags?
-- Does LAST FRAME prompt START with the style prefix?
-- Does LAST FRAME prompt END with style-specific quality tags?
-- Do visual descriptions match the {style_name} aesthetic?
-"""
-
-        prompt = f"""CRITICALLY EVALUATE these frame prompts.
-
-## FIRST FRAME PROMPT:
-{frame_prompts.firstframe_prompt}
-
-## LAST FRAME PROMPT:
-{frame_prompts.lastframe_prompt}
-
-## SHOT DATA:
-{json.dumps(shot_data, indent=2)}
-{style_check}
-## INSTRUCTIONS:
-
-1. FIRST: Use get_character_description tool to get ACTUAL character descriptions from codex
-2. SECOND: Use get_location_description tool to get ACTUAL location description from codex
-3. THIRD: Compare the prompts against the codex data and score
-
-SCORING CRITERIA (1-10 each):
-
-1. CHARACTER_ACCURACY: Do descriptions match codex? (hair color, eye color, clothing, distinguishing marks)
-2. LOCATION_ACCURACY: Does setting match codex location? (key features, atmosphere)
-3. FRAMING_ACCURACY: Does prompt use correct shot_size ({shot_data.get('shot_size', 'UNKNOWN')})?
-4. LIGHTING_MOOD: Does lighting match time_of_day ({shot_data.get('time_of_day', 'UNKNOWN')})?
-5. ACTION_CONTINUITY: Does first→last frame show logical action progression?
-6. NO_NAMES: Score 10 if NO character names used, Score 1 if ANY names found!
-
-CRITICAL: Check if character names like {shot_data.get('characters_in_frame', [])} appear in prompts!
-If names are present, no_names_score MUST be 1!
-
-If visual style is provided, check style adherence and include in suggestions if missing.
-
-Set needs_revision=true if ANY score is below 7."""
-
-        # Run agent - structured_response is guaranteed via response_format
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": CRITIC_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
+        style = visual_style or {}
+        template = _critic_prompt_template(
+            style.get("name", "Anime") if visual_style else None,
+            style.get("prefix", ""),
+            style.get("suffix", ""),
+        )
+        prompt = template.format_map({
+            # Codex-only block (no style), memoized per codex like the creator's
+            "codex_data": build_visual_context(
+                self.codex,
+                shot_data.get("location", ""),
+                shot_data.get("characters_in_frame", []),
+            ),
+            "shot_json": shot_json or _shot_json(shot_data),
+            "shot_size": shot_data.get("shot_size", "UNKNOWN"),
+            "time_of_day": shot_data.get("time_of_day", "UNKNOWN"),
+            "characters_in_frame": shot_data.get("characters_in_frame", []),
+            "firstframe_prompt": frame_prompts.firstframe_prompt,
+            "lastframe_prompt": frame_prompts.lastframe_prompt,
         })
 
-        # With response_format, output is guaranteed in structured_response
-        return result["structured_response"]
+        # The codex data is embedded in the prompt, so the prompt is the key
+        return cached_structured_call(
+            ShotFrameCritiqueSchema,
+            lambda: self.structured_llm.invoke([
+                cacheable_system_message(CRITIC_SYSTEM_PROMPT, self.model_name),
+                HumanMessage(content=prompt),
+            ]),
+            model=self.model_name,
+            temperature=self.temperature,
+            system=CRITIC_SYSTEM_PROMPT,
+            user=prompt,
+        )
 
 
 # =============================================================================
@@ -558,11 +799,16 @@ def generate_shot_frame_prompts(
     visual_style: dict = None,
     model: str = DEFAULT_MODEL,
     max_revisions: int = 2,
+    visual_context: str = None,
+    early_abort_names: bool = False,
+    speculative_critique: bool = True,
+    log: Callable[[str], None] = print,
 ) -> dict:
     """
     Generate first/last frame prompts for a shot using creator + critic workflow.
 
-    Uses ReAct agents with tools and guaranteed structured output via response_format.
+    Both the creator and the critic get codex data inline and return
+    guaranteed structured output.
 
     Args:
         shot_data: Shot dict with characters_in_frame, location, action, etc.
@@ -571,6 +817,12 @@ def generate_shot_frame_prompts(
         visual_style: Visual style dict with name, prefix, suffix, description
         model: LLM model to use
         max_revisions: Maximum revision cycles (default 2)
+        visual_context: Shared codex/style block for the scene (see precompute_scene_context)
+        early_abort_names: Stream the initial prompts and re-issue them as soon as
+            the first frame prompt leaks a character name
+        speculative_critique: Let the critic score a name-leaking prompt while it is
+            revised (an extra critic call that may be discarded)
+        log: Receives progress lines (e.g. a per-shot log buffer)
 
     Returns:
         Dict with:
@@ -588,54 +840,190 @@ def generate_shot_frame_prompts(
 
     shot_num = shot_data.get("shot_number", "?")
     location = shot_data.get("location", "Unknown")
-    print(f"      Creating frame prompts for shot {shot_num} at {location}...")
+    log(f"      Creating frame prompts for shot {shot_num} at {location}...")
 
     # Initial prompt generation (guaranteed structured output)
-    current = creator.create_frame_prompts(shot_data, scene_context, visual_style)
+    # Serialize the shot once for every create/critique/revise call below
+    shot_json = _shot_json(shot_data)
 
-    critique_history = []
-    revision_count = 0
+    current = creator.create_frame_prompts(
+        shot_data, scene_context, visual_style, visual_context, shot_json=shot_json,
+        early_abort=early_abort_names, log=log,
+    )
 
-    # Critique-revision loop
-    for i in range(max_revisions):
-        print(f"        Critique cycle {i + 1}/{max_revisions}...")
-
-        # Get critique (guaranteed structured output)
-        critique = critic.critique(current, shot_data, visual_style)
-
-        critique_dict = {
-            "cycle": i + 1,
-            "character_accuracy_score": critique.character_accuracy_score,
-            "location_accuracy_score": critique.location_accuracy_score,
-            "framing_accuracy_score": critique.framing_accuracy_score,
-            "lighting_mood_score": critique.lighting_mood_score,
-            "action_continuity_score": critique.action_continuity_score,
-            "no_names_score": critique.no_names_score,
-            "overall_score": critique.overall_score,
-            "needs_revision": critique.needs_revision,
-            "suggestions": critique.suggestions,
-        }
-        critique_history.append(critique_dict)
-
-        # Check if revision needed
-        min_score = min(
-            critique.character_accuracy_score,
-            critique.location_accuracy_score,
-            critique.framing_accuracy_score,
-            critique.lighting_mood_score,
-            critique.action_continuity_score,
-            critique.no_names_score,
-        )
+    return _refine_frame_prompts(
+        current, creator, critic, shot_data, visual_style, visual_context, shot_json, max_revisions,
+        log=log, speculative_critique=speculative_critique,
+    )
+
+
+def generate_scene_frame_prompts(
+    shots: list[dict],
+    codex: dict,
+    scene_context: str = "",
+    visual_style: dict = None,
+    model: str = DEFAULT_MODEL,
+    max_revisions: int = 2,
+    visual_context: str = None,
+    max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    speculative_critique: bool = True,
+) -> list:
+    """
+    Generate first/last frame prompts for every shot in a scene.
+
+    The initial creator prompts are independent and known up front, so they
+    go out as one batched submission; each shot's critique-revision loop
+    depends on its own output and runs per shot, with shots in parallel.
+
+    Args:
+        shots: Shot dicts for the scene
+        codex: Full codex with characters and locations
+        scene_context: Additional scene context
+        visual_style: Visual style dict with name, prefix, suffix, description
+        model: LLM model to use
+        max_revisions: Maximum revision cycles per shot (default 2)
+        visual_context: Shared codex/style block for the scene (see precompute_scene_context)
+        max_concurrency: Maximum requests in flight at once
+        speculative_critique: Let the critic score a name-leaking prompt while it is
+            revised (an extra critic call that may be discarded)
+
+    Returns:
+        List aligned with shots: result dict (same shape as
+        generate_shot_frame_prompts), or the Exception raised for that shot
+    """
+    creator = FramePromptCreatorAgent(codex=codex, model=model)
+    critic = FramePromptCriticAgent(codex=codex, model=model, temperature=0.3)
 
-        if not critique.needs_revision and min_score >= 7:
-            print(f"        Approved! Overall: {critique.overall_score:.1f}/10")
-            break
+    print(f"      Creating frame prompts for {len(shots)} shots...")
+    shot_jsons = [_shot_json(shot) for shot in shots]
+    initial = creator.create_frame_prompts_batch(
+        shots, scene_context, visual_style, visual_context, shot_jsons, max_concurrency
+    )
+
+    results: list = list(initial)
+    logs: dict[int, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        futures = {}
+        for i, current in enumerate(initial):
+            if isinstance(current, Exception):
+                continue
+            logs[i] = [f"      Shot {shots[i].get('shot_number', i + 1)}:"]
+            future = executor.submit(
+                _refine_frame_prompts,
+                current, creator, critic, shots[i], visual_style, visual_context, shot_jsons[i], max_revisions,
+                log=logs[i].append, speculative_critique=speculative_critique,
+            )
+            futures[future] = i
+
+        # Each shot's progress is printed as one block when it finishes, so
+        # concurrent shots neither interleave nor contend for stdout
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+                logs[i].append(f"        Failed: {e}")
+            print("\n".join(logs[i]))
+
+    return results
+
+
+def _refine_frame_prompts(
+    current: ShotFramePromptSchema,
+    creator: FramePromptCreatorAgent,
+    critic: FramePromptCriticAgent,
+    shot_data: dict,
+    visual_style: dict,
+    visual_context: Optional[str],
+    shot_json: str,
+    max_revisions: int,
+    log: Callable[[str], None] = print,
+    speculative_critique: bool = True,
+) -> dict:
+    """
+    Run a shot's critique-revision loop and assemble its result dict (progress goes to log).
 
-        # Revise if needed and not last cycle
-        if i < max_revisions - 1:
-            print(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
-            current = creator.revise_frame_prompts(current, critique, shot_data, visual_style)
-            revision_count += 1
+    When the local name check sends a prompt straight to revision, the critic
+    can still score that prompt in parallel with the revision
+    (speculative_critique). If it failed on names alone, the next cycle keeps
+    those scores instead of waiting on another critic call; otherwise the
+    speculative result is dropped and the next cycle critiques as usual.
+    """
+    critique_history = []
+    revision_count = 0
+    last_critique = None
+    speculation = None
+    name_pattern = compile_name_pattern(tuple(shot_data.get("characters_in_frame", [])))
+
+    try:
+        # Critique-revision loop
+        for i in range(max_revisions):
+            log(f"        Critique cycle {i + 1}/{max_revisions}...")
+
+            # Cheap local checks first: a leaked name goes straight to revision
+            # (when one follows), and a prompt that only failed on names keeps
+            # its previous scores once the names are gone
+            frames_text = f"{current.firstframe_prompt}\n{current.lastframe_prompt}"
+            critique = None
+            speculative = None
+            if i < max_revisions - 1:
+                critique = _name_leak_critique(frames_text, name_pattern)
+                if critique is not None:
+                    log("        Character names in prompts, skipping critic...")
+                    if speculative_critique:
+                        if speculation is None:
+                            speculation = ThreadPoolExecutor(max_workers=1)
+                        speculative = speculation.submit(
+                            critic.critique, current, shot_data, visual_style, shot_json=shot_json
+                        )
+            if (
+                critique is None
+                and last_critique is not None
+                and _only_names_failed(last_critique)
+                and (name_pattern is None or not name_pattern.search(frames_text))
+                and _style_applied(current, visual_style)
+            ):
+                critique = _with_names_cleared(last_critique)
+                log("        Names removed, keeping previous scores...")
+
+            if critique is None:
+                # Get critique (guaranteed structured output)
+                critique = critic.critique(current, shot_data, visual_style, shot_json=shot_json)
+
+            # warnings=False: a name-check critique leaves the other scores None
+            critique_history.append({"cycle": i + 1, **critique.model_dump(warnings=False)})
+
+            # Check if revision needed
+            min_score = _min_score(critique)
+
+            if not critique.needs_revision and min_score >= 7:
+                log(f"        Approved! Overall: {critique.overall_score:.1f}/10")
+                break
+
+            # Revise if needed and not last cycle
+            if i < max_revisions - 1:
+                log(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
+                current = creator.revise_frame_prompts(
+                    current, critique, shot_data, visual_style, visual_context, shot_json=shot_json
+                )
+                revision_count += 1
+
+                if speculative is not None:
+                    # The critic scored the pre-revision prompt while it was revised;
+                    # keep its scores only if names were the sole failure
+                    try:
+                        scored = speculative.result()
+                    except Exception:
+                        scored = None
+                    if scored is not None and _only_names_failed(scored):
+                        critique = scored
+
+            last_critique = critique
+    finally:
+        # Don't leave a speculative critic call running past an exception
+        if speculation is not None:
+            speculation.shutdown(wait=False, cancel_futures=True)
 
     # Get final scores from last critique
     final_critique = critique_history[-1]
@@ -657,4 +1045,75 @@ def generate_shot_frame_prompts(
             "overall": final_critique["overall_score"],
         },
         "critique_history": critique_history,
-    }
\ No newline at end of file
+    }
+
+
+_SCORE_FIELDS = (
+    "character_accuracy_score",
+    "location_accuracy_score",
+    "framing_accuracy_score",
+    "lighting_mood_score",
+    "action_continuity_score",
+    "no_names_score",
+)
+
+
+def _min_score(critique: ShotFrameCritiqueSchema) -> int:
+    """Lowest of the six critique scores (ignoring any left unscored by the name check)."""
+    return min(
+        getattr(critique, field) for field in _SCORE_FIELDS
+        if getattr(critique, field) is not None
+    )
+
+
+def _name_leak_critique(frames_text: str, name_pattern: Optional[re.Pattern]) -> Optional[ShotFrameCritiqueSchema]:
+    """
+    Check frame prompts for character names without calling the critic.
+
+    Returns:
+        A critique with no_names_score=1 and needs_revision=True (other scores
+        unset) if any name appears as a whole word, otherwise None
+    """
+    if name_pattern is None:
+        return None
+    name_hits = list(dict.fromkeys(match.group(0) for match in name_pattern.finditer(frames_text)))
+    if not name_hits:
+        return None
+
+    return ShotFrameCritiqueSchema.model_construct(
+        **{field: 1 if field == "no_names_score" else None for field in _SCORE_FIELDS},
+        suggestions=[
+            f"Remove name '{name}' and describe the character physically instead."
+            for name in name_hits
+        ],
+    )
+
+
+def _only_names_failed(critique: ShotFrameCritiqueSchema) -> bool:
+    """True if a fully scored critique failed on no_names alone (every other score >= 8)."""
+    others = [getattr(critique, field) for field in _SCORE_FIELDS if field != "no_names_score"]
+    return (
+        critique.no_names_score is not None
+        and critique.no_names_score < 10
+        and all(score is not None and score >= 8 for score in others)
+    )
+
+
+def _with_names_cleared(critique: ShotFrameCritiqueSchema) -> ShotFrameCritiqueSchema:
+    """Carry a names-only rejection forward as an approval once the names are gone."""
+    return critique.model_copy(update={
+        "no_names_score": 10,
+        "suggestions": [],
+    })
+
+
+def _style_applied(frame_prompts: ShotFramePromptSchema, visual_style: dict = None) -> bool:
+    """Literal check that both frame prompts open with the style prefix and contain its suffix."""
+    if not visual_style:
+        return True
+    prefix = visual_style.get("prefix", "").strip()
+    suffix = visual_style.get("suffix", "").strip()
+    return all(
+        prompt.lstrip().startswith(prefix) and suffix in prompt
+        for prompt in (frame_prompts.firstframe_prompt, frame_prompts.lastframe_prompt)
+    )
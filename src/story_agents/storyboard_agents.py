@@ -11,18 +11,27 @@ Uses industry-standard screenplay/storyboard format:
 - Visual Critic: Camera, framing, lighting, blocking
 - Dialogue Critic: Timing, delivery, word count, flow
 - Continuity Critic: Shot flow, consistency, pacing
+
+The Combined Critic runs all three reviews in one call on a single copy of
+the storyboard.
 """
 
 import json
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Optional
 
 from src.story_agents.base_story_agent import BaseStoryAgent
+from src.story_agents.codex_index import get_codex_list_memo
 from src.story_schemas import (
     StoryboardSchema,
     ShotSchema,
     VisualCritiqueSchema,
     DialogueCritiqueSchema,
     ContinuityCritiqueSchema,
+    CombinedStoryboardCritiqueSchema,
 )
 from src.config import DEFAULT_MODEL
 
@@ -34,6 +43,11 @@ from src.config import DEFAULT_MODEL
 class StoryboardCreatorAgent(BaseStoryAgent):
     """Breaks narrative scenes into shots using industry-standard screenplay format."""
 
+    # Reruns of an unchanged scene reuse paid-for responses
+    cache_structured_responses = True
+    # Shot list drafted freely, then parsed into StoryboardSchema
+    two_stage_structured = True
+
     @property
     def name(self) -> str:
         return "STORYBOARD_CREATOR"
@@ -181,7 +195,7 @@ Remember:
         Returns:
             Revised StoryboardSchema
         """
-        storyboard_json = current_storyboard.model_dump_json(indent=2)
+        storyboard_json = current_storyboard.model_dump_json()
 
         # Format critiques
         visual_issues = "\n".join(f"- {s}" for s in visual_critique.suggestions)
@@ -224,20 +238,7 @@ Ensure dialogue word counts fit within shot durations (25-35 words max per 10-15
 # Visual Critic Agent
 # =============================================================================
 
-class VisualCriticAgent(BaseStoryAgent):
-    """Critiques visual/cinematography elements of storyboard."""
-
-    @property
-    def name(self) -> str:
-        return "STORYBOARD_VISUAL_CRITIC"
-
-    @property
-    def role(self) -> str:
-        return "Cinematographer and visual design expert"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are a CINEMATOGRAPHER reviewing storyboard shots.
+VISUAL_CRITIC_SYSTEM_PROMPT = """You are a CINEMATOGRAPHER reviewing storyboard shots.
 
 EVALUATE EACH SHOT ON:
 
@@ -274,6 +275,24 @@ EVALUATE EACH SHOT ON:
 DECISION: needs_revision = true if ANY score < 7
 Provide SPECIFIC visual improvements."""
 
+
+class VisualCriticAgent(BaseStoryAgent):
+    """Critiques visual/cinematography elements of storyboard."""
+
+    cache_structured_responses = True
+
+    @property
+    def name(self) -> str:
+        return "STORYBOARD_VISUAL_CRITIC"
+
+    @property
+    def role(self) -> str:
+        return "Cinematographer and visual design expert"
+
+    @property
+    def system_prompt(self) -> str:
+        return VISUAL_CRITIC_SYSTEM_PROMPT
+
     def critique(
         self,
         storyboard: StoryboardSchema,
@@ -289,16 +308,18 @@ Provide SPECIFIC visual improvements."""
         Returns:
             VisualCritiqueSchema with scores and suggestions
         """
-        storyboard_json = storyboard.model_dump_json(indent=2)
+        storyboard_json = storyboard.model_dump_json()
 
+        # The reference is the same every revision cycle; the storyboard is not
+        reference = f"""LOCATION REFERENCE:
+{location_context}
+
+"""
         prompt = f"""EVALUATE this storyboard for VISUAL quality:
 
 STORYBOARD:
 {storyboard_json}
 
-LOCATION REFERENCE:
-{location_context}
-
 Score each visual category 1-10.
 Provide SPECIFIC suggestions for shots scoring below 8.
 Be critical - only excellent visual direction should pass without revision.
@@ -311,27 +332,15 @@ Consider:
 - Are character positions precise?
 - Will AI video understand these directions?"""
 
-        return self.invoke_structured(prompt, VisualCritiqueSchema, max_tokens=1500)
+        return self.invoke_structured(prompt, VisualCritiqueSchema, max_tokens=1500,
+                                      cacheable_prefix=reference)
 
 
 # =============================================================================
 # Dialogue Critic Agent
 # =============================================================================
 
-class DialogueCriticAgent(BaseStoryAgent):
-    """Critiques dialogue timing, delivery, and audio elements."""
-
-    @property
-    def name(self) -> str:
-        return "STORYBOARD_DIALOGUE_CRITIC"
-
-    @property
-    def role(self) -> str:
-        return "Dialogue director and audio specialist"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are a DIALOGUE DIRECTOR reviewing storyboard shots.
+DIALOGUE_CRITIC_SYSTEM_PROMPT = """You are a DIALOGUE DIRECTOR reviewing storyboard shots.
 
 ## TIMING RULES
 - Speaking rate: ~150 words/minute = 2.5 words/second
@@ -370,6 +379,24 @@ EVALUATE EACH SHOT ON:
 DECISION: needs_revision = true if ANY score < 7
 FLAG any shot exceeding word count limit in word_count_violations."""
 
+
+class DialogueCriticAgent(BaseStoryAgent):
+    """Critiques dialogue timing, delivery, and audio elements."""
+
+    cache_structured_responses = True
+
+    @property
+    def name(self) -> str:
+        return "STORYBOARD_DIALOGUE_CRITIC"
+
+    @property
+    def role(self) -> str:
+        return "Dialogue director and audio specialist"
+
+    @property
+    def system_prompt(self) -> str:
+        return DIALOGUE_CRITIC_SYSTEM_PROMPT
+
     def critique(
         self,
         storyboard: StoryboardSchema,
@@ -385,16 +412,17 @@ FLAG any shot exceeding word count limit in word_count_violations."""
         Returns:
             DialogueCritiqueSchema with scores and suggestions
         """
-        storyboard_json = storyboard.model_dump_json(indent=2)
+        storyboard_json = storyboard.model_dump_json()
+
+        reference = f"""CHARACTER REFERENCE:
+{character_context}
 
+"""
         prompt = f"""EVALUATE this storyboard for DIALOGUE and AUDIO quality:
 
 STORYBOARD:
 {storyboard_json}
 
-CHARACTER REFERENCE:
-{character_context}
-
 Score each dialogue/audio category 1-10.
 
 CRITICAL: Count words in each shot's dialogue!
@@ -406,27 +434,15 @@ Provide SPECIFIC suggestions for improvement.
 Check that parentheticals guide voice actors on tone.
 Verify SFX and music cues enhance the story."""
 
-        return self.invoke_structured(prompt, DialogueCritiqueSchema, max_tokens=1500)
+        return self.invoke_structured(prompt, DialogueCritiqueSchema, max_tokens=1500,
+                                      cacheable_prefix=reference)
 
 
 # =============================================================================
 # Continuity Critic Agent
 # =============================================================================
 
-class ContinuityCriticAgent(BaseStoryAgent):
-    """Critiques continuity and scene flow."""
-
-    @property
-    def name(self) -> str:
-        return "STORYBOARD_CONTINUITY_CRITIC"
-
-    @property
-    def role(self) -> str:
-        return "Script supervisor and continuity expert"
-
-    @property
-    def system_prompt(self) -> str:
-        return """You are a SCRIPT SUPERVISOR reviewing storyboard continuity.
+CONTINUITY_CRITIC_SYSTEM_PROMPT = """You are a SCRIPT SUPERVISOR reviewing storyboard continuity.
 
 EVALUATE THE STORYBOARD ON:
 
@@ -469,6 +485,24 @@ EVALUATE THE STORYBOARD ON:
 DECISION: needs_revision = true if ANY score < 7
 List specific continuity errors found."""
 
+
+class ContinuityCriticAgent(BaseStoryAgent):
+    """Critiques continuity and scene flow."""
+
+    cache_structured_responses = True
+
+    @property
+    def name(self) -> str:
+        return "STORYBOARD_CONTINUITY_CRITIC"
+
+    @property
+    def role(self) -> str:
+        return "Script supervisor and continuity expert"
+
+    @property
+    def system_prompt(self) -> str:
+        return CONTINUITY_CRITIC_SYSTEM_PROMPT
+
     def critique(
         self,
         storyboard: StoryboardSchema,
@@ -484,16 +518,17 @@ List specific continuity errors found."""
         Returns:
             ContinuityCritiqueSchema with scores and suggestions
         """
-        storyboard_json = storyboard.model_dump_json(indent=2)
+        storyboard_json = storyboard.model_dump_json()
 
+        reference = f"""ORIGINAL SCENE (reference):
+{scene_text}
+
+"""
         prompt = f"""EVALUATE this storyboard for CONTINUITY and FLOW:
 
 STORYBOARD:
 {storyboard_json}
 
-ORIGINAL SCENE (reference):
-{scene_text}
-
 Score each continuity category 1-10.
 List specific continuity errors in continuity_errors field.
 
@@ -506,69 +541,221 @@ Check:
 - Is there good shot variety for visual interest?
 - Does pacing match the emotional tone?"""
 
-        return self.invoke_structured(prompt, ContinuityCritiqueSchema, max_tokens=1500)
+        return self.invoke_structured(prompt, ContinuityCritiqueSchema, max_tokens=1500,
+                                      cacheable_prefix=reference)
+
+
+# =============================================================================
+# Combined Critic Agent
+# =============================================================================
+
+COMBINED_CRITIC_SYSTEM_PROMPT = f"""You review storyboards in THREE roles at once and return all three critiques.
+Score each role independently against its own criteria.
+
+## ROLE 1 - VISUAL (output field: visual)
+{VISUAL_CRITIC_SYSTEM_PROMPT}
+
+## ROLE 2 - DIALOGUE (output field: dialogue)
+{DIALOGUE_CRITIC_SYSTEM_PROMPT}
+
+## ROLE 3 - CONTINUITY (output field: continuity)
+{CONTINUITY_CRITIC_SYSTEM_PROMPT}"""
+
+
+class CombinedStoryboardCriticAgent(BaseStoryAgent):
+    """Runs the visual, dialogue and continuity critiques in a single call."""
+
+    cache_structured_responses = True
+
+    @property
+    def name(self) -> str:
+        return "STORYBOARD_COMBINED_CRITIC"
+
+    @property
+    def role(self) -> str:
+        return "Cinematographer, dialogue director and script supervisor"
+
+    @property
+    def system_prompt(self) -> str:
+        return COMBINED_CRITIC_SYSTEM_PROMPT
+
+    def critique(
+        self,
+        storyboard: StoryboardSchema,
+        location_context: str,
+        character_context: str,
+        scene_text: str,
+    ) -> CombinedStoryboardCritiqueSchema:
+        """
+        Critique storyboard for visual, dialogue and continuity quality.
+
+        Args:
+            storyboard: The storyboard to evaluate
+            location_context: Location details for reference
+            character_context: Character details for voice consistency
+            scene_text: Original scene for context reference
+
+        Returns:
+            CombinedStoryboardCritiqueSchema with all three critiques
+        """
+        storyboard_json = storyboard.model_dump_json()
+
+        # The references are the same every revision cycle; the storyboard is not
+        reference = f"""LOCATION REFERENCE:
+{location_context}
+
+CHARACTER REFERENCE:
+{character_context}
+
+ORIGINAL SCENE (reference):
+{scene_text}
+
+"""
+        prompt = f"""EVALUATE this storyboard in all three roles:
+
+STORYBOARD:
+{storyboard_json}
+
+VISUAL: Score each visual category 1-10. Provide SPECIFIC suggestions for shots
+scoring below 8. Be critical - only excellent visual direction should pass.
+
+DIALOGUE: Score each dialogue/audio category 1-10.
+CRITICAL: Count words in each shot's dialogue!
+- 10 sec shot = MAX 25 words
+- 15 sec shot = MAX 37 words
+- List any shots exceeding limits in word_count_violations
+
+CONTINUITY: Score each continuity category 1-10.
+List specific continuity errors in continuity_errors field."""
+
+        return self.invoke_structured(prompt, CombinedStoryboardCritiqueSchema, max_tokens=4000,
+                                      cacheable_prefix=reference)
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_character_context(character_names: list[str], all_characters: list[dict]) -> str:
-    """Extract relevant character details for storyboard context."""
-    relevant = []
-    for char in all_characters:
-        if char.get("name") in character_names:
-            char_id = char.get("id", "unknown")
-            relevant.append(
-                f"**{char.get('name')}** (ID: {char_id}): {char.get('gender', 'unknown')}, "
-                f"{char.get('age', 'unknown')}. "
-                f"Physical: {json.dumps(char.get('physical', {}), indent=2)}. "
-                f"Clothing: {char.get('clothing', 'unspecified')}. "
-                f"Traits: {', '.join(char.get('personality_traits', []))}."
-            )
-    return "\n".join(relevant) if relevant else "No character details available."
+# Serializes appends from concurrent scene workers, so records never interleave
+_jsonl_lock = threading.Lock()
 
 
-def build_character_id_map(all_characters: list[dict]) -> dict[str, str]:
-    """Build mapping from character name (uppercase) to ID."""
+def _append_jsonl(path: Path, record: dict) -> None:
+    """Append one record to a JSONL file (one compact JSON object per line)."""
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+    with _jsonl_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line)
+
+
+# Category score getters (each returns a tuple) for the approval threshold
+_VISUAL_SCORES = attrgetter(
+    "location_clarity_score",
+    "shot_composition_score",
+    "camera_work_score",
+    "lighting_time_score",
+    "character_blocking_score",
+    "visual_storytelling_score",
+)
+_DIALOGUE_SCORES = attrgetter(
+    "dialogue_length_score",
+    "delivery_notes_score",
+    "natural_flow_score",
+    "character_voice_score",
+    "audio_design_score",
+)
+_CONTINUITY_SCORES = attrgetter(
+    "shot_flow_score",
+    "character_continuity_score",
+    "location_continuity_score",
+    "story_context_score",
+    "pacing_rhythm_score",
+    "overall_coherence_score",
+)
+
+
+def _cached_lookups(items: list[dict], build: Callable[[list[dict]], dict]) -> dict:
+    """Build lookups over a codex list once, shared until the list changes or its codex index is invalidated."""
+    return get_codex_list_memo(items, build, lambda: build(items))
+
+
+def _build_character_lookups(all_characters: list[dict]) -> dict:
+    """Pre-format every character's context line and build the name -> ID map in one pass."""
+    lines_by_name = {}
     id_map = {}
-    for char in all_characters:
+    for position, char in enumerate(all_characters):
         name = char.get("name", "")
         char_id = char.get("id", "")
+        lines_by_name.setdefault(char.get("name"), []).append((position, (
+            f"**{char.get('name')}** (ID: {char.get('id', 'unknown')}): {char.get('gender', 'unknown')}, "
+            f"{char.get('age', 'unknown')}. "
+            f"Physical: {json.dumps(char.get('physical', {}), separators=(',', ':'))}. "
+            f"Clothing: {char.get('clothing', 'unspecified')}. "
+            f"Traits: {', '.join(char.get('personality_traits', []))}."
+        )))
         if name and char_id:
-            # Map both uppercase first name and full name
-            first_name = name.split()[0].upper() if name else ""
-            id_map[first_name] = char_id
-            id_map[name.upper()] = char_id
-            id_map[name] = char_id
-    return id_map
+            # Map both first name and full name (casefolded)
+            id_map[name.split()[0].casefold()] = char_id
+            id_map[name.casefold()] = char_id
 
+    return {
+        "lines_by_name": lines_by_name,  # name -> [(codex position, context line)]
+        "id_map": id_map,
+        "contexts": {},  # frozenset(character_names) -> joined context
+    }
 
-def build_location_id_map(all_locations: list[dict]) -> dict[str, str]:
-    """Build mapping from location name to ID."""
+
+def _build_location_lookups(all_locations: list[dict]) -> dict:
+    """Pre-format every location's context and build the name -> ID map in one pass."""
+    contexts = {}
     id_map = {}
     for loc in all_locations:
         name = loc.get("name", "")
         loc_id = loc.get("id", "")
+        # First location with a name wins, matching the original list scan
+        contexts.setdefault(loc.get("name"), (
+            f"**{loc.get('name')}** (ID: {loc.get('id', 'unknown')}) ({loc.get('type', 'location')})\n"
+            f"Description: {loc.get('description', 'No description')}\n"
+            f"Atmosphere: {loc.get('atmosphere', 'No atmosphere')}\n"
+            f"Key Features: {', '.join(loc.get('key_features', []))}\n"
+            f"Sensory: {loc.get('sensory_details', 'No sensory details')}"
+        ))
         if name and loc_id:
-            id_map[name] = loc_id
-            id_map[name.upper()] = loc_id
-    return id_map
+            id_map[name.casefold()] = loc_id
+
+    return {"contexts": contexts, "id_map": id_map}
+
+
+def get_character_context(character_names: list[str], all_characters: list[dict]) -> str:
+    """Extract relevant character details for storyboard context."""
+    lookups = _cached_lookups(all_characters, _build_character_lookups)
+    names = frozenset(character_names)
+
+    context = lookups["contexts"].get(names)
+    if context is None:
+        # Dict hits per requested name, re-sorted into codex order
+        lines_by_name = lookups["lines_by_name"]
+        relevant = [line for _, line in sorted(
+            entry for name in names for entry in lines_by_name.get(name, ())
+        )]
+        context = "\n".join(relevant) if relevant else "No character details available."
+        lookups["contexts"][names] = context
+    return context
+
+
+def build_character_id_map(all_characters: list[dict]) -> dict[str, str]:
+    """Build mapping from casefolded character name (full or first) to ID (shared; do not mutate)."""
+    return _cached_lookups(all_characters, _build_character_lookups)["id_map"]
+
+
+def build_location_id_map(all_locations: list[dict]) -> dict[str, str]:
+    """Build mapping from casefolded location name to ID (shared; do not mutate)."""
+    return _cached_lookups(all_locations, _build_location_lookups)["id_map"]
 
 
 def get_location_context(location_name: str, all_locations: list[dict]) -> str:
     """Extract relevant location details for storyboard context."""
-    for loc in all_locations:
-        if loc.get("name") == location_name:
-            loc_id = loc.get("id", "unknown")
-            return (
-                f"**{loc.get('name')}** (ID: {loc_id}) ({loc.get('type', 'location')})\n"
-                f"Description: {loc.get('description', 'No description')}\n"
-                f"Atmosphere: {loc.get('atmosphere', 'No atmosphere')}\n"
-                f"Key Features: {', '.join(loc.get('key_features', []))}\n"
-                f"Sensory: {loc.get('sensory_details', 'No sensory details')}"
-            )
-    return f"Location '{location_name}' - no details available."
+    context = _cached_lookups(all_locations, _build_location_lookups)["contexts"].get(location_name)
+    return context or f"Location '{location_name}' - no details available."
 
 
 # =============================================================================
@@ -584,6 +771,12 @@ def generate_scene_storyboard(
     all_locations: list[dict],
     model: str = DEFAULT_MODEL,
     max_revisions: int = 2,
+    critique_log: Optional[Path] = None,
+    combined_critique: bool = True,
+    char_id_map: Optional[dict[str, str]] = None,
+    loc_id_map: Optional[dict[str, str]] = None,
+    skip_final_critique: bool = True,
+    log: Callable[[str], None] = print,
 ) -> dict:
     """
     Generate a storyboard for a single scene using creator + 3 critics.
@@ -597,6 +790,18 @@ def generate_scene_storyboard(
         all_locations: Full location profiles from codex
         model: LLM model to use
         max_revisions: Max critique-revision cycles
+        critique_log: Optional JSONL file; each cycle's critiques are appended
+            as they are produced, so they survive an interrupted run
+        combined_critique: Get all three critiques from one call (one copy of the
+            storyboard in the prompt) instead of three concurrent critic calls
+        char_id_map: Prebuilt casefolded name -> ID map for all_characters
+            (default: build_character_id_map, itself cached per list)
+        loc_id_map: Prebuilt casefolded name -> ID map for all_locations
+            (default: build_location_id_map)
+        skip_final_critique: Skip the last cycle's critique of a revised
+            storyboard, which can no longer trigger a revision; metadata's
+            critique_history then omits that terminal cycle
+        log: Progress output (default print; concurrent callers pass a per-scene buffer)
 
     Returns:
         Dict with:
@@ -608,12 +813,13 @@ def generate_scene_storyboard(
     visual_critic = VisualCriticAgent(model=model)
     dialogue_critic = DialogueCriticAgent(model=model)
     continuity_critic = ContinuityCriticAgent(model=model)
+    combined_critic = CombinedStoryboardCriticAgent(model=model)
 
     # Get relevant context
     char_context = get_character_context(scene_characters, all_characters)
     loc_context = get_location_context(scene_location, all_locations)
 
-    print(f"    Creating storyboard for: {scene_id}")
+    log(f"    Creating storyboard for: {scene_id}")
 
     # Initial storyboard generation
     storyboard = creator.create_storyboard(
@@ -628,119 +834,124 @@ def generate_scene_storyboard(
     critique_history = []
     revision_count = 0
 
-    # Critique-revision loop
-    for i in range(max_revisions):
-        print(f"      Critique cycle {i + 1}/{max_revisions}...")
-
-        # Get critiques from all 3 critics
-        visual_crit = visual_critic.critique(storyboard, loc_context)
-        dialogue_crit = dialogue_critic.critique(storyboard, char_context)
-        continuity_crit = continuity_critic.critique(storyboard, scene_text)
-
-        # Check if any revision needed
-        any_needs_revision = (
-            visual_crit.needs_revision or
-            dialogue_crit.needs_revision or
-            continuity_crit.needs_revision
-        )
-
-        # Collect all scores
-        all_scores = [
-            visual_crit.location_clarity_score,
-            visual_crit.shot_composition_score,
-            visual_crit.camera_work_score,
-            visual_crit.lighting_time_score,
-            visual_crit.character_blocking_score,
-            visual_crit.visual_storytelling_score,
-            dialogue_crit.dialogue_length_score,
-            dialogue_crit.delivery_notes_score,
-            dialogue_crit.natural_flow_score,
-            dialogue_crit.character_voice_score,
-            dialogue_crit.audio_design_score,
-            continuity_crit.shot_flow_score,
-            continuity_crit.character_continuity_score,
-            continuity_crit.location_continuity_score,
-            continuity_crit.story_context_score,
-            continuity_crit.pacing_rhythm_score,
-            continuity_crit.overall_coherence_score,
-        ]
-        min_score = min(all_scores)
-
-        # Store critique history
-        critique_history.append({
-            "cycle": i + 1,
-            "visual": {
-                "location_clarity": visual_crit.location_clarity_score,
-                "shot_composition": visual_crit.shot_composition_score,
-                "camera_work": visual_crit.camera_work_score,
-                "lighting_time": visual_crit.lighting_time_score,
-                "character_blocking": visual_crit.character_blocking_score,
-                "visual_storytelling": visual_crit.visual_storytelling_score,
-                "overall": visual_crit.overall_score,
-                "needs_revision": visual_crit.needs_revision,
-                "suggestions": visual_crit.suggestions,
-            },
-            "dialogue": {
-                "dialogue_length": dialogue_crit.dialogue_length_score,
-                "delivery_notes": dialogue_crit.delivery_notes_score,
-                "natural_flow": dialogue_crit.natural_flow_score,
-                "character_voice": dialogue_crit.character_voice_score,
-                "audio_design": dialogue_crit.audio_design_score,
-                "overall": dialogue_crit.overall_score,
-                "needs_revision": dialogue_crit.needs_revision,
-                "word_count_violations": dialogue_crit.word_count_violations,
-                "suggestions": dialogue_crit.suggestions,
-            },
-            "continuity": {
-                "shot_flow": continuity_crit.shot_flow_score,
-                "character_continuity": continuity_crit.character_continuity_score,
-                "location_continuity": continuity_crit.location_continuity_score,
-                "story_context": continuity_crit.story_context_score,
-                "pacing_rhythm": continuity_crit.pacing_rhythm_score,
-                "overall_coherence": continuity_crit.overall_coherence_score,
-                "overall": continuity_crit.overall_score,
-                "needs_revision": continuity_crit.needs_revision,
-                "continuity_errors": continuity_crit.continuity_errors,
-                "suggestions": continuity_crit.suggestions,
-            },
-            "min_score": min_score,
-            "any_needs_revision": any_needs_revision,
-        })
-
-        # Check if approved
-        if not any_needs_revision and min_score >= 7:
-            print(f"      Approved! Min score: {min_score}")
-            break
-
-        # Revise if not last cycle
-        if i < max_revisions - 1:
-            print(f"      Revising (min score: {min_score})...")
-            storyboard = creator.revise_storyboard(
-                current_storyboard=storyboard,
-                visual_critique=visual_crit,
-                dialogue_critique=dialogue_crit,
-                continuity_critique=continuity_crit,
-                scene_text=scene_text,
+    # By default one combined call returns all 3 critiques. Otherwise the 3
+    # critics are independent calls on the same storyboard, so each cycle
+    # submits all of them first and then collects (latency = slowest)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Critique-revision loop
+        for i in range(max_revisions):
+            if skip_final_critique and 0 < i == max_revisions - 1:
+                # This critique could only be recorded, not acted on
+                log(f"      Skipping final critique cycle {i + 1}/{max_revisions}")
+                break
+
+            log(f"      Critique cycle {i + 1}/{max_revisions}...")
+
+            # Get critiques from all 3 critics
+            if combined_critique:
+                combined = combined_critic.critique(storyboard, loc_context, char_context, scene_text)
+                visual_crit = combined.visual
+                dialogue_crit = combined.dialogue
+                continuity_crit = combined.continuity
+            else:
+                visual_future = executor.submit(visual_critic.critique, storyboard, loc_context)
+                dialogue_future = executor.submit(dialogue_critic.critique, storyboard, char_context)
+                continuity_future = executor.submit(continuity_critic.critique, storyboard, scene_text)
+                visual_crit = visual_future.result()
+                dialogue_crit = dialogue_future.result()
+                continuity_crit = continuity_future.result()
+
+            # Check if any revision needed
+            any_needs_revision = (
+                visual_crit.needs_revision or
+                dialogue_crit.needs_revision or
+                continuity_crit.needs_revision
+            )
+
+            # Lowest of the 17 category scores across the three critiques
+            min_score = min(
+                *_VISUAL_SCORES(visual_crit),
+                *_DIALOGUE_SCORES(dialogue_crit),
+                *_CONTINUITY_SCORES(continuity_crit),
             )
-            revision_count += 1
+
+            # Store critique history
+            critique_history.append({
+                "cycle": i + 1,
+                "visual": {
+                    "location_clarity": visual_crit.location_clarity_score,
+                    "shot_composition": visual_crit.shot_composition_score,
+                    "camera_work": visual_crit.camera_work_score,
+                    "lighting_time": visual_crit.lighting_time_score,
+                    "character_blocking": visual_crit.character_blocking_score,
+                    "visual_storytelling": visual_crit.visual_storytelling_score,
+                    "overall": visual_crit.overall_score,
+                    "needs_revision": visual_crit.needs_revision,
+                    "suggestions": visual_crit.suggestions,
+                },
+                "dialogue": {
+                    "dialogue_length": dialogue_crit.dialogue_length_score,
+                    "delivery_notes": dialogue_crit.delivery_notes_score,
+                    "natural_flow": dialogue_crit.natural_flow_score,
+                    "character_voice": dialogue_crit.character_voice_score,
+                    "audio_design": dialogue_crit.audio_design_score,
+                    "overall": dialogue_crit.overall_score,
+                    "needs_revision": dialogue_crit.needs_revision,
+                    "word_count_violations": dialogue_crit.word_count_violations,
+                    "suggestions": dialogue_crit.suggestions,
+                },
+                "continuity": {
+                    "shot_flow": continuity_crit.shot_flow_score,
+                    "character_continuity": continuity_crit.character_continuity_score,
+                    "location_continuity": continuity_crit.location_continuity_score,
+                    "story_context": continuity_crit.story_context_score,
+                    "pacing_rhythm": continuity_crit.pacing_rhythm_score,
+                    "overall_coherence": continuity_crit.overall_coherence_score,
+                    "overall": continuity_crit.overall_score,
+                    "needs_revision": continuity_crit.needs_revision,
+                    "continuity_errors": continuity_crit.continuity_errors,
+                    "suggestions": continuity_crit.suggestions,
+                },
+                "min_score": min_score,
+                "any_needs_revision": any_needs_revision,
+            })
+            if critique_log is not None:
+                _append_jsonl(critique_log, {"scene_id": scene_id, **critique_history[-1]})
+
+            # Check if approved
+            if not any_needs_revision and min_score >= 7:
+                log(f"      Approved! Min score: {min_score}")
+                break
+
+            # Revise if not last cycle
+            if i < max_revisions - 1:
+                log(f"      Revising (min score: {min_score})...")
+                storyboard = creator.revise_storyboard(
+                    current_storyboard=storyboard,
+                    visual_critique=visual_crit,
+                    dialogue_critique=dialogue_crit,
+                    continuity_critique=continuity_crit,
+                    scene_text=scene_text,
+                )
+                revision_count += 1
 
     # Post-process: Add character_ids and location_id to each shot
-    char_id_map = build_character_id_map(all_characters)
-    loc_id_map = build_location_id_map(all_locations)
+    if char_id_map is None:
+        char_id_map = build_character_id_map(all_characters)
+    if loc_id_map is None:
+        loc_id_map = build_location_id_map(all_locations)
 
     # Get the location ID for this scene - all shots in a scene share the same location
     # Use scene_location (the codex location name) since shot locations may have different names
-    scene_location_id = loc_id_map.get(scene_location)
+    scene_location_id = loc_id_map.get(scene_location.casefold(), "")
 
     storyboard_dict = storyboard.model_dump()
     for shot in storyboard_dict.get("shots", []):
         # Map characters_in_frame names to IDs
-        char_ids = []
-        for char_name in shot.get("characters_in_frame", []):
-            char_id = char_id_map.get(char_name) or char_id_map.get(char_name.upper())
-            if char_id:
-                char_ids.append(char_id)
-        shot["character_ids"] = char_ids
+        shot["character_ids"] = [
+            char_id for char_name in shot.get("characters_in_frame", [])
+            if (char_id := char_id_map.get(char_name.casefold()))
+        ]
 
         # Use scene location ID for all shots in this scene
         shot["location_id"] = scene_location_id
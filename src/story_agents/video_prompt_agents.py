@@ -18,15 +18,27 @@ Based on:
 - LTX Studio Blog: https://ltx.studio/blog/how-to-write-a-prompt
 """
 
+import copy
+import hashlib
 import json
-from typing import Optional
-
-from langchain_openai import ChatOpenAI
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Optional
+
+from langchain_core.messages import HumanMessage
 from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
 
-from src.story_schemas import VideoPromptSchema, VideoPromptCritiqueSchema
-from src.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, DEFAULT_MODEL
+from src.llm_cache import (
+    cached_instance, cached_structured_call, get_llm_cache, make_cache_key, schema_fingerprint, structured_cache_key,
+)
+from src.story_agents.base_story_agent import cacheable_system_message, get_llm
+from src.story_agents.codex_index import get_codex_index, get_codex_memo, get_codex_tools
+from src.story_schemas import VideoPromptSchema, VideoPromptCritiqueSchema, VideoPromptAndCritiqueSchema
+from src.config import CRITIC_MODEL, DEFAULT_MODEL, MAX_CONCURRENT_LLM_REQUESTS
 
 
 # =============================================================================
@@ -43,8 +55,41 @@ def create_codex_tools(codex: dict) -> list:
     Returns:
         List of tool functions with codex data in closure
     """
-    characters = codex.get("story", {}).get("characters", [])
-    locations = codex.get("story", {}).get("locations", [])
+    index = get_codex_index(codex)
+    characters = index.characters
+    locations = index.locations
+
+    # Tool responses are static per codex, so serialize them once up front
+    # (keyed by id() of the codex entry; the index keeps the entries alive)
+    char_json = {}
+    for char in characters:
+        physical = char.get("physical", {})
+        char_json[id(char)] = json.dumps({
+            "name": char.get("name"),
+            "gender": char.get("gender", ""),
+            "age": char.get("age", ""),
+            "height": physical.get("height", ""),
+            "build": physical.get("build", ""),
+            "hair_color": physical.get("hair_color", ""),
+            "eye_color": physical.get("eye_color", ""),
+            "distinguishing_features": physical.get("distinguishing_features", ""),
+            "clothing": char.get("clothing", ""),
+            "personality_traits": char.get("personality_traits", []),
+        }, separators=(",", ":"))
+
+    loc_json = {
+        id(loc): json.dumps({
+            "name": loc.get("name"),
+            "type": loc.get("type", ""),
+            "description": loc.get("description", ""),
+            "atmosphere": loc.get("atmosphere", ""),
+            "key_features": loc.get("key_features", []),
+            "sensory_details": loc.get("sensory_details", ""),
+        }, separators=(",", ":"))
+        for loc in locations
+    }
+    all_characters_text = f"Available characters: {[c.get('name', 'Unknown') for c in characters]}"
+    all_locations_text = f"Available locations: {[l.get('name', 'Unknown') for l in locations]}"
 
     @tool
     def get_character_description(character_name: str) -> str:
@@ -56,44 +101,15 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             character_name: The character's name (case-insensitive search)
         """
-        name_lower = character_name.lower().strip()
-
-        for char in characters:
-            if char.get("name", "").lower().strip() == name_lower:
-                physical = char.get("physical", {})
-                result = {
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        # Try partial match
-        for char in characters:
-            if name_lower in char.get("name", "").lower():
-                physical = char.get("physical", {})
-                result = {
-                    "name": char.get("name"),
-                    "gender": char.get("gender", ""),
-                    "age": char.get("age", ""),
-                    "height": physical.get("height", ""),
-                    "build": physical.get("build", ""),
-                    "hair_color": physical.get("hair_color", ""),
-                    "eye_color": physical.get("eye_color", ""),
-                    "distinguishing_features": physical.get("distinguishing_features", ""),
-                    "clothing": char.get("clothing", ""),
-                    "personality_traits": char.get("personality_traits", []),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Character '{character_name}' not found in codex. Available characters: {[c.get('name') for c in characters]}"
+        char = index.find_character(character_name)
+        if char:
+            return char_json[id(char)]
+
+        # Closest names only; list_all_characters has the full cast
+        return (
+            f"Character '{character_name}' not found in codex. "
+            f"Closest matches: {index.closest_character_names(character_name)}"
+        )
 
     @tool
     def get_location_description(location_name: str) -> str:
@@ -105,22 +121,14 @@ def create_codex_tools(codex: dict) -> list:
         Args:
             location_name: The location name (case-insensitive, partial match)
         """
-        name_lower = location_name.lower().strip()
-
-        for loc in locations:
-            loc_name = loc.get("name", "").lower().strip()
-            if loc_name == name_lower or name_lower in loc_name or loc_name in name_lower:
-                result = {
-                    "name": loc.get("name"),
-                    "type": loc.get("type", ""),
-                    "description": loc.get("description", ""),
-                    "atmosphere": loc.get("atmosphere", ""),
-                    "key_features": loc.get("key_features", []),
-                    "sensory_details": loc.get("sensory_details", ""),
-                }
-                return json.dumps(result, indent=2)
-
-        return f"Location '{location_name}' not found in codex. Available locations: {[l.get('name') for l in locations]}"
+        loc = index.find_location(location_name)
+        if loc:
+            return loc_json[id(loc)]
+
+        return (
+            f"Location '{location_name}' not found in codex. "
+            f"Closest matches: {index.closest_location_names(location_name)}"
+        )
 
     @tool
     def list_all_characters() -> str:
@@ -128,8 +136,7 @@ def create_codex_tools(codex: dict) -> list:
         List all character names in the codex.
         Use this to see what characters are available before fetching details.
         """
-        names = [c.get("name", "Unknown") for c in characters]
-        return f"Available characters: {names}"
+        return all_characters_text
 
     @tool
     def list_all_locations() -> str:
@@ -137,8 +144,7 @@ def create_codex_tools(codex: dict) -> list:
         List all location names in the codex.
         Use this to see what locations are available before fetching details.
         """
-        names = [l.get("name", "Unknown") for l in locations]
-        return f"Available locations: {names}"
+        return all_locations_text
 
     return [get_character_description, get_location_description, list_all_characters, list_all_locations]
 
@@ -222,7 +228,14 @@ Physical-descriptor character tag (parenthetical delivery note):
 - If a visual style is specified (prefix/suffix), integrate it naturally into the prompt
 - Style prefix should influence the opening description
 - Style suffix should be woven into quality/aesthetic descriptions
-- Visual descriptions should match the specified art style aesthetic"""
+- Visual descriptions should match the specified art style aesthetic
+
+## FINAL CHECKLIST (every prompt):
+- NEVER use character names - only physical descriptions
+- Dialogue tags must use physical descriptors like "Auburn-haired woman (softly):"
+- 500-800 words total
+- Include ambient sounds and music cues in description
+- If visual style provided, integrate style keywords naturally into descriptions"""
 
 
 VIDEO_CRITIC_SYSTEM_PROMPT = """You are a CRITICAL reviewer of LTX video prompts in screenplay format.
@@ -235,45 +248,12 @@ Your job is to validate prompts against the original codex data, ensure quality
 3. Physical descriptions are accurate (hair color, eye color, distinguishing features)
 
 ## EVALUATION CRITERIA (Score 1-10 each):
-
-1. **SCREENPLAY_FORMAT** (Score 1-10)
-   - Does it have a proper slugline (INT/EXT. LOCATION – TIME – SHOT)?
-   - Is scene description in paragraph form?
-   - Is dialogue properly formatted with physical descriptor tags?
-   - Are parentheticals present for delivery notes?
-
-2. **CHARACTER_DESCRIPTION** (Score 1-10)
-   - Are physical descriptions accurate to codex?
-   - Is clothing consistent with character profile?
-   - Are distinguishing features included?
-   - Score LOW if character names are used instead of descriptions!
-
-3. **CAMERA_MOVEMENT** (Score 1-10)
-   - Are camera directions specific (dolly, pan, track)?
-   - Do movements match the shot's camera_movement field?
-   - Is the visual progression clear?
-
-4. **ATMOSPHERE_DETAIL** (Score 1-10)
-   - Is lighting described (quality, direction, color)?
-   - Is mood/atmosphere captured?
-   - Are sensory details present (sounds, weather)?
-   - Does it match time_of_day from shot data?
-
-5. **DIALOGUE_ACCURACY** (Score 1-10)
-   - If dialogue present, does it match the shot's dialogue field?
-   - Are speaker tags using physical descriptions?
-   - Are parentheticals appropriate for tone/delivery?
-   - Score 10 if no dialogue in shot and none in prompt
-
-6. **NO_NAMES** (Score 1-10) - CRITICAL!
-   - Score 10 if NO character names appear anywhere
-   - Score 1 if ANY character name is used
-   - Check both description AND dialogue tags
-   - This is a HARD requirement!
+Score each field of the response schema; its field descriptions are the rubric.
+NO_NAMES is CRITICAL: 10 only if no character name appears anywhere, including
+dialogue tags, otherwise 1.
 
 ## DECISION RULES:
-- If ANY score is below 7, mark needs_revision = true
-- If no_names_score < 10, DEFINITELY needs_revision = true
+- Any score below 7 (or no_names_score below 10) sends the prompt back for revision
 - Provide SPECIFIC suggestions referencing codex data
 
 ## VISUAL STYLE CHECKING:
@@ -282,6 +262,48 @@ Your job is to validate prompts against the original codex data, ensure quality
 - Verify style keywords are present in appropriate context"""
 
 
+# =============================================================================
+# Agent invocation helpers
+# =============================================================================
+
+def _agent_messages(system_prompt: str, user_prompt: str, model: str) -> dict:
+    """Build the ReAct agent input for one system/user prompt pair."""
+    return {
+        "messages": [
+            cacheable_system_message(system_prompt, model),
+            HumanMessage(content=user_prompt),
+        ]
+    }
+
+
+def _cache_key_parts(agent, system_prompt: str, user_prompt: str) -> dict:
+    """
+    Everything that determines an agent's structured response.
+
+    The tools read the codex, so its fingerprint stands in for the tool
+    replies; identical shots (same prompt) resolve to the same key.
+    """
+    return {
+        "model": agent.model_name,
+        "temperature": agent.temperature,
+        "system": system_prompt,
+        "user": user_prompt,
+        "codex": get_codex_index(agent.codex).fingerprint,
+    }
+
+
+def _invoke_cached(agent, schema, system_prompt: str, user_prompt: str, graph=None):
+    """Run agent.agent (or graph) on one prompt, reusing a cached structured response when available."""
+    graph = graph or agent.agent
+    return cached_structured_call(
+        schema,
+        lambda: graph.invoke(
+            _agent_messages(system_prompt, user_prompt, agent.model_name)
+        )["structured_response"],
+        **_cache_key_parts(agent, system_prompt, user_prompt),
+    )
+
+
 # =============================================================================
 # Video Prompt Creator Agent
 # =============================================================================
@@ -300,35 +322,162 @@ class VideoPromptCreatorAgent:
         self.temperature = temperature
         self.codex = codex
 
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
+
+        # Tools are built once per codex and shared across agent instances
+        self.tools = get_codex_tools(codex, create_codex_tools)
+
+        # Compiled ReAct graph (tools + response_format for guaranteed structured
+        # output), built once per (codex, model, temperature) and shared
+        self.agent = get_codex_memo(
+            codex,
+            (create_react_agent, VideoPromptSchema, model, temperature),
+            lambda: create_react_agent(
+                model=self.llm,
+                tools=self.tools,
+                response_format=VideoPromptSchema,
+            ),
         )
 
-        self.tools = create_codex_tools(codex)
+    def create_video_prompt(
+        self,
+        shot_data: dict,
+        scene_context: str = "",
+        visual_style: dict = None,
+        shot_json: str = None,
+    ) -> VideoPromptSchema:
+        """
+        Generate an LTX-style screenplay prompt for a shot.
+
+        Args:
+            shot_data: Shot dict with all screenplay fields
+            scene_context: Additional scene context
+            visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
-        # Create ReAct agent with tools AND response_format
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=VideoPromptSchema,
+        Returns:
+            VideoPromptSchema with video_prompt and metadata
+        """
+        return _invoke_cached(
+            self, VideoPromptSchema, VIDEO_CREATOR_SYSTEM_PROMPT,
+            self._create_prompt(shot_data, scene_context, visual_style, shot_json),
         )
 
-    def create_video_prompt(self, shot_data: dict, scene_context: str = "", visual_style: dict = None) -> VideoPromptSchema:
+    def create_and_selfcritique(
+        self,
+        shot_data: dict,
+        scene_context: str = "",
+        visual_style: dict = None,
+        shot_json: str = None,
+    ) -> VideoPromptAndCritiqueSchema:
         """
-        Generate an LTX-style screenplay prompt for a shot.
+        Generate a video prompt and score it against the critic's criteria in one agent run.
 
         Args:
             shot_data: Shot dict with all screenplay fields
             scene_context: Additional scene context
             visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
         Returns:
-            VideoPromptSchema with video_prompt and metadata
+            VideoPromptAndCritiqueSchema with the prompt and its self-critique
+        """
+        # Same tools, different response_format; built once per codex like self.agent
+        graph = get_codex_memo(
+            self.codex,
+            (create_react_agent, VideoPromptAndCritiqueSchema, self.model_name, self.temperature),
+            lambda: create_react_agent(
+                model=self.llm,
+                tools=self.tools,
+                response_format=VideoPromptAndCritiqueSchema,
+            ),
+        )
+
+        user_prompt = self._create_prompt(shot_data, scene_context, visual_style, shot_json) + f"""
+
+## SELF-CRITIQUE (field: critique)
+Put the prompt in field: prompt. Then score it strictly (1-10 each) as an
+independent reviewer would, against the codex data from the tools:
+screenplay format, character description, camera movement
+({shot_data.get('camera_movement', 'UNKNOWN')}), atmosphere detail (time of day:
+{shot_data.get('time_of_day', 'UNKNOWN')}), dialogue accuracy, and no_names
+(10 if none of {shot_data.get('characters_in_frame', [])} appear anywhere, 1 if any do).
+
+Do not inflate scores."""
+
+        return _invoke_cached(
+            self, VideoPromptAndCritiqueSchema, VIDEO_CREATOR_SYSTEM_PROMPT, user_prompt, graph=graph
+        )
+
+    def create_video_prompts_batch(
+        self,
+        shots: list[dict],
+        scene_context: str = "",
+        visual_style: dict = None,
+        shot_jsons: list[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    ) -> list:
+        """
+        Generate initial video prompts for many shots in one batched submission.
+
+        Args:
+            shots: Shot dicts (see create_video_prompt)
+            scene_context: Additional scene context shared by the shots
+            visual_style: Visual style dict with name, prefix, suffix
+            shot_jsons: Pre-serialized shots, aligned with shots
+            max_concurrency: Maximum agent runs in flight at once
+
+        Returns:
+            List aligned with shots: VideoPromptSchema, or the Exception
+            raised for that shot
         """
-        shot_json = json.dumps(shot_data, indent=2)
+        shot_jsons = shot_jsons or [None] * len(shots)
+        user_prompts = [
+            self._create_prompt(shot, scene_context, visual_style, shot_json)
+            for shot, shot_json in zip(shots, shot_jsons)
+        ]
+
+        # Cached (and repeated) prompts are answered without a run
+        cache = get_llm_cache()
+        keys = [
+            structured_cache_key(VideoPromptSchema, **_cache_key_parts(self, VIDEO_CREATOR_SYSTEM_PROMPT, p))
+            for p in user_prompts
+        ]
+
+        results = []
+        misses = {}  # key -> indices sharing it
+        for i, key in enumerate(keys):
+            hit = cached_instance(cache, key, VideoPromptSchema)
+            results.append(hit)
+            if hit is None:
+                misses.setdefault(key, []).append(i)
+
+        if misses:
+            firsts = [indices[0] for indices in misses.values()]
+            responses = self.agent.batch(
+                [_agent_messages(VIDEO_CREATOR_SYSTEM_PROMPT, user_prompts[i], self.model_name) for i in firsts],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+            for (key, indices), response in zip(misses.items(), responses):
+                if not isinstance(response, Exception):
+                    response = response["structured_response"]
+                    cache.set(key, response.model_dump())
+                for i in indices:
+                    results[i] = response
+
+        return results
+
+    def _create_prompt(
+        self,
+        shot_data: dict,
+        scene_context: str = "",
+        visual_style: dict = None,
+        shot_json: str = None,
+    ) -> str:
+        """Build the user message for create_video_prompt."""
+        shot_json = shot_json or json.dumps(shot_data, separators=(",", ":"))
 
         # Extract style components
         style_info = ""
@@ -342,19 +491,22 @@ STYLE PREFIX (integrate naturally): {style_prefix}
 STYLE SUFFIX (weave into descriptions): {style_suffix}
 """
 
-        user_prompt = f"""Generate an LTX-style SCREENPLAY VIDEO PROMPT for this shot.
+        # Scene-wide parts first, so every shot in a scene sends an identical
+        # prefix after the system prompt (provider prefix caching)
+        user_prompt = f"""## SCENE CONTEXT:
+{scene_context if scene_context else "Opening shot of scene."}
+{style_info}
+Generate an LTX-style SCREENPLAY VIDEO PROMPT for this shot.
 
 ## SHOT DATA:
 {shot_json}
 
-## SCENE CONTEXT:
-{scene_context if scene_context else "Opening shot of scene."}
-{style_info}
 ## INSTRUCTIONS:
 
-1. FIRST: Use get_character_description tool for EACH character in characters_in_frame
-2. SECOND: Use get_location_description tool for the location
-3. THIRD: Generate the screenplay-format prompt
+1. FIRST: In ONE response, call get_character_description for EACH character in
+   characters_in_frame AND get_location_description for the location, all together
+   as parallel tool calls (do not fetch them one at a time)
+2. THEN: Generate the screenplay-format prompt
 
 ## FORMAT TO FOLLOW:
 
@@ -370,28 +522,17 @@ Physical-descriptor (parenthetical):
 
 [Camera movement: {shot_data.get('camera_movement', 'STATIC')}]
 
-CRITICAL:
-- NEVER use character names - only physical descriptions
-- Dialogue tags must use physical descriptors like "Auburn-haired woman (softly):"
-- 500-800 words total
-- Include ambient sounds and music cues in description
-- If visual style provided, integrate style keywords naturally into descriptions"""
-
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": VIDEO_CREATOR_SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt}
-            ]
-        })
+Follow the FINAL CHECKLIST from your instructions."""
 
-        return result["structured_response"]
+        return user_prompt
 
     def revise_video_prompt(
         self,
         original: VideoPromptSchema,
         critique: VideoPromptCritiqueSchema,
         shot_data: dict,
-        visual_style: dict = None
+        visual_style: dict = None,
+        shot_json: str = None,
     ) -> VideoPromptSchema:
         """
         Revise video prompt based on critic feedback.
@@ -401,11 +542,13 @@ CRITICAL:
             critique: Critic's evaluation
             shot_data: Original shot data
             visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
         Returns:
             Revised VideoPromptSchema
         """
         suggestions = "\n".join(f"- {s}" for s in critique.suggestions)
+        shot_json = shot_json or json.dumps(shot_data, separators=(",", ":"))
 
         # Extract style components
         style_info = ""
@@ -436,23 +579,69 @@ REMINDER: Weave these quality tags into descriptions: {style_suffix}
 {suggestions}
 
 ## SHOT DATA (reference):
-{json.dumps(shot_data, indent=2)}
+{shot_json}
 {style_info}
-FIRST: Use the tools to re-fetch character and location data.
+FIRST: Re-fetch character and location data with ALL tool calls in ONE response
+(parallel tool calls: every character plus the location).
 THEN: Create an IMPROVED prompt addressing ALL concerns.
 
 CRITICAL: If no_names_score < 10, remove ALL character names and replace with physical descriptions!
 This includes dialogue tags - use "Auburn-haired woman:" not names!
 CRITICAL: Ensure visual style is naturally integrated into descriptions."""
 
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": VIDEO_CREATOR_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-        })
+        return _invoke_cached(self, VideoPromptSchema, VIDEO_CREATOR_SYSTEM_PROMPT, prompt)
+
+    def revise_targeted(
+        self,
+        original: VideoPromptSchema,
+        critique: VideoPromptCritiqueSchema,
+        shot_data: dict,
+        dimension: str,
+        visual_style: dict = None,
+        shot_json: str = None,
+    ) -> VideoPromptSchema:
+        """
+        Revise a video prompt to fix a single failing critique dimension.
+
+        Args:
+            original: Original prompt to revise
+            critique: Critic's evaluation
+            shot_data: Original shot data
+            dimension: final_scores key of the dimension to fix (e.g. "no_names")
+            visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
+
+        Returns:
+            Revised VideoPromptSchema
+        """
+        suggestions = "\n".join(f"- {s}" for s in critique.suggestions)
+        shot_json = shot_json or json.dumps(shot_data, separators=(",", ":"))
+        label = dimension.replace("_", " ").upper()
+        score = getattr(critique, f"{dimension}_score")
+
+        style_info = ""
+        if visual_style:
+            style_info = f"""
+## VISUAL STYLE: {visual_style.get("name", "Anime")} (keep it as already integrated)
+"""
+
+        prompt = f"""REVISE this video prompt to fix ONE problem: {label} (scored {score}/10).
+
+## ORIGINAL VIDEO PROMPT:
+{original.video_prompt}
 
-        return result["structured_response"]
+## CRITIC SUGGESTIONS (act only on those about {label}):
+{suggestions}
+
+## SHOT DATA (reference):
+{shot_json}
+{style_info}
+FIRST: Fetch the codex data you need with ALL tool calls in ONE response (parallel tool calls).
+THEN: Fix {label} and keep everything else in the prompt as it is.
+
+CRITICAL: Never introduce character names - use physical descriptions, including in dialogue tags!"""
+
+        return _invoke_cached(self, VideoPromptSchema, VIDEO_CREATOR_SYSTEM_PROMPT, prompt)
 
 
 # =============================================================================
@@ -473,26 +662,30 @@ class VideoPromptCriticAgent:
         self.temperature = temperature
         self.codex = codex
 
-        self.llm = ChatOpenAI(
-            model=model,
-            api_key=OPENROUTER_API_KEY,
-            base_url=OPENROUTER_BASE_URL,
-            temperature=temperature,
-        )
-
-        self.tools = create_codex_tools(codex)
-
-        self.agent = create_react_agent(
-            model=self.llm,
-            tools=self.tools,
-            response_format=VideoPromptCritiqueSchema,
+        # Shared client per (model, temperature)
+        self.llm = get_llm(model, temperature)
+
+        # Tools are built once per codex and shared across agent instances
+        self.tools = get_codex_tools(codex, create_codex_tools)
+
+        # Compiled ReAct graph (tools + response_format for guaranteed structured
+        # output), built once per (codex, model, temperature) and shared
+        self.agent = get_codex_memo(
+            codex,
+            (create_react_agent, VideoPromptCritiqueSchema, model, temperature),
+            lambda: create_react_agent(
+                model=self.llm,
+                tools=self.tools,
+                response_format=VideoPromptCritiqueSchema,
+            ),
         )
 
     def critique(
         self,
         video_prompt: VideoPromptSchema,
         shot_data: dict,
-        visual_style: dict = None
+        visual_style: dict = None,
+        shot_json: str = None,
     ) -> VideoPromptCritiqueSchema:
         """
         Evaluate video prompt for accuracy and quality.
@@ -501,10 +694,13 @@ class VideoPromptCriticAgent:
             video_prompt: The prompt to critique
             shot_data: Original shot data
             visual_style: Visual style dict with name, prefix, suffix
+            shot_json: Pre-serialized shot_data (computed once per shot by the orchestrator)
 
         Returns:
             VideoPromptCritiqueSchema with scores and suggestions
         """
+        shot_json = shot_json or json.dumps(shot_data, separators=(",", ":"))
+
         # Extract style requirements
         style_check = ""
         if visual_style:
@@ -532,13 +728,14 @@ CHECK STYLE ADHERENCE:
 {video_prompt.slugline}
 
 ## SHOT DATA:
-{json.dumps(shot_data, indent=2)}
+{shot_json}
 {style_check}
 ## INSTRUCTIONS:
 
-1. FIRST: Use get_character_description tool to get ACTUAL character descriptions from codex
-2. SECOND: Use get_location_description tool to get ACTUAL location description from codex
-3. THIRD: Compare the prompt against the codex data and score
+1. FIRST: In ONE response, call get_character_description for EACH character AND
+   get_location_description for the location, all together as parallel tool calls,
+   to get the ACTUAL codex data
+2. THEN: Compare the prompt against the codex data and score
 
 SCORING CRITERIA (1-10 each):
 
@@ -550,18 +747,51 @@ SCORING CRITERIA (1-10 each):
 6. NO_NAMES: Score 10 if NO character names used, Score 1 if ANY names found!
 
 CRITICAL: Check if character names like {shot_data.get('characters_in_frame', [])} appear ANYWHERE in prompt!
-This includes dialogue tags! If names are present, no_names_score MUST be 1!
+This includes dialogue tags! If names are present, no_names_score MUST be 1!"""
 
-Set needs_revision=true if ANY score is below 7."""
+        return _invoke_cached(self, VideoPromptCritiqueSchema, VIDEO_CRITIC_SYSTEM_PROMPT, prompt)
 
-        result = self.agent.invoke({
-            "messages": [
-                {"role": "system", "content": VIDEO_CRITIC_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ]
-        })
 
-        return result["structured_response"]
+# =============================================================================
+# Adaptive Revision Policy
+# =============================================================================
+
+class AdaptiveRevisionPolicy:
+    """
+    Decides, per story, whether second revision cycles are still paying off.
+
+    Every shot that runs a second cycle records how much the revision moved
+    its overall score. Once min_samples shots have been seen and the mean
+    gain is below min_gain, later shots stop after their first critique.
+    Create one per story; it is safe to share across concurrent shots.
+    """
+
+    def __init__(self, min_samples: int = 5, min_gain: float = 0.5):
+        self.min_samples = min_samples
+        self.min_gain = min_gain
+        self.samples: list[tuple[float, float]] = []  # (initial_score, revised_score)
+        self.cycles_skipped = 0
+        self._lock = threading.Lock()
+
+    def record(self, initial_score: float, revised_score: float) -> None:
+        """Record a shot's overall score before and after a revision."""
+        with self._lock:
+            self.samples.append((initial_score, revised_score))
+
+    def mean_gain(self) -> Optional[float]:
+        """Mean overall-score change from a revision, or None before any samples."""
+        with self._lock:
+            if not self.samples:
+                return None
+            return sum(revised - initial for initial, revised in self.samples) / len(self.samples)
+
+    def should_skip_cycle2(self, initial_score: float) -> bool:
+        """True if revising a first draft scored initial_score is unlikely to pay off."""
+        if len(self.samples) < self.min_samples or self.mean_gain() >= self.min_gain:
+            return False
+        with self._lock:
+            self.cycles_skipped += 1
+        return True
 
 
 # =============================================================================
@@ -575,6 +805,10 @@ def generate_video_prompt(
     model: str = DEFAULT_MODEL,
     max_revisions: int = 2,
     visual_style: dict = None,
+    self_critique_first_pass: bool = False,
+    policy: Optional[AdaptiveRevisionPolicy] = None,
+    targeted_revisions: bool = False,
+    critic_model: str = None,
 ) -> dict:
     """
     Generate an LTX-style video prompt for a shot using creator + critic workflow.
@@ -588,6 +822,13 @@ def generate_video_prompt(
         model: LLM model to use
         max_revisions: Maximum revision cycles (default 2)
         visual_style: Visual style dict with name, prefix, suffix, description
+        self_critique_first_pass: Create and self-critique in one run; fall back to
+            the critic loop only if the self-critique asks for revision
+        policy: Per-story AdaptiveRevisionPolicy that may cut the second cycle
+        targeted_revisions: When 2+ dimensions fail, revise each one separately in
+            parallel and keep the best-scoring rewrite (more tokens, same latency)
+        critic_model: Model for the critic (default: CRITIC_MODEL, else model);
+            uncertain critiques are re-run on model when the two differ
 
     Returns:
         Dict with:
@@ -597,60 +838,248 @@ def generate_video_prompt(
         - dialogue_included: Whether dialogue is present
         - characters_described: Physical descriptions used
         - revision_count: Number of revisions made
+        - cycles_saved: Critic cycles skipped by early approval
+        - policy_skipped: Whether the policy cut cycle 2
         - final_scores: Final critique scores
         - critique_history: All critiques for metadata
     """
+    shot_num = shot_data.get("shot_number", "?")
+
+    # Whole-result cache: an unchanged shot skips every creator/critic cycle
+    cache = get_llm_cache()
+    cache_key = make_cache_key(
+        kind="generate_video_prompt",
+        pipeline=_pipeline_version(),
+        shot=shot_data,
+        codex=_shot_codex_fingerprint(codex, shot_data),
+        scene_context=scene_context,
+        visual_style=visual_style,
+        model=model,
+        max_revisions=max_revisions,
+        self_critique_first_pass=self_critique_first_pass,
+        targeted_revisions=targeted_revisions,
+        critic_model=critic_model or CRITIC_MODEL or model,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        print(f"      Video prompt for shot {shot_num} unchanged (cached)")
+        # Copies on the way out and in, so callers can't mutate cached entries
+        return copy.deepcopy(cached)
+
+    result = _generate_video_prompt(
+        shot_data, codex, scene_context, model, max_revisions, visual_style, self_critique_first_pass,
+        policy, targeted_revisions, critic_model,
+    )
+    # A result cut short by the policy depends on this run's policy state,
+    # so it is not reused by later runs
+    if not result["policy_skipped"]:
+        cache.set(cache_key, copy.deepcopy(result))
+    return result
+
+
+@lru_cache(maxsize=1)
+def _pipeline_version() -> str:
+    """
+    Hash of what shapes a video prompt result besides its inputs, for result cache keys.
+
+    Covers this module's source (system prompts, inline user prompt templates,
+    approval rules) and the output schemas, so editing any of them stops
+    generate_video_prompt from serving results made by the old pipeline.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for schema in (VideoPromptSchema, VideoPromptCritiqueSchema, VideoPromptAndCritiqueSchema):
+        digest.update(schema_fingerprint(schema).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _generate_video_prompt(
+    shot_data: dict,
+    codex: dict,
+    scene_context: str,
+    model: str,
+    max_revisions: int,
+    visual_style: Optional[dict],
+    self_critique_first_pass: bool,
+    policy: Optional[AdaptiveRevisionPolicy],
+    targeted_revisions: bool,
+    critic_model: Optional[str],
+) -> dict:
+    """Uncached body of generate_video_prompt."""
     creator = VideoPromptCreatorAgent(codex=codex, model=model)
-    critic = VideoPromptCriticAgent(codex=codex, model=model, temperature=0.3)
+    critic, escalation_critic = _make_critics(codex, model, critic_model)
 
     shot_num = shot_data.get("shot_number", "?")
     location = shot_data.get("location", "Unknown")
     print(f"      Creating video prompt for shot {shot_num} at {location}...")
 
     # Initial prompt generation
-    current = creator.create_video_prompt(shot_data, scene_context, visual_style)
+    # Serialize the shot once for every create/critique/revise call below
+    shot_json = json.dumps(shot_data, separators=(",", ":"))
+
+    if self_critique_first_pass:
+        # One fused create + self-critique run; the independent critic only
+        # runs if the self-critique already flags problems
+        fused = creator.create_and_selfcritique(shot_data, scene_context, visual_style, shot_json=shot_json)
+        current = fused.prompt
+        if not fused.critique.needs_revision and _min_score(fused.critique) >= 7:
+            print(f"        Self-critique approved! Overall: {fused.critique.overall_score:.1f}/10")
+            history = [{"cycle": 0, **fused.critique.model_dump(), "self_critique": True}]
+            result = _refine_video_prompt(
+                current, creator, critic, shot_data, visual_style, shot_json, 0, critique_history=history
+            )
+            result["cycles_saved"] = max_revisions
+            return result
+    else:
+        current = creator.create_video_prompt(shot_data, scene_context, visual_style, shot_json=shot_json)
+
+    return _refine_video_prompt(
+        current, creator, critic, shot_data, visual_style, shot_json, max_revisions,
+        policy=policy, targeted_revisions=targeted_revisions, escalation_critic=escalation_critic,
+    )
+
+
+def generate_video_prompts_batch(
+    shots: list[dict],
+    codex: dict,
+    scene_context: str = "",
+    model: str = DEFAULT_MODEL,
+    max_revisions: int = 2,
+    visual_style: dict = None,
+    max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS,
+    policy: Optional[AdaptiveRevisionPolicy] = None,
+    targeted_revisions: bool = False,
+    critic_model: str = None,
+) -> list:
+    """
+    Generate LTX-style video prompts for many shots with bounded concurrency.
+
+    The initial creator runs go out as one batched submission; each shot's
+    critique-revision loop then runs in its own worker, with at most
+    max_concurrency shots in flight. Unlike generate_video_prompt there is no
+    whole-result cache; only the individual creator calls are cached.
 
-    critique_history = []
+    Args:
+        shots: Shot dicts with all screenplay fields
+        codex: Full codex with characters and locations
+        scene_context: Additional scene context shared by the shots
+        model: LLM model to use
+        max_revisions: Maximum revision cycles per shot (default 2)
+        visual_style: Visual style dict with name, prefix, suffix, description
+        max_concurrency: Maximum shots (agent runs) in flight at once
+        policy: Per-story AdaptiveRevisionPolicy shared by the shots
+        targeted_revisions: Per-dimension parallel rewrites (see generate_video_prompt)
+        critic_model: Critic model with escalation (see generate_video_prompt)
+
+    Returns:
+        List aligned with shots: result dict (same shape as
+        generate_video_prompt), or the Exception raised for that shot
+    """
+    creator = VideoPromptCreatorAgent(codex=codex, model=model)
+    critic, escalation_critic = _make_critics(codex, model, critic_model)
+
+    print(f"      Creating video prompts for {len(shots)} shots...")
+    shot_jsons = [json.dumps(shot, separators=(",", ":")) for shot in shots]
+    initial = creator.create_video_prompts_batch(
+        shots, scene_context, visual_style, shot_jsons, max_concurrency
+    )
+
+    results: list = list(initial)
+    logs: dict[int, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        futures = {}
+        for i, current in enumerate(initial):
+            if isinstance(current, Exception):
+                continue
+            logs[i] = [f"      Shot {shots[i].get('shot_number', i + 1)}:"]
+            future = executor.submit(
+                _refine_video_prompt,
+                current, creator, critic, shots[i], visual_style, shot_jsons[i], max_revisions,
+                log=logs[i].append, policy=policy, targeted_revisions=targeted_revisions,
+                escalation_critic=escalation_critic,
+            )
+            futures[future] = i
+
+        # Each shot's progress is printed as one block when it finishes
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                results[i] = e
+                logs[i].append(f"        Failed: {e}")
+            print("\n".join(logs[i]))
+
+    return results
+
+
+def _refine_video_prompt(
+    current: VideoPromptSchema,
+    creator: VideoPromptCreatorAgent,
+    critic: VideoPromptCriticAgent,
+    shot_data: dict,
+    visual_style: Optional[dict],
+    shot_json: str,
+    max_revisions: int,
+    log: Callable[[str], None] = print,
+    critique_history: Optional[list] = None,
+    policy: Optional[AdaptiveRevisionPolicy] = None,
+    targeted_revisions: bool = False,
+    escalation_critic: Optional[VideoPromptCriticAgent] = None,
+) -> dict:
+    """
+    Run a shot's critique-revision loop and assemble its result dict (progress goes to log).
+
+    critique_history may carry earlier entries (e.g. an approving self-critique,
+    with max_revisions=0 to only assemble the result). policy, if given, learns
+    from each second cycle and may skip it for later shots. targeted_revisions
+    switches to per-dimension parallel rewrites when 2+ dimensions fail.
+    escalation_critic, if given, re-scores critiques the (cheaper) critic is
+    uncertain about.
+    """
+    critique_history = critique_history if critique_history is not None else []
     revision_count = 0
+    policy_skipped = False
 
     # Critique-revision loop
     for i in range(max_revisions):
-        print(f"        Critique cycle {i + 1}/{max_revisions}...")
-
-        critique = critic.critique(current, shot_data, visual_style)
-
-        critique_dict = {
-            "cycle": i + 1,
-            "screenplay_format_score": critique.screenplay_format_score,
-            "character_description_score": critique.character_description_score,
-            "camera_movement_score": critique.camera_movement_score,
-            "atmosphere_detail_score": critique.atmosphere_detail_score,
-            "dialogue_accuracy_score": critique.dialogue_accuracy_score,
-            "no_names_score": critique.no_names_score,
-            "overall_score": critique.overall_score,
-            "needs_revision": critique.needs_revision,
-            "suggestions": critique.suggestions,
-        }
-        critique_history.append(critique_dict)
+        log(f"        Critique cycle {i + 1}/{max_revisions}...")
+
+        critique = critic.critique(current, shot_data, visual_style, shot_json=shot_json)
+        if escalation_critic and _critique_uncertain(critique):
+            log(f"        Escalating uncertain critique ({critique.overall_score:.1f}/10) to {escalation_critic.model_name}")
+            critique = escalation_critic.critique(current, shot_data, visual_style, shot_json=shot_json)
+
+        critique_history.append({"cycle": i + 1, **critique.model_dump()})
+        if policy and i == 1:
+            policy.record(critique_history[-2]["overall_score"], critique.overall_score)
 
         # Check if revision needed
-        min_score = min(
-            critique.screenplay_format_score,
-            critique.character_description_score,
-            critique.camera_movement_score,
-            critique.atmosphere_detail_score,
-            critique.dialogue_accuracy_score,
-            critique.no_names_score,
-        )
+        min_score = _min_score(critique)
 
         if not critique.needs_revision and min_score >= 7:
-            print(f"        Approved! Overall: {critique.overall_score:.1f}/10")
+            log(f"        Approved! Overall: {critique.overall_score:.1f}/10")
+            break
+
+        # Name leaks are always revised; otherwise the policy may judge the
+        # second cycle not worth its creator + critic calls
+        if (
+            policy and i == 0 and max_revisions > 1 and critique.no_names_score == 10
+            and policy.should_skip_cycle2(initial_score=critique.overall_score)
+        ):
+            log(f"        Skipping cycle 2 (mean revision gain {policy.mean_gain():.2f})")
+            policy_skipped = True
             break
 
         # Revise if needed and not last cycle
         if i < max_revisions - 1:
-            print(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
-            current = creator.revise_video_prompt(current, critique, shot_data, visual_style)
+            log(f"        Revising (min score: {min_score}, no_names: {critique.no_names_score})...")
+            failing = _failing_dimensions(critique)
+            if targeted_revisions and len(failing) >= 2:
+                current = _targeted_revision(
+                    current, creator, critic, critique, failing, shot_data, visual_style, shot_json, log
+                )
+            else:
+                current = creator.revise_video_prompt(current, critique, shot_data, visual_style, shot_json=shot_json)
             revision_count += 1
 
     # Get final scores
@@ -663,14 +1092,113 @@ def generate_video_prompt(
         "dialogue_included": current.dialogue_included,
         "characters_described": current.characters_described,
         "revision_count": revision_count,
-        "final_scores": {
-            "screenplay_format": final_critique["screenplay_format_score"],
-            "character_description": final_critique["character_description_score"],
-            "camera_movement": final_critique["camera_movement_score"],
-            "atmosphere_detail": final_critique["atmosphere_detail_score"],
-            "dialogue_accuracy": final_critique["dialogue_accuracy_score"],
-            "no_names": final_critique["no_names_score"],
-            "overall": final_critique["overall_score"],
-        },
+        # Critique cycles not needed because the prompt was approved early
+        # (or cut by the policy)
+        "cycles_saved": max_revisions - sum(1 for c in critique_history if c["cycle"] > 0),
+        "policy_skipped": policy_skipped,
+        "final_scores": {name: final_critique[field] for name, field in _FINAL_SCORE_FIELDS},
         "critique_history": critique_history,
     }
+
+
+def _make_critics(
+    codex: dict, model: str, critic_model: Optional[str]
+) -> tuple[VideoPromptCriticAgent, Optional[VideoPromptCriticAgent]]:
+    """
+    Build the critic (on critic_model, default CRITIC_MODEL, else the creator's
+    model) and, when that differs from model, an escalation critic on model.
+    """
+    critic_model = critic_model or CRITIC_MODEL or model
+    critic = VideoPromptCriticAgent(codex=codex, model=critic_model, temperature=0.3)
+    if critic_model == model:
+        return critic, None
+    return critic, VideoPromptCriticAgent(codex=codex, model=model, temperature=0.3)
+
+
+def _critique_uncertain(critique: VideoPromptCritiqueSchema) -> bool:
+    """True if a critique is borderline (overall within 1 of 7) or its sub-scores disagree widely."""
+    sub_scores = _SUB_SCORES(critique)
+    return abs(critique.overall_score - 7) <= 1 or max(sub_scores) - min(sub_scores) >= 5
+
+
+def _targeted_revision(
+    current: VideoPromptSchema,
+    creator: VideoPromptCreatorAgent,
+    critic: VideoPromptCriticAgent,
+    critique: VideoPromptCritiqueSchema,
+    failing: list[str],
+    shot_data: dict,
+    visual_style: Optional[dict],
+    shot_json: str,
+    log: Callable[[str], None],
+) -> VideoPromptSchema:
+    """
+    Rewrite each failing dimension in parallel and return the best rewrite.
+
+    Candidates are critiqued in parallel too and ranked by (min score,
+    overall). Critiques are cached, so the loop's next critique of the
+    winner is a cache hit rather than another call.
+    """
+    with ThreadPoolExecutor(max_workers=len(failing)) as executor:
+        candidates = list(executor.map(
+            lambda dim: creator.revise_targeted(
+                current, critique, shot_data, dim, visual_style, shot_json=shot_json
+            ),
+            failing,
+        ))
+        critiques = list(executor.map(
+            lambda candidate: critic.critique(candidate, shot_data, visual_style, shot_json=shot_json),
+            candidates,
+        ))
+
+    best = max(
+        range(len(candidates)),
+        key=lambda k: (_min_score(critiques[k]), critiques[k].overall_score),
+    )
+    log(f"        Targeted rewrites for {', '.join(failing)}; kept {failing[best]}")
+    return candidates[best]
+
+
+def _failing_dimensions(critique: VideoPromptCritiqueSchema) -> list[str]:
+    """final_scores keys of the sub-scores below 7, e.g. ["no_names"]."""
+    return [
+        name for (name, _), score in zip(_FINAL_SCORE_FIELDS, _SUB_SCORES(critique))
+        if score < 7
+    ]
+
+
+def _shot_codex_fingerprint(codex: dict, shot_data: dict) -> dict:
+    """
+    The codex data a shot's prompt can depend on, for result cache keys.
+
+    Only the entries the shot references are included (plus the name lists
+    the list_all_* tools return), so editing an unrelated character or
+    location does not invalidate the shot.
+    """
+    index = get_codex_index(codex)
+    return {
+        "characters": [
+            index.find_character(name) for name in shot_data.get("characters_in_frame", [])
+        ],
+        "location": index.find_location(shot_data.get("location", "")),
+        "character_names": [name for name, _ in index.character_names],
+        "location_names": [name for name, _ in index.location_names],
+    }
+
+
+# (final_scores key, critique field) pairs; all but "overall" are the sub-scores
+_FINAL_SCORE_FIELDS = (
+    ("screenplay_format", "screenplay_format_score"),
+    ("character_description", "character_description_score"),
+    ("camera_movement", "camera_movement_score"),
+    ("atmosphere_detail", "atmosphere_detail_score"),
+    ("dialogue_accuracy", "dialogue_accuracy_score"),
+    ("no_names", "no_names_score"),
+    ("overall", "overall_score"),
+)
+_SUB_SCORES = attrgetter(*(field for _, field in _FINAL_SCORE_FIELDS[:-1]))
+
+
+def _min_score(critique: VideoPromptCritiqueSchema) -> int:
+    """Lowest of the six video critique scores."""
+    return min(_SUB_SCORES(critique))
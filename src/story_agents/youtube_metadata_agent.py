@@ -4,8 +4,29 @@ YouTube Metadata Agent
 Generates optimized YouTube title and description from story codex data.
 """
 
+from itertools import islice
+
 from pydantic import BaseModel, Field
 from .base_story_agent import BaseStoryAgent
+from src.config import MAX_CONCURRENT_LLM_REQUESTS
+
+
+METADATA_PROMPT_TEMPLATE = """Generate YouTube metadata for this AI-generated story video:
+
+**Story Title:** {story_title}
+
+**Logline:** {logline}
+
+**Main Characters:** {char_list}
+{scene_context}
+
+Create engaging YouTube metadata that will attract viewers interested in AI-generated stories and narrative content.
+
+Remember:
+- Title must be under 100 characters
+- Description should be 500-1000 characters
+- Include 10-15 relevant tags
+- Add hashtags at the end of description (#AIStory #GeneratedStory etc.)"""
 
 
 class YouTubeMetadata(BaseModel):
@@ -72,35 +93,54 @@ Be creative but accurate. The metadata should entice viewers while honestly repr
         Returns:
             YouTubeMetadata with title, description, and tags
         """
-        # Build character list
-        char_names = [c.get("name", "Unknown") for c in characters[:5]]  # Top 5
-        char_list = ", ".join(char_names) if char_names else "Various characters"
-
-        # Build scene context if available
-        scene_context = ""
-        if scene_summaries:
-            # Take first 3 scenes for context
-            summaries = scene_summaries[:3]
-            scene_context = f"\n\nFirst few scenes:\n" + "\n".join(f"- {s}" for s in summaries)
-
-        prompt = f"""Generate YouTube metadata for this AI-generated story video:
-
-**Story Title:** {story_title}
+        prompt = self._metadata_prompt(story_title, logline, characters, scene_summaries)
+        return self.invoke_structured(prompt, YouTubeMetadata, max_tokens=1000)
 
-**Logline:** {logline}
+    def generate_metadata_batch(
+        self, stories: list[dict], max_concurrency: int = MAX_CONCURRENT_LLM_REQUESTS
+    ) -> list:
+        """
+        Generate YouTube metadata for many stories in one batched submission.
 
-**Main Characters:** {char_list}
-{scene_context}
+        Args:
+            stories: Dicts with generate_metadata's keyword arguments
+                (story_title, logline, characters, optional scene_summaries)
+            max_concurrency: Maximum requests in flight at once
 
-Create engaging YouTube metadata that will attract viewers interested in AI-generated stories and narrative content.
+        Returns:
+            List aligned with stories: YouTubeMetadata, or the Exception
+            raised for that story
+        """
+        prompts = [self._metadata_prompt(**story) for story in stories]
+        return self.invoke_structured_batch(
+            prompts, YouTubeMetadata, max_tokens=1000, max_concurrency=max_concurrency
+        )
 
-Remember:
-- Title must be under 100 characters
-- Description should be 500-1000 characters
-- Include 10-15 relevant tags
-- Add hashtags at the end of description (#AIStory #GeneratedStory etc.)"""
+    def _metadata_prompt(
+        self,
+        story_title: str,
+        logline: str,
+        characters: list[dict],
+        scene_summaries: list[str] = None,
+    ) -> str:
+        """Build the user message for generate_metadata."""
+        # Top 5 characters (islice avoids copying the list)
+        char_names = [c.get("name", "Unknown") for c in islice(characters, 5)]
+        char_list = ", ".join(char_names) if char_names else "Various characters"
 
-        return self.invoke_structured(prompt, YouTubeMetadata, max_tokens=1000)
+        # First 3 scenes for context, if available
+        scene_context = ""
+        if scene_summaries:
+            scene_context = "\n\nFirst few scenes:\n" + "\n".join(
+                map("- {}".format, islice(scene_summaries, 3))
+            )
+
+        return METADATA_PROMPT_TEMPLATE.format(
+            story_title=story_title,
+            logline=logline,
+            char_list=char_list,
+            scene_context=scene_context,
+        )
 
 
 def generate_youtube_metadata(
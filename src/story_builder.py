@@ -24,14 +24,27 @@ Usage:
 
     # Long story (~50 min)
     uv run python src/story_builder.py --scope long
+
+    # Every codex in a directory (or matching a glob), 3 pipelines at a time
+    uv run python src/story_builder.py output/ --parallel 3
+    uv run python src/story_builder.py "forge/*/codex.json" --parallel 3
 """
 
 import sys
+import glob
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+# orjson (optional) reads/writes large codexes much faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory to path for proper package imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -57,8 +70,11 @@ def find_latest_codex() -> Path | None:
 
 def load_codex(codex_path: Path) -> dict:
     """Load and validate codex JSON file."""
-    with open(codex_path, "r", encoding="utf-8") as f:
-        codex = json.load(f)
+    if ORJSON_AVAILABLE:
+        codex = orjson.loads(Path(codex_path).read_bytes())
+    else:
+        with open(codex_path, "r", encoding="utf-8") as f:
+            codex = json.load(f)
 
     # Validate structure
     if "story_engine" not in codex or "deck_of_worlds" not in codex:
@@ -107,12 +123,79 @@ def save_updated_codex(codex: dict, story_data: dict, original_path: Path) -> Pa
     codex["story_generated_at"] = datetime.now().isoformat()
 
     # Update the original codex file in-place
-    with open(original_path, "w", encoding="utf-8") as f:
-        json.dump(codex, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        Path(original_path).write_bytes(
+            orjson.dumps(codex, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(original_path, "w", encoding="utf-8") as f:
+            json.dump(codex, f, indent=2, ensure_ascii=False)
 
     return original_path
 
 
+def resolve_codex_paths(codex_arg: str) -> list[Path]:
+    """
+    Expand the codex CLI argument into codex file paths.
+
+    Accepts a single file, a directory (all codex*.json inside it),
+    or a glob pattern.
+    """
+    path = Path(codex_arg)
+    if path.is_dir():
+        return sorted(path.glob("codex*.json"))
+    if glob.has_magic(codex_arg):
+        return sorted(Path(p) for p in glob.glob(codex_arg, recursive=True))
+    return [path]
+
+
+def run_one_codex(codex_path: Path, model: str, scope: str) -> tuple[Path, dict]:
+    """
+    Run the full story pipeline for one codex and save it in place.
+
+    Returns:
+        Tuple of (saved codex path, story data from the pipeline)
+    """
+    codex = load_codex(codex_path)
+    story_prompt, setting_prompt = extract_prompts(codex)
+    story_data = run_full_story_pipeline(
+        story_prompt=story_prompt,
+        setting_prompt=setting_prompt,
+        model=model,
+        scope=scope
+    )
+    return save_updated_codex(codex, story_data, codex_path), story_data
+
+
+def run_many_codexes(codex_paths: list[Path], model: str, scope: str, parallel: int) -> int:
+    """
+    Run pipelines for several codexes concurrently.
+
+    Pipelines are LLM/IO-bound, so threads are enough; `parallel`
+    bounds how many run at once. Console output from concurrent
+    pipelines is interleaved.
+
+    Returns:
+        Number of codexes that failed
+    """
+    print(f"\n>>> Building {len(codex_paths)} codexes, {parallel} at a time")
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        futures = {
+            executor.submit(run_one_codex, codex_path, model, scope): codex_path
+            for codex_path in codex_paths
+        }
+        for future in as_completed(futures):
+            codex_path = futures[future]
+            try:
+                output_path, _ = future.result()
+                print(f"\n>>> Done: {output_path}")
+            except Exception as e:
+                failed += 1
+                print(f"\nERROR: Pipeline failed for {codex_path}: {e}")
+    return failed
+
+
 def main():
     """Run story builder pipeline."""
     parser = argparse.ArgumentParser(
@@ -121,7 +204,7 @@ def main():
     parser.add_argument(
         "codex_path",
         nargs="?",
-        help="Path to codex JSON file (uses latest if not specified)"
+        help="Path to codex JSON file, a directory of codexes, or a glob (uses latest if not specified)"
     )
     parser.add_argument(
         "--model",
@@ -134,11 +217,25 @@ def main():
         default=DEFAULT_STORY_SCOPE,
         help="Story scope/length: flash (~10min), short (~20min), standard (~35min), long (~50min)"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=2,
+        help="Pipelines run concurrently when several codexes are given (default: 2)"
+    )
     args = parser.parse_args()
 
-    # Find codex file
+    # Find codex file(s)
     if args.codex_path:
-        codex_path = Path(args.codex_path)
+        codex_paths = resolve_codex_paths(args.codex_path)
+        if not codex_paths:
+            print(f"ERROR: No codex files match: {args.codex_path}")
+            sys.exit(1)
+        if len(codex_paths) > 1:
+            failed = run_many_codexes(codex_paths, args.model, args.scope, args.parallel)
+            print(f"\n>>> Built {len(codex_paths) - failed}/{len(codex_paths)} codexes")
+            sys.exit(1 if failed else 0)
+        codex_path = codex_paths[0]
     else:
         codex_path = find_latest_codex()
         if not codex_path:
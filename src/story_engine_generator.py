@@ -15,29 +15,29 @@ Card Types:
 
 import json
 import random
-import io
-import sys
 from pathlib import Path
 
-# Output buffer to capture all prints
-output_buffer = io.StringIO()
-
 
 def load_deck():
-    """Load the Story Engine deck from JSON file."""
+    """Load the Story Engine deck from JSON file (card lists become tuples)."""
     deck_path = Path(__file__).parent.parent / "files" / "story_engine_main_deck.json"
     with open(deck_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return {card_type: tuple(cards) for card_type, cards in json.load(f).items()}
 
 
 def draw(deck, card_type, count=1):
     """Draw random cards of a specific type."""
     cards = deck[card_type]
     if count == 1:
-        return random.choice(cards)
+        return cards[random.randrange(len(cards))]
     return random.sample(cards, min(count, len(cards)))
 
 
+def draw_many(deck, card_type, count):
+    """Draw `count` cards of a type with replacement, in one call (bulk mode)."""
+    return random.choices(deck[card_type], k=count)
+
+
 # =============================================================================
 # SIMPLE PROMPTS
 # =============================================================================
@@ -53,20 +53,42 @@ def generate_story_seed(deck):
     - Conflict = obstacle/consequence
     - Aspect = adds detail
     """
-    agent = draw(deck, "agents")
-    engine = draw(deck, "engines")
-    anchor = draw(deck, "anchors")
-    conflict = draw(deck, "conflicts")
-    aspect = draw(deck, "aspects")
+    return _format_story_seed(
+        draw(deck, "agents"),
+        draw(deck, "engines"),
+        draw(deck, "anchors"),
+        draw(deck, "conflicts"),
+        draw(deck, "aspects"),
+    )
+
+
+def generate_story_seeds(deck, count):
+    """
+    Generate `count` Story Seeds in bulk.
 
-    print("\n" + "=" * 50)
-    print("STORY SEED")
-    print("=" * 50)
-    print(f"\n{aspect} {agent}")
-    print(f"{engine}")
-    print(f"{anchor}")
-    print(f"{conflict}")
-    print()
+    Each card type is drawn once for the whole batch (with replacement)
+    and the columns are zipped, instead of five draw() calls per seed.
+    """
+    columns = [
+        draw_many(deck, card_type, count)
+        for card_type in ("agents", "engines", "anchors", "conflicts", "aspects")
+    ]
+    return [_format_story_seed(*cards) for cards in zip(*columns)]
+
+
+def _format_story_seed(agent, engine, anchor, conflict, aspect):
+    """Format one Story Seed block."""
+    lines = [
+        "\n" + "=" * 50,
+        "STORY SEED",
+        "=" * 50,
+        f"\n{aspect} {agent}",
+        f"{engine}",
+        f"{anchor}",
+        f"{conflict}",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def generate_character_concept(deck):
@@ -88,16 +110,19 @@ def generate_character_concept(deck):
     conflict = draw(deck, "conflicts")
     aspects = draw(deck, "aspects", 2)
 
-    print("\n" + "=" * 50)
-    print("CHARACTER CONCEPT")
-    print("=" * 50)
-    print(f"\nCHARACTER: {aspects[0]} {agent}")
-    print(f"\nMOTIVATION (choose one):")
-    print(f"  Option A: {engines[0]}")
-    print(f"  Option B: {engines[1]}")
-    print(f"\nDESIRE: {aspects[1]} {desire}")
-    print(f"\nOBSTACLE: {conflict}")
-    print()
+    lines = [
+        "\n" + "=" * 50,
+        "CHARACTER CONCEPT",
+        "=" * 50,
+        f"\nCHARACTER: {aspects[0]} {agent}",
+        f"\nMOTIVATION (choose one):",
+        f"  Option A: {engines[0]}",
+        f"  Option B: {engines[1]}",
+        f"\nDESIRE: {aspects[1]} {desire}",
+        f"\nOBSTACLE: {conflict}",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def generate_item_setting(deck):
@@ -123,19 +148,22 @@ def generate_item_setting(deck):
     conflict = draw(deck, "conflicts")
     aspects = draw(deck, "aspects", 3)
 
-    print("\n" + "=" * 50)
-    print("ITEM/SETTING-DRIVEN STORY")
-    print("=" * 50)
-    print(f"\nTHE OBJECT: {aspects[0]} {object_anchor}")
-    print(f"THE SETTING: {aspects[1]} {setting_anchor}")
-    print(f"\nEFFECT (choose one):")
-    print(f"  Option A: {engines[0]}")
-    print(f"  Option B: {engines[1]}")
-    print(f"  Option C: {engines[2]}")
-    print(f"\nAFFECTED: {aspects[2]} {affected}")
-    print(f"OWNER/CONNECTION: {owner}")
-    print(f"\nCONFLICT: {conflict}")
-    print()
+    lines = [
+        "\n" + "=" * 50,
+        "ITEM/SETTING-DRIVEN STORY",
+        "=" * 50,
+        f"\nTHE OBJECT: {aspects[0]} {object_anchor}",
+        f"THE SETTING: {aspects[1]} {setting_anchor}",
+        f"\nEFFECT (choose one):",
+        f"  Option A: {engines[0]}",
+        f"  Option B: {engines[1]}",
+        f"  Option C: {engines[2]}",
+        f"\nAFFECTED: {aspects[2]} {affected}",
+        f"OWNER/CONNECTION: {owner}",
+        f"\nCONFLICT: {conflict}",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 # =============================================================================
@@ -163,21 +191,24 @@ def generate_circle_of_fate(deck):
 
     aspects = draw(deck, "aspects", 2)
 
-    print("\n" + "=" * 50)
-    print("CIRCLE OF FATE")
-    print("=" * 50)
-    print(f"\n{aspects[0]} {agent1}")
-    print(f"  |")
-    print(f"  | {engine1}")
-    print(f"  | {conflict1}")
-    print(f"  v")
-    print(f"{aspects[1]} {agent2}")
-    print(f"  |")
-    print(f"  | {engine2}")
-    print(f"  | {conflict2}")
-    print(f"  v")
-    print(f"(back to {agent1})")
-    print()
+    lines = [
+        "\n" + "=" * 50,
+        "CIRCLE OF FATE",
+        "=" * 50,
+        f"\n{aspects[0]} {agent1}",
+        f"  |",
+        f"  | {engine1}",
+        f"  | {conflict1}",
+        f"  v",
+        f"{aspects[1]} {agent2}",
+        f"  |",
+        f"  | {engine2}",
+        f"  | {conflict2}",
+        f"  v",
+        f"(back to {agent1})",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def generate_clash_of_wills(deck):
@@ -202,19 +233,22 @@ def generate_clash_of_wills(deck):
 
     aspects = draw(deck, "aspects", 3)
 
-    print("\n" + "=" * 50)
-    print("CLASH OF WILLS")
-    print("=" * 50)
-    print(f"\n{aspects[0]} {agent1}")
-    print(f"  | {engine1}")
-    print(f"  | {conflict1}")
-    print(f"  v")
-    print(f"     [{aspects[2]} {target}]")
-    print(f"  ^")
-    print(f"  | {engine2}")
-    print(f"  | {conflict2}")
-    print(f"{aspects[1]} {agent2}")
-    print()
+    lines = [
+        "\n" + "=" * 50,
+        "CLASH OF WILLS",
+        "=" * 50,
+        f"\n{aspects[0]} {agent1}",
+        f"  | {engine1}",
+        f"  | {conflict1}",
+        f"  v",
+        f"     [{aspects[2]} {target}]",
+        f"  ^",
+        f"  | {engine2}",
+        f"  | {conflict2}",
+        f"{aspects[1]} {agent2}",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def generate_soul_divided(deck):
@@ -238,21 +272,24 @@ def generate_soul_divided(deck):
 
     aspects = draw(deck, "aspects", 3)
 
-    print("\n" + "=" * 50)
-    print("SOUL DIVIDED")
-    print("=" * 50)
-    print(f"\n{aspects[1]} {desire1}")
-    print(f"  ^")
-    print(f"  | {engine1}")
-    print(f"  | {conflict1}")
-    print(f"  |")
-    print(f"[{aspects[0]} {character}]")
-    print(f"  |")
-    print(f"  | {engine2}")
-    print(f"  | {conflict2}")
-    print(f"  v")
-    print(f"{aspects[2]} {desire2}")
-    print()
+    lines = [
+        "\n" + "=" * 50,
+        "SOUL DIVIDED",
+        "=" * 50,
+        f"\n{aspects[1]} {desire1}",
+        f"  ^",
+        f"  | {engine1}",
+        f"  | {conflict1}",
+        f"  |",
+        f"[{aspects[0]} {character}]",
+        f"  |",
+        f"  | {engine2}",
+        f"  | {conflict2}",
+        f"  v",
+        f"{aspects[2]} {desire2}",
+        "",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 # =============================================================================
@@ -271,29 +308,20 @@ def main():
     """Generate all prompt types and save to file."""
     deck = load_deck()
 
-    # Capture all output
-    old_stdout = sys.stdout
-    sys.stdout = output_buffer
-
-    print("\n" + "#" * 50)
-    print("# STORY ENGINE PROMPT GENERATOR")
-    print("#" * 50)
-
-    print("\n--- SIMPLE PROMPTS ---")
-    generate_story_seed(deck)
-    generate_character_concept(deck)
-    generate_item_setting(deck)
-
-    print("\n--- COMPLEX PROMPTS ---")
-    generate_circle_of_fate(deck)
-    generate_clash_of_wills(deck)
-    generate_soul_divided(deck)
-
-    # Get captured output
-    output = output_buffer.getvalue()
-
-    # Restore stdout
-    sys.stdout = old_stdout
+    parts = [
+        "\n" + "#" * 50 + "\n",
+        "# STORY ENGINE PROMPT GENERATOR\n",
+        "#" * 50 + "\n",
+        "\n--- SIMPLE PROMPTS ---\n",
+        generate_story_seed(deck),
+        generate_character_concept(deck),
+        generate_item_setting(deck),
+        "\n--- COMPLEX PROMPTS ---\n",
+        generate_circle_of_fate(deck),
+        generate_clash_of_wills(deck),
+        generate_soul_divided(deck),
+    ]
+    output = "".join(parts)
 
     # Print to console
     print(output)
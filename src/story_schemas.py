@@ -7,15 +7,69 @@ These schemas define the JSON structure for:
 - Phase 3: Narrative prose
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, NotRequired, Optional, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+class _SchemaBase(BaseModel):
+    """
+    Base for all story schemas.
+
+    defer_build postpones building each model's validator until it is first
+    used, so importing this module stays cheap and schemas a run never
+    touches are never built.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+# A 1-10 rubric score; one shared definition for every critique schema
+Score10 = Annotated[int, Field(ge=1, le=10)]
+
+
+class _CritiqueBase(_SchemaBase):
+    """
+    Base for critic outputs (rubric critiques use Score10 fields).
+
+    Critiques are read-only once returned (use model_copy(update=...) to
+    adjust one). Fields stay on the subclasses so each schema keeps its own
+    order: scores first, suggestions last.
+    """
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+
+class _ScoredCritiqueBase(_CritiqueBase):
+    """
+    Base for prompt critiques whose verdict is derived from their scores.
+
+    Subclasses declare only their Score10 `*_score` fields. overall_score and
+    needs_revision are computed from them rather than asked of the LLM: they
+    stay out of the structured-output schema but are still in model_dump().
+    """
+
+    def _score_values(self) -> list[Optional[int]]:
+        return [getattr(self, name) for name in type(self).model_fields if name.endswith("_score")]
+
+    @computed_field
+    @property
+    def overall_score(self) -> Optional[float]:
+        """Average of all scores (None while any is unset, e.g. an aborted critique)."""
+        scores = self._score_values()
+        if None in scores:
+            return None
+        return round(sum(scores) / len(scores), 1)
+
+    @computed_field
+    @property
+    def needs_revision(self) -> bool:
+        """True if any score is below 7 (or unset) or no_names_score is below 10."""
+        return any(score is None or score < 7 for score in self._score_values()) or self.no_names_score < 10
 
 
 # =============================================================================
 # Phase 1: Story Outline Schemas
 # =============================================================================
 
-class SceneSchema(BaseModel):
+class SceneSchema(_SchemaBase):
     """A single scene within an act."""
     scene_number: int = Field(..., description="Scene number within the act")
     location: str = Field(..., description="Where the scene takes place")
@@ -27,14 +81,14 @@ class SceneSchema(BaseModel):
     )
 
 
-class ActSchema(BaseModel):
+class ActSchema(_SchemaBase):
     """A single act containing multiple scenes."""
     act_number: int = Field(..., description="Act number (1, 2, or 3)")
     act_name: str = Field(..., description="Name of the act (e.g., 'Setup', 'Confrontation', 'Resolution')")
     scenes: list[SceneSchema] = Field(..., description="Scenes in this act")
 
 
-class OutlineSchema(BaseModel):
+class OutlineSchema(_SchemaBase):
     """Complete story outline with 3 acts."""
     title: str = Field(..., description="Working title for the story")
     logline: str = Field(..., description="One-sentence story summary")
@@ -44,7 +98,7 @@ class OutlineSchema(BaseModel):
     acts: list[ActSchema] = Field(..., description="The 3 acts of the story")
 
 
-class CritiqueSchema(BaseModel):
+class CritiqueSchema(_CritiqueBase):
     """Critique from a critic agent."""
     critic_name: str = Field(..., description="Name of the critic agent")
     issues: list[str] = Field(..., description="List of issues found")
@@ -56,29 +110,29 @@ class CritiqueSchema(BaseModel):
 # Name Debate Schemas (Pre-Phase 2)
 # =============================================================================
 
-class NameProposal(BaseModel):
+class NameProposal(_SchemaBase):
     """A proposed character name from a naming agent."""
     first_name: str = Field(..., description="First name starting with required initial")
     last_name: str = Field(..., description="Last name starting with required initial")
     reasoning: str = Field(..., description="Why this name fits the character and setting")
 
 
-class NameCritiqueReview(BaseModel):
+class NameCritiqueReview(_SchemaBase):
     """Critique of a single name proposal."""
     proposal_index: int = Field(..., description="Which proposal (0, 1, or 2)")
     strengths: str = Field(..., description="What works well about this name")
     weaknesses: str = Field(..., description="What could be improved")
-    score: int = Field(..., ge=1, le=10, description="Score 1-10")
+    score: Score10 = Field(..., description="Score 1-10")
 
 
-class NameCritiques(BaseModel):
+class NameCritiques(_SchemaBase):
     """All critiques from one agent."""
     reviews: list[NameCritiqueReview] = Field(
         ..., description="Reviews of all 3 proposals", min_length=3, max_length=3
     )
 
 
-class NameVote(BaseModel):
+class NameVote(_SchemaBase):
     """An agent's vote for the best name."""
     voted_for: int = Field(..., ge=0, le=2, description="Index of proposal voted for (0, 1, or 2)")
     vote_reasoning: str = Field(..., description="Why this name is the best choice")
@@ -88,18 +142,20 @@ class NameVote(BaseModel):
 # Phase 2: Character & Location Schemas
 # =============================================================================
 
-class PhysicalDescriptionSchema(BaseModel):
+class PhysicalDescriptionSchema(TypedDict):
     """Physical attributes of a character."""
-    height: str = Field(..., description="Height description")
-    build: str = Field(..., description="Body type/build")
-    hair_color: str = Field(..., description="Hair color and style")
-    eye_color: str = Field(..., description="Eye color")
-    distinguishing_features: str = Field(..., description="Scars, tattoos, unique features")
+    # A TypedDict rather than a nested model: plain string fields with no
+    # cross-field checks, validated inline with the character (same JSON shape)
+    height: Annotated[str, Field(description="Height description")]
+    build: Annotated[str, Field(description="Body type/build")]
+    hair_color: Annotated[str, Field(description="Hair color and style")]
+    eye_color: Annotated[str, Field(description="Eye color")]
+    distinguishing_features: Annotated[str, Field(description="Scars, tattoos, unique features")]
 
 
-class CharacterSchema(BaseModel):
+class CharacterSchema(_SchemaBase):
     """Detailed character profile."""
-    id: Optional[str] = Field(None, description="Unique ID like 'char_001' (assigned in Phase 2)")
+    id: str = Field(default="", description="Unique ID like 'char_001' (assigned in Phase 2)")
     name: str = Field(..., description="Character's full name")
     gender: str = Field(..., description="Character's gender")
     age: str = Field(..., description="Age or age range")
@@ -108,13 +164,15 @@ class CharacterSchema(BaseModel):
     personality_traits: list[str] = Field(..., description="3-5 key personality traits")
     backstory: str = Field(..., description="Brief background (2-3 sentences)")
     motivation: str = Field(..., description="What drives this character")
-    role_in_story: str = Field(..., description="'protagonist', 'antagonist', or 'supporting'")
+    role_in_story: Literal["protagonist", "antagonist", "supporting"] = Field(
+        ..., description="'protagonist', 'antagonist', or 'supporting'"
+    )
     arc: str = Field(..., description="Character's growth/change arc")
 
 
-class LocationSchema(BaseModel):
+class LocationSchema(_SchemaBase):
     """Detailed location profile."""
-    id: Optional[str] = Field(None, description="Unique ID like 'loc_001' (assigned in Phase 2)")
+    id: str = Field(default="", description="Unique ID like 'loc_001' (assigned in Phase 2)")
     name: str = Field(..., description="Location name")
     type: str = Field(..., description="Type of location (city, forest, building, etc.)")
     description: str = Field(..., description="Visual description (2-3 sentences)")
@@ -124,34 +182,38 @@ class LocationSchema(BaseModel):
     connection_to_story: str = Field(..., description="How this location matters to the plot")
 
 
-class CharactersAndLocationsSchema(BaseModel):
+class CharactersAndLocationsSchema(_SchemaBase):
     """Combined output for Phase 2."""
     characters: list[CharacterSchema] = Field(..., description="All character profiles")
     locations: list[LocationSchema] = Field(..., description="All location profiles")
 
 
-class CharacterListSchema(BaseModel):
+# List wrappers: structured output (function calling / json_schema) needs an
+# object at the root, so these cannot be replaced by a TypeAdapter(list[...]).
+# With defer_build they cost nothing until a phase actually uses them.
+
+class CharacterListSchema(_SchemaBase):
     """Wrapper for character list output."""
     characters: list[CharacterSchema] = Field(..., description="All character profiles")
 
 
-class LocationListSchema(BaseModel):
+class LocationListSchema(_SchemaBase):
     """Wrapper for location list output."""
     locations: list[LocationSchema] = Field(..., description="All location profiles")
 
 
-class ShotPromptCritiqueSchema(BaseModel):
+class ShotPromptCritiqueSchema(_CritiqueBase):
     """Critique for shot/poster image prompts."""
-    issues: list[str] = Field(default=[], description="List of issues found")
-    suggestions: list[str] = Field(default=[], description="Suggested improvements")
-    severity: str = Field(..., description="Severity: 'minor', 'moderate', 'major'")
+    issues: list[str] = Field(default_factory=list, description="List of issues found")
+    suggestions: list[str] = Field(default_factory=list, description="Suggested improvements")
+    severity: Literal["minor", "moderate", "major"] = Field(..., description="Severity: 'minor', 'moderate', 'major'")
 
 
 # =============================================================================
 # Phase 3: Narrative Schemas
 # =============================================================================
 
-class SceneProseSchema(BaseModel):
+class SceneProseSchema(_SchemaBase):
     """Enforced structure for scene prose output via LangChain structured output.
 
     This schema forces the LLM to generate proper multi-paragraph prose
@@ -194,7 +256,7 @@ class SceneProseSchema(BaseModel):
         return "\n\n".join(paragraphs)
 
 
-class NarrativeSceneSchema(BaseModel):
+class NarrativeSceneSchema(_SchemaBase):
     """A written scene with prose."""
     scene_number: int = Field(..., description="Scene number")
     location: str = Field(..., description="Scene location")
@@ -204,14 +266,14 @@ class NarrativeSceneSchema(BaseModel):
     # NOTE: shots are added later in Phase 3b via dict manipulation, not via this schema
 
 
-class NarrativeActSchema(BaseModel):
+class NarrativeActSchema(_SchemaBase):
     """An act containing written scenes."""
     act_number: int = Field(..., description="Act number")
     act_name: str = Field(..., description="Name of the act")
     scenes: list[NarrativeSceneSchema] = Field(..., description="Written scenes")
 
 
-class NarrativeSchema(BaseModel):
+class NarrativeSchema(_SchemaBase):
     """Complete narrative with all written prose."""
     title: str = Field(..., description="Story title")
     acts: list[NarrativeActSchema] = Field(..., description="All acts with prose")
@@ -225,7 +287,7 @@ class NarrativeSchema(BaseModel):
 # Phase 4: Character Image Prompt Schemas
 # =============================================================================
 
-class CharacterPromptSchema(BaseModel):
+class CharacterPromptSchema(_SchemaBase):
     """Structured output for character image prompt generation."""
     prompt: str = Field(
         ...,
@@ -241,30 +303,30 @@ class CharacterPromptSchema(BaseModel):
     )
 
 
-class CharacterPromptCritique(BaseModel):
+class CharacterPromptCritique(_CritiqueBase):
     """Critique scores for character image prompt quality."""
-    face_detail_score: int = Field(
-        ..., ge=1, le=10,
+    face_detail_score: Score10 = Field(
+        ...,
         description="Score 1-10 for face description completeness"
     )
-    clothing_detail_score: int = Field(
-        ..., ge=1, le=10,
+    clothing_detail_score: Score10 = Field(
+        ...,
         description="Score 1-10 for clothing description detail"
     )
-    distinguishing_marks_score: int = Field(
-        ..., ge=1, le=10,
+    distinguishing_marks_score: Score10 = Field(
+        ...,
         description="Score 1-10 for scars, tattoos, jewelry description"
     )
-    pose_expression_score: int = Field(
-        ..., ge=1, le=10,
+    pose_expression_score: Score10 = Field(
+        ...,
         description="Score 1-10 for pose and expression clarity"
     )
-    quality_tags_score: int = Field(
-        ..., ge=1, le=10,
+    quality_tags_score: Score10 = Field(
+        ...,
         description="Score 1-10 for lighting, resolution, style tags"
     )
-    overall_score: int = Field(
-        ..., ge=1, le=10,
+    overall_score: Score10 = Field(
+        ...,
         description="Overall quality score 1-10"
     )
     needs_revision: bool = Field(
@@ -281,7 +343,7 @@ class CharacterPromptCritique(BaseModel):
 # Phase 4: Location Image Prompt Schemas
 # =============================================================================
 
-class LocationPromptSchema(BaseModel):
+class LocationPromptSchema(_SchemaBase):
     """Structured output for location image prompt generation."""
     prompt: str = Field(
         ...,
@@ -301,34 +363,34 @@ class LocationPromptSchema(BaseModel):
     )
 
 
-class LocationPromptCritique(BaseModel):
+class LocationPromptCritique(_CritiqueBase):
     """Critique scores for location image prompt quality."""
-    architecture_structure_score: int = Field(
-        ..., ge=1, le=10,
+    architecture_structure_score: Score10 = Field(
+        ...,
         description="Score 1-10 for architecture and structure detail"
     )
-    lighting_time_score: int = Field(
-        ..., ge=1, le=10,
+    lighting_time_score: Score10 = Field(
+        ...,
         description="Score 1-10 for lighting and time of day"
     )
-    atmosphere_weather_score: int = Field(
-        ..., ge=1, le=10,
+    atmosphere_weather_score: Score10 = Field(
+        ...,
         description="Score 1-10 for atmosphere and weather effects"
     )
-    textures_materials_score: int = Field(
-        ..., ge=1, le=10,
+    textures_materials_score: Score10 = Field(
+        ...,
         description="Score 1-10 for textures and materials"
     )
-    composition_depth_score: int = Field(
-        ..., ge=1, le=10,
+    composition_depth_score: Score10 = Field(
+        ...,
         description="Score 1-10 for composition and depth layers"
     )
-    quality_tags_score: int = Field(
-        ..., ge=1, le=10,
+    quality_tags_score: Score10 = Field(
+        ...,
         description="Score 1-10 for quality and style tags"
     )
-    overall_score: int = Field(
-        ..., ge=1, le=10,
+    overall_score: Score10 = Field(
+        ...,
         description="Overall quality score 1-10"
     )
     needs_revision: bool = Field(
@@ -345,17 +407,18 @@ class LocationPromptCritique(BaseModel):
 # Phase 3b: Storyboard Schemas (Industry-Standard Format)
 # =============================================================================
 
-class DialogueLineSchema(BaseModel):
+class DialogueLineSchema(TypedDict):
     """A single line of dialogue in a shot."""
-    character: str = Field(..., description="Character name (uppercase)")
-    parenthetical: str = Field(
-        default="",
+    # A TypedDict (like PhysicalDescriptionSchema): a storyboard carries many
+    # of these and every consumer reads them as dicts after model_dump()
+    character: Annotated[str, Field(description="Character name (uppercase)")]
+    parenthetical: NotRequired[Annotated[str, Field(
         description="Tone/action note (e.g., 'whispered', 'angrily', 'looking away')"
-    )
-    line: str = Field(..., description="The dialogue text")
+    )]]
+    line: Annotated[str, Field(description="The dialogue text")]
 
 
-class ShotSchema(BaseModel):
+class ShotSchema(_SchemaBase):
     """A single shot in industry-standard screenplay/storyboard format."""
 
     # Shot identification
@@ -366,7 +429,7 @@ class ShotSchema(BaseModel):
     )
 
     # Slugline components
-    int_ext: str = Field(
+    int_ext: Literal["INT.", "EXT."] = Field(
         ...,
         description="Interior or exterior: 'INT.' or 'EXT.'"
     )
@@ -381,7 +444,7 @@ class ShotSchema(BaseModel):
     )
 
     # Shot specifications
-    shot_size: str = Field(
+    shot_size: Literal["WIDE", "MEDIUM", "CLOSE-UP", "EXTREME CLOSE-UP", "OVER-SHOULDER", "POV", "AERIAL"] = Field(
         ...,
         description="WIDE, MEDIUM, CLOSE-UP, EXTREME CLOSE-UP, OVER-SHOULDER, POV, AERIAL"
     )
@@ -398,25 +461,25 @@ class ShotSchema(BaseModel):
 
     # Characters and dialogue
     characters_in_frame: list[str] = Field(
-        default=[],
+        default_factory=list,
         description="Character names visible in shot (uppercase, e.g., 'CALISTA')"
     )
     character_ids: list[str] = Field(
-        default=[],
+        default_factory=list,
         description="Character IDs visible in shot (e.g., ['char_001', 'char_002'])"
     )
-    location_id: Optional[str] = Field(
-        None,
+    location_id: str = Field(
+        default="",
         description="Location ID for this shot (e.g., 'loc_001')"
     )
     dialogue: list[DialogueLineSchema] = Field(
-        default=[],
+        default_factory=list,
         description="Dialogue lines in this shot"
     )
 
     # Audio
     sfx: list[str] = Field(
-        default=[],
+        default_factory=list,
         description="Sound effects (e.g., 'Door creaking', 'Thunder rumbling')"
     )
     music_cue: str = Field(
@@ -429,7 +492,7 @@ class ShotSchema(BaseModel):
     )
 
     # Transition
-    transition: str = Field(
+    transition: Literal["CUT TO", "DISSOLVE TO", "FADE TO BLACK", "MATCH CUT", "SMASH CUT"] = Field(
         ...,
         description="CUT TO, DISSOLVE TO, FADE TO BLACK, MATCH CUT, SMASH CUT"
     )
@@ -441,7 +504,7 @@ class ShotSchema(BaseModel):
     )
 
 
-class StoryboardSchema(BaseModel):
+class StoryboardSchema(_SchemaBase):
     """Complete storyboard for a single scene."""
     scene_id: str = Field(..., description="Unique ID: 'act{N}_scene{M}'")
     scene_title: str = Field(..., description="Brief scene description")
@@ -450,57 +513,64 @@ class StoryboardSchema(BaseModel):
     shots: list[ShotSchema] = Field(..., description="All shots in sequence", min_length=1)
 
 
-class VisualCritiqueSchema(BaseModel):
+class VisualCritiqueSchema(_CritiqueBase):
     """Visual critic's evaluation of storyboard."""
-    location_clarity_score: int = Field(..., ge=1, le=10, description="INT./EXT. and location specificity")
-    shot_composition_score: int = Field(..., ge=1, le=10, description="Shot size and depth layers")
-    camera_work_score: int = Field(..., ge=1, le=10, description="Camera movement motivation")
-    lighting_time_score: int = Field(..., ge=1, le=10, description="Lighting and time consistency")
-    character_blocking_score: int = Field(..., ge=1, le=10, description="Character positions clarity")
-    visual_storytelling_score: int = Field(..., ge=1, le=10, description="Visual focus and emphasis")
-    overall_score: int = Field(..., ge=1, le=10, description="Overall visual quality")
+    location_clarity_score: Score10 = Field(..., description="INT./EXT. and location specificity")
+    shot_composition_score: Score10 = Field(..., description="Shot size and depth layers")
+    camera_work_score: Score10 = Field(..., description="Camera movement motivation")
+    lighting_time_score: Score10 = Field(..., description="Lighting and time consistency")
+    character_blocking_score: Score10 = Field(..., description="Character positions clarity")
+    visual_storytelling_score: Score10 = Field(..., description="Visual focus and emphasis")
+    overall_score: Score10 = Field(..., description="Overall visual quality")
     needs_revision: bool = Field(..., description="True if any score < 7")
     suggestions: list[str] = Field(..., description="Specific visual improvements")
 
 
-class DialogueCritiqueSchema(BaseModel):
+class DialogueCritiqueSchema(_CritiqueBase):
     """Dialogue critic's evaluation of storyboard."""
-    dialogue_length_score: int = Field(..., ge=1, le=10, description="Dialogue fits duration (25-35 words)")
-    delivery_notes_score: int = Field(..., ge=1, le=10, description="Parentheticals for tone")
-    natural_flow_score: int = Field(..., ge=1, le=10, description="Natural spoken dialogue")
-    character_voice_score: int = Field(..., ge=1, le=10, description="Consistent character voice")
-    audio_design_score: int = Field(..., ge=1, le=10, description="SFX, music, ambient quality")
-    overall_score: int = Field(..., ge=1, le=10, description="Overall dialogue quality")
+    dialogue_length_score: Score10 = Field(..., description="Dialogue fits duration (25-35 words)")
+    delivery_notes_score: Score10 = Field(..., description="Parentheticals for tone")
+    natural_flow_score: Score10 = Field(..., description="Natural spoken dialogue")
+    character_voice_score: Score10 = Field(..., description="Consistent character voice")
+    audio_design_score: Score10 = Field(..., description="SFX, music, ambient quality")
+    overall_score: Score10 = Field(..., description="Overall dialogue quality")
     needs_revision: bool = Field(..., description="True if any score < 7")
     word_count_violations: list[int] = Field(
-        default=[],
+        default_factory=list,
         description="Shot numbers exceeding word limits"
     )
     suggestions: list[str] = Field(..., description="Specific dialogue improvements")
 
 
-class ContinuityCritiqueSchema(BaseModel):
+class ContinuityCritiqueSchema(_CritiqueBase):
     """Continuity critic's evaluation of storyboard."""
-    shot_flow_score: int = Field(..., ge=1, le=10, description="Logical shot connections, 180° rule")
-    character_continuity_score: int = Field(..., ge=1, le=10, description="Character position consistency")
-    location_continuity_score: int = Field(..., ge=1, le=10, description="Environment consistency")
-    story_context_score: int = Field(..., ge=1, le=10, description="Scene purpose and plot points")
-    pacing_rhythm_score: int = Field(..., ge=1, le=10, description="Shot variety and timing")
-    overall_coherence_score: int = Field(..., ge=1, le=10, description="Works as video sequence")
-    overall_score: int = Field(..., ge=1, le=10, description="Overall continuity quality")
+    shot_flow_score: Score10 = Field(..., description="Logical shot connections, 180° rule")
+    character_continuity_score: Score10 = Field(..., description="Character position consistency")
+    location_continuity_score: Score10 = Field(..., description="Environment consistency")
+    story_context_score: Score10 = Field(..., description="Scene purpose and plot points")
+    pacing_rhythm_score: Score10 = Field(..., description="Shot variety and timing")
+    overall_coherence_score: Score10 = Field(..., description="Works as video sequence")
+    overall_score: Score10 = Field(..., description="Overall continuity quality")
     needs_revision: bool = Field(..., description="True if any score < 7")
     continuity_errors: list[str] = Field(
-        default=[],
+        default_factory=list,
         description="Specific continuity issues found"
     )
     suggestions: list[str] = Field(..., description="Specific continuity fixes")
 
 
+class CombinedStoryboardCritiqueSchema(_CritiqueBase):
+    """All three storyboard critiques (visual, dialogue, continuity) from one call."""
+    visual: VisualCritiqueSchema = Field(..., description="Cinematographer's visual critique")
+    dialogue: DialogueCritiqueSchema = Field(..., description="Dialogue director's dialogue/audio critique")
+    continuity: ContinuityCritiqueSchema = Field(..., description="Script supervisor's continuity critique")
+
+
 # =============================================================================
 # Complete Story Schema (Final Output)
 # =============================================================================
 
-class StoryMetadataSchema(BaseModel):
+class StoryMetadataSchema(_SchemaBase):
     """Metadata about the story generation process."""
     phase1_cycles: int = Field(..., description="Number of critique-revision cycles in Phase 1")
     phase2_cycles: int = Field(..., description="Number of critique-revision cycles in Phase 2")
@@ -508,7 +578,7 @@ class StoryMetadataSchema(BaseModel):
     model_used: str = Field(..., description="LLM model used for generation")
 
 
-class CompleteStorySchema(BaseModel):
+class CompleteStorySchema(_SchemaBase):
     """Complete story output combining all phases."""
     outline: OutlineSchema = Field(..., description="Phase 1: Story outline")
     characters: list[CharacterSchema] = Field(..., description="Phase 2: Character profiles")
@@ -521,7 +591,7 @@ class CompleteStorySchema(BaseModel):
 # Phase 4: Generic Image Prompt Schemas
 # =============================================================================
 
-class ImagePromptSchema(BaseModel):
+class ImagePromptSchema(_SchemaBase):
     """Structured output for generic image prompts (character, location, scene)."""
     prompt: str = Field(
         ...,
@@ -537,13 +607,16 @@ class ImagePromptSchema(BaseModel):
     )
 
 
-class PosterPromptSchema(BaseModel):
+class PosterPromptSchema(_SchemaBase):
     """Structured output for movie poster prompts."""
     prompt: str = Field(
         ...,
         description="The detailed poster prompt, 250-400 words"
     )
-    composition_type: str = Field(
+    composition_type: Literal[
+        "character_portrait", "action_scene", "symbolic", "minimalist", "panorama",
+        "collage", "text_focused", "silhouette", "geometric",
+    ] = Field(
         ...,
         description="Type: 'character_portrait', 'action_scene', 'symbolic', 'minimalist', 'panorama', 'collage', 'text_focused', 'silhouette', 'geometric'"
     )
@@ -561,7 +634,7 @@ class PosterPromptSchema(BaseModel):
     )
 
 
-class JuryVoteSchema(BaseModel):
+class JuryVoteSchema(_SchemaBase):
     """Structured output for jury voting."""
     first_choice: int = Field(
         ..., ge=0,
@@ -585,7 +658,7 @@ class JuryVoteSchema(BaseModel):
 # Phase 4: Shot Frame Prompt Schemas
 # =============================================================================
 
-class ShotFramePromptSchema(BaseModel):
+class ShotFramePromptSchema(_SchemaBase):
     """Structured output for shot frame image prompts."""
     firstframe_prompt: str = Field(
         ...,
@@ -609,24 +682,22 @@ class ShotFramePromptSchema(BaseModel):
     )
 
 
-class ShotFrameCritiqueSchema(BaseModel):
+class ShotFrameCritiqueSchema(_ScoredCritiqueBase):
     """Critique for shot frame prompts."""
-    character_accuracy_score: int = Field(..., ge=1, le=10, description="Are character descriptions accurate to profiles?")
-    location_accuracy_score: int = Field(..., ge=1, le=10, description="Does location match codex profile?")
-    framing_accuracy_score: int = Field(..., ge=1, le=10, description="Does framing match shot_size?")
-    lighting_mood_score: int = Field(..., ge=1, le=10, description="Does lighting match time_of_day and visual_style_notes?")
-    action_continuity_score: int = Field(..., ge=1, le=10, description="Does first→last frame show logical action progression?")
-    no_names_score: int = Field(..., ge=1, le=10, description="Are character NAMES absent (only descriptions)?")
-    overall_score: float = Field(..., description="Average of all scores")
-    needs_revision: bool = Field(..., description="True if any score < 7")
-    suggestions: list[str] = Field(default=[], description="Specific improvements needed")
+    character_accuracy_score: Score10 = Field(..., description="Are character descriptions accurate to profiles?")
+    location_accuracy_score: Score10 = Field(..., description="Does location match codex profile?")
+    framing_accuracy_score: Score10 = Field(..., description="Does framing match shot_size?")
+    lighting_mood_score: Score10 = Field(..., description="Does lighting match time_of_day and visual_style_notes?")
+    action_continuity_score: Score10 = Field(..., description="Does first→last frame show logical action progression?")
+    no_names_score: Score10 = Field(..., description="Are character NAMES absent (only descriptions)?")
+    suggestions: list[str] = Field(default_factory=list, description="Specific improvements needed")
 
 
 # =============================================================================
 # Phase 4 Step 5: Video Prompt Schemas (LTX Screenplay Format)
 # =============================================================================
 
-class VideoPromptSchema(BaseModel):
+class VideoPromptSchema(_SchemaBase):
     """
     LTX-style video prompt in screenplay format.
 
@@ -659,42 +730,75 @@ class VideoPromptSchema(BaseModel):
     )
 
 
-class VideoPromptCritiqueSchema(BaseModel):
+class VideoPromptCritiqueSchema(_ScoredCritiqueBase):
     """Critique for LTX video prompts."""
-    screenplay_format_score: int = Field(
-        ..., ge=1, le=10,
-        description="Is the prompt in proper screenplay format (slugline, action, dialogue)?"
+    screenplay_format_score: Score10 = Field(
+        ...,
+        description=(
+            "Screenplay format: proper slugline (INT/EXT. LOCATION – TIME – SHOT), scene "
+            "description as a paragraph, dialogue with physical-descriptor tags and "
+            "parenthetical delivery notes"
+        )
     )
-    character_description_score: int = Field(
-        ..., ge=1, le=10,
-        description="Are characters described by physical appearance, not names?"
+    character_description_score: Score10 = Field(
+        ...,
+        description=(
+            "Character description: physical descriptions and clothing match the codex, "
+            "distinguishing features included; score LOW if names are used instead"
+        )
     )
-    camera_movement_score: int = Field(
-        ..., ge=1, le=10,
-        description="Are camera movements clear and appropriate for the action?"
+    camera_movement_score: Score10 = Field(
+        ...,
+        description=(
+            "Camera movement: specific directions (dolly, pan, track) matching the shot's "
+            "camera_movement, with a clear visual progression"
+        )
     )
-    atmosphere_detail_score: int = Field(
-        ..., ge=1, le=10,
-        description="Is atmosphere (lighting, mood, weather) well described?"
+    atmosphere_detail_score: Score10 = Field(
+        ...,
+        description=(
+            "Atmosphere detail: lighting (quality, direction, color), mood, sensory details "
+            "(sounds, weather), consistent with the shot's time_of_day"
+        )
     )
-    dialogue_accuracy_score: int = Field(
-        ..., ge=1, le=10,
-        description="If dialogue present, is it accurate to shot data with proper parentheticals?"
+    dialogue_accuracy_score: Score10 = Field(
+        ...,
+        description=(
+            "Dialogue accuracy: dialogue matches the shot's dialogue field, speaker tags are "
+            "physical descriptions, parentheticals fit tone/delivery; 10 if the shot has no "
+            "dialogue and the prompt has none"
+        )
     )
-    no_names_score: int = Field(
-        ..., ge=1, le=10,
-        description="Score 10 if NO character names used, Score 1 if ANY names found"
+    no_names_score: Score10 = Field(
+        ...,
+        description=(
+            "Score 10 if NO character names used, Score 1 if ANY names found "
+            "(check descriptions AND dialogue tags; hard requirement)"
+        )
+    )
+    suggestions: list[str] = Field(
+        default_factory=list,
+        description=(
+            "Specific improvements needed, most important first: at most 5, one sentence "
+            "each; empty if nothing needs fixing"
+        )
+    )
+
+
+class VideoPromptAndCritiqueSchema(_SchemaBase):
+    """Video prompt plus its self-critique, produced in one agent run."""
+    prompt: VideoPromptSchema = Field(..., description="The screenplay-format video prompt")
+    critique: VideoPromptCritiqueSchema = Field(
+        ...,
+        description="Honest critique of the prompt above against the codex data from the tools"
     )
-    overall_score: float = Field(..., description="Average of all scores")
-    needs_revision: bool = Field(..., description="True if any score < 7")
-    suggestions: list[str] = Field(default=[], description="Specific improvements needed")
 
 
 # =============================================================================
 # Phase 1 Step-Granular Schemas (Research-Driven Outline Generation)
 # =============================================================================
 
-class HighLevelStructureSchema(BaseModel):
+class HighLevelStructureSchema(_SchemaBase):
     """High-level story structure without character names."""
     three_act_summary: str = Field(..., description="Summary of 3-act structure")
     central_conflict: str = Field(..., description="Core conflict of the story")
@@ -704,28 +808,28 @@ class HighLevelStructureSchema(BaseModel):
     emotional_arc: str = Field(..., description="Emotional journey of the story")
 
 
-class BeatSheetSchema(BaseModel):
+class BeatSheetSchema(_SchemaBase):
     """Beat sheet with bullet points for each act."""
     act1_beats: list[str] = Field(..., description="Bullet points for Act 1 (Setup)")
     act2_beats: list[str] = Field(..., description="Bullet points for Act 2 (Confrontation)")
     act3_beats: list[str] = Field(..., description="Bullet points for Act 3 (Resolution)")
 
 
-class ResearchInsightSchema(BaseModel):
+class ResearchInsightSchema(_SchemaBase):
     """Research insight from web search."""
     topic: str = Field(..., description="What was researched (e.g., 'Hero's Journey', 'Save the Cat')")
     key_points: list[str] = Field(..., description="Key insights from research")
     application: str = Field(..., description="How to apply this to our story")
 
 
-class ResearchInsightsListSchema(BaseModel):
+class ResearchInsightsListSchema(_SchemaBase):
     """Wrapper for research insights list output."""
     insights: list[ResearchInsightSchema] = Field(
         ..., description="List of research insights"
     )
 
 
-class SceneListSchema(BaseModel):
+class SceneListSchema(_SchemaBase):
     """Wrapper for scene list output."""
     scenes: list[SceneSchema] = Field(
         ..., description="List of scenes"
@@ -736,7 +840,7 @@ class SceneListSchema(BaseModel):
 # Phase 4 Step 4: Scene Image Prompt Schemas
 # =============================================================================
 
-class SceneImagePromptSchema(BaseModel):
+class SceneImagePromptSchema(_SchemaBase):
     """Structured output for scene image prompt generation."""
     prompt: str = Field(
         ...,
@@ -757,34 +861,39 @@ class SceneImagePromptSchema(BaseModel):
     mood_lighting: str = Field(..., description="Lighting and atmosphere description")
 
 
-class SceneImageCritiqueSchema(BaseModel):
+class SceneImageCritiqueSchema(_ScoredCritiqueBase):
     """Critique for scene image prompts."""
-    character_accuracy_score: int = Field(
-        ..., ge=1, le=10,
+    # no_names_score comes first so a failing score can be acted on mid-stream
+    no_names_score: Score10 = Field(
+        ...,
+        description="Score 10 if NO character names used, Score 1 if ANY names found"
+    )
+    character_accuracy_score: Score10 = Field(
+        ...,
         description="Physical descriptions match codex character profiles"
     )
-    location_accuracy_score: int = Field(
-        ..., ge=1, le=10,
+    location_accuracy_score: Score10 = Field(
+        ...,
         description="Setting matches codex location profile"
     )
-    no_names_score: int = Field(
-        ..., ge=1, le=10,
-        description="Score 10 if NO character names used, Score 1 if ANY names found"
-    )
-    visual_detail_score: int = Field(
-        ..., ge=1, le=10,
+    visual_detail_score: Score10 = Field(
+        ...,
         description="Sufficient detail for image generation"
     )
-    composition_score: int = Field(
-        ..., ge=1, le=10,
-        description="Good framing and focus"
-    )
-    overall_score: float = Field(..., description="Average of all scores")
-    needs_revision: bool = Field(
+    composition_score: Score10 = Field(
         ...,
-        description="True if any score < 7 or no_names_score < 10"
+        description="Good framing and focus"
     )
     suggestions: list[str] = Field(
-        default=[],
+        default_factory=list,
         description="Specific improvements needed"
     )
+
+
+class ComposedAndCritiquedSchema(_SchemaBase):
+    """Scene image prompt plus its self-critique, produced in one call."""
+    prompt: SceneImagePromptSchema = Field(..., description="The composed scene image prompt")
+    critique: SceneImageCritiqueSchema = Field(
+        ...,
+        description="Honest critique of the prompt above against the provided codex data"
+    )
@@ -11,6 +11,7 @@ Each phase follows the pattern:
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 from src.story_agents.outline_agents import (
@@ -33,7 +34,12 @@ from src.story_agents.name_agents import generate_character_names_via_debate
 from src.config import DEFAULT_MODEL, STORY_SCOPES, DEFAULT_STORY_SCOPE
 
 
-CRITIQUE_CYCLES = 2  # Number of critique-revision cycles per phase
+CRITIQUE_CYCLES = 2  # Maximum critique-revision cycles per phase
+
+
+def _critiques_clear(*critiques) -> bool:
+    """True when no critic reported an issue, so the revision (and any later cycle) can be skipped."""
+    return not any(critique.issues for critique in critiques)
 
 
 # =============================================================================
@@ -267,8 +273,8 @@ def run_phase1_outline(story_prompt: str, setting_prompt: str,
 
     # Create initial outline with scope constraints
     print("\n>>> Creating initial outline...")
-    outline_schema = outliner.create_outline(story_prompt, setting_prompt, scope_config)
-    current_outline_json = json.dumps(outline_schema.model_dump(), indent=2)
+    current_outline = outliner.create_outline(story_prompt, setting_prompt, scope_config)
+    current_outline_json = current_outline.model_dump_json(indent=2)
     print("    Initial outline created.")
 
     # Critique-revision cycles
@@ -276,28 +282,37 @@ def run_phase1_outline(story_prompt: str, setting_prompt: str,
         print(f"\n>>> Critique-Revision Cycle {cycle + 1}/{CRITIQUE_CYCLES}")
         cycle_data = {"cycle": cycle + 1, "critiques": [], "revision_applied": True}
 
-        # Get critiques (now returns CritiqueSchema objects)
-        print("    Getting structure critique...")
-        structure_critique = structure_critic.critique(current_outline_json)
+        # Get critiques (now returns CritiqueSchema objects); the critics read
+        # the same draft independently, so they run concurrently
+        print("    Getting structure + pacing critiques (parallel)...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            structure_future = executor.submit(structure_critic.critique, current_outline_json)
+            pacing_future = executor.submit(pacing_critic.critique, current_outline_json)
+        structure_critique = structure_future.result()
+        pacing_critique = pacing_future.result()
         cycle_data["critiques"].append(structure_critique.model_dump())
-
-        print("    Getting pacing critique...")
-        pacing_critique = pacing_critic.critique(current_outline_json)
         cycle_data["critiques"].append(pacing_critique.model_dump())
 
+        if _critiques_clear(structure_critique, pacing_critique):
+            print("    No issues reported; skipping remaining cycles.")
+            cycle_data["revision_applied"] = False
+            phase_metadata["cycles"].append(cycle_data)
+            break
+
         # Revise based on critiques (now returns OutlineSchema)
         print("    Revising outline...")
         revised_outline = reviser.revise_outline(
             current_outline_json,
-            [json.dumps(structure_critique.model_dump()), json.dumps(pacing_critique.model_dump())]
+            [structure_critique.model_dump_json(), pacing_critique.model_dump_json()]
         )
-        current_outline_json = json.dumps(revised_outline.model_dump(), indent=2)
+        current_outline = revised_outline
+        current_outline_json = current_outline.model_dump_json(indent=2)
         print("    Revision complete.")
 
         phase_metadata["cycles"].append(cycle_data)
 
-    # Final outline is already a dict from the last revision
-    final_outline = json.loads(current_outline_json)
+    # Final outline straight from the last revision's model (no JSON round trip)
+    final_outline = current_outline.model_dump()
 
     phase_metadata["final_outline"] = final_outline
 
@@ -384,18 +399,18 @@ def run_phase2_characters_locations(outline_json: str, setting_prompt: str,
 
     # Create initial profiles with limits, using pre-generated names
     print(f"\n>>> Building character profiles (max {max_characters})...")
-    characters_schema = character_builder.build_characters(
+    current_characters = character_builder.build_characters(
         outline_json, setting_prompt, max_characters,
         predefined_names=names  # Pass pre-generated names (now synced)
     )
-    current_characters_json = json.dumps(characters_schema.model_dump(), indent=2)
+    current_characters_json = current_characters.model_dump_json(indent=2)
     print("    Characters created.")
 
     print(f"\n>>> Building location profiles (max {max_locations})...")
-    locations_schema = location_builder.build_locations(
+    current_locations = location_builder.build_locations(
         outline_json, setting_prompt, max_locations
     )
-    current_locations_json = json.dumps(locations_schema.model_dump(), indent=2)
+    current_locations_json = current_locations.model_dump_json(indent=2)
     print("    Locations created.")
 
     # Critique-revision cycles
@@ -410,31 +425,36 @@ def run_phase2_characters_locations(outline_json: str, setting_prompt: str,
         )
         cycle_data["critiques"].append(consistency_critique.model_dump())
 
+        if _critiques_clear(consistency_critique):
+            print("    No issues reported; skipping remaining cycles.")
+            cycle_data["revision_applied"] = False
+            phase_metadata["cycles"].append(cycle_data)
+            break
+
         # Revise both based on critique (with locked names to preserve debate results)
         print("    Revising characters...")
         revised_characters = reviser.revise_characters(
             current_characters_json,
-            [json.dumps(consistency_critique.model_dump())],
+            [consistency_critique.model_dump_json()],
             locked_names=locked_names  # Preserve debated names
         )
-        current_characters_json = json.dumps(revised_characters.model_dump(), indent=2)
+        current_characters = revised_characters
+        current_characters_json = current_characters.model_dump_json(indent=2)
 
         print("    Revising locations...")
         revised_locations = reviser.revise_locations(
             current_locations_json,
-            [json.dumps(consistency_critique.model_dump())]
+            [consistency_critique.model_dump_json()]
         )
-        current_locations_json = json.dumps(revised_locations.model_dump(), indent=2)
+        current_locations = revised_locations
+        current_locations_json = current_locations.model_dump_json(indent=2)
         print("    Revision complete.")
 
         phase_metadata["cycles"].append(cycle_data)
 
-    # Parse final outputs from JSON strings
-    characters_data = json.loads(current_characters_json)
-    final_characters = characters_data.get("characters", characters_data)
-
-    locations_data = json.loads(current_locations_json)
-    final_locations = locations_data.get("locations", locations_data)
+    # Final outputs straight from the last revision's models
+    final_characters = current_characters.model_dump()["characters"]
+    final_locations = current_locations.model_dump()["locations"]
 
     phase_metadata["final_characters"] = final_characters
     phase_metadata["final_locations"] = final_locations
@@ -545,23 +565,30 @@ def run_phase3_narrative(outline_json: str, characters_json: str,
         # Convert to JSON for critics (they expect JSON string)
         current_narrative_json = json.dumps(current_narrative_dict, indent=2, ensure_ascii=False)
 
-        # Get critiques (now returns CritiqueSchema objects)
-        print("    Getting style critique...")
-        style_critique = style_critic.critique(current_narrative_json)
+        # Get critiques (now returns CritiqueSchema objects); independent, so concurrent
+        print("    Getting style + continuity critiques (parallel)...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            style_future = executor.submit(style_critic.critique, current_narrative_json)
+            continuity_future = executor.submit(
+                continuity_critic.critique, current_narrative_json, characters_json, locations_json
+            )
+        style_critique = style_future.result()
+        continuity_critique = continuity_future.result()
         cycle_data["critiques"].append(style_critique.model_dump())
-
-        print("    Getting continuity critique...")
-        continuity_critique = continuity_critic.critique(
-            current_narrative_json, characters_json, locations_json
-        )
         cycle_data["critiques"].append(continuity_critique.model_dump())
 
+        if _critiques_clear(style_critique, continuity_critique):
+            print("    No issues reported; skipping remaining cycles.")
+            cycle_data["revision_applied"] = False
+            phase_metadata["cycles"].append(cycle_data)
+            break
+
         # Revise narrative using structured output
         print("    Revising narrative (structured output)...")
         try:
             revised = reviser.revise_narrative_structured(
                 current_narrative_dict,
-                [json.dumps(style_critique.model_dump()), json.dumps(continuity_critique.model_dump())]
+                [style_critique.model_dump_json(), continuity_critique.model_dump_json()]
             )
             # Convert Pydantic model to dict
             current_narrative_dict = revised.model_dump()
@@ -583,10 +610,10 @@ def run_phase3_narrative(outline_json: str, characters_json: str,
                         # Build targeted critique for this scene
                         scene_critique = f"""
 Style Issues (from STYLE_CRITIC):
-{json.dumps(style_critique.model_dump().get('issues', []), indent=2)}
+{json.dumps(style_critique.issues, indent=2)}
 
 Continuity Issues (from CONTINUITY_CRITIC):
-{json.dumps(continuity_critique.model_dump().get('issues', []), indent=2)}
+{json.dumps(continuity_critique.issues, indent=2)}
 
 Focus on issues that apply to scene {scene_num}.
 """
@@ -700,7 +727,11 @@ def run_full_story_pipeline(story_prompt: str, setting_prompt: str,
             "phase1_outline": phase1["metadata"],
             "phase2_characters": phase2["metadata"],
             "phase3_narrative": phase3["metadata"],
-            "critique_cycles_per_phase": CRITIQUE_CYCLES,
+            # Cycles actually run (a phase stops early once its critics find no issues)
+            "phase1_cycles": len(phase1["metadata"]["cycles"]),
+            "phase2_cycles": len(phase2["metadata"]["cycles"]),
+            "phase3_cycles": len(phase3["metadata"]["cycles"]),
+            "max_critique_cycles_per_phase": CRITIQUE_CYCLES,
             "model_used": model,
             "scope": scope,
             "scope_config": scope_config,
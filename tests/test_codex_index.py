@@ -0,0 +1,124 @@
+"""Tests for src.story_agents.codex_index: name lookups, fuzzy matching and invalidation."""
+
+import pytest
+
+from src.story_agents import codex_index
+from src.story_agents.codex_index import (
+    get_codex_index,
+    get_codex_list_memo,
+    get_codex_memo,
+    invalidate_codex_index,
+)
+
+
+@pytest.fixture
+def codex():
+    return {
+        "story": {
+            "characters": [
+                {"name": "Yara Ridgewell", "role_in_story": "Protagonist"},
+                {"name": "Tomas O'Bryne", "role_in_story": "Mentor"},
+            ],
+            "locations": [
+                {"name": "The Salt Archive"},
+            ],
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_index_cache():
+    codex_index._index_cache.clear()
+    codex_index._list_memo_cache.clear()
+    yield
+    codex_index._index_cache.clear()
+    codex_index._list_memo_cache.clear()
+
+
+def test_find_character_exact_and_partial(codex):
+    index = get_codex_index(codex)
+    yara = codex["story"]["characters"][0]
+
+    assert index.find_character("yara ridgewell") is yara
+    assert index.find_character("  Yara ") is yara
+    assert index.find_character("Nobody") is None
+
+
+def test_find_character_fuzzy(codex):
+    index = get_codex_index(codex)
+    yara, tomas = codex["story"]["characters"]
+
+    assert index.find_character("Ridgewell, Yara") is yara  # word order
+    assert index.find_character("Yara Ridgwell") is yara  # typo
+    assert index.find_character("Tomas OBryne") is tomas  # punctuation
+
+
+def test_match_character_either_direction(codex):
+    index = get_codex_index(codex)
+    yara = codex["story"]["characters"][0]
+
+    assert index.match_character("Yara") is yara
+    assert index.match_character("a tired Yara Ridgewell at dawn") is yara
+    assert index.match_character("a stranger") is None
+
+
+def test_find_character_by_role_and_location(codex):
+    index = get_codex_index(codex)
+
+    assert index.find_character_by_role("the protagonist")["name"] == "Yara Ridgewell"
+    assert index.find_location("salt archive")["name"] == "The Salt Archive"
+
+
+def test_index_is_shared_until_lists_change(codex):
+    index = get_codex_index(codex)
+    assert get_codex_index(codex) is index
+
+    codex["story"]["characters"].append({"name": "Iven Marsh"})
+    rebuilt = get_codex_index(codex)
+    assert rebuilt is not index
+    assert rebuilt.find_character("Iven Marsh") is not None
+
+
+def test_invalidate_after_in_place_edit(codex):
+    index = get_codex_index(codex)
+    fingerprint = index.fingerprint
+    builds = []
+    get_codex_memo(codex, ("block",), lambda: builds.append(1))
+
+    codex["story"]["characters"][0]["name"] = "Yara Vale"
+    assert get_codex_index(codex) is index  # same lists, same length: not detected
+
+    invalidate_codex_index(codex)
+    rebuilt = get_codex_index(codex)
+    assert rebuilt is not index
+    assert rebuilt.fingerprint != fingerprint
+    assert rebuilt.find_character("Yara Vale") is codex["story"]["characters"][0]
+
+    get_codex_memo(codex, ("block",), lambda: builds.append(1))
+    assert len(builds) == 2
+
+
+def test_invalidate_unknown_codex_is_noop(codex):
+    invalidate_codex_index(codex)
+    assert get_codex_index(codex).find_character("Yara Ridgewell") is not None
+
+
+def test_list_memo_follows_codex_invalidation(codex):
+    characters = codex["story"]["characters"]
+    builds = []
+
+    def build():
+        builds.append(1)
+        return [c["name"] for c in characters]
+
+    assert get_codex_list_memo(characters, "names", build) == ["Yara Ridgewell", "Tomas O'Bryne"]
+    get_codex_list_memo(characters, "names", build)
+    assert len(builds) == 1
+
+    characters[0]["name"] = "Yara Vale"
+    invalidate_codex_index(codex)
+    assert get_codex_list_memo(characters, "names", build)[0] == "Yara Vale"
+
+    characters.append({"name": "Iven Marsh"})
+    assert get_codex_list_memo(characters, "names", build)[-1] == "Iven Marsh"
+    assert len(builds) == 3
@@ -0,0 +1,111 @@
+"""Tests for src.llm_cache: key stability, disk persistence and schema-version misses."""
+
+import pytest
+from pydantic import BaseModel
+
+from src import llm_cache
+from src.llm_cache import (
+    LLMCache,
+    cached_structured_call,
+    make_cache_key,
+    schema_fingerprint,
+    structured_cache_key,
+)
+
+
+class _Answer(BaseModel):
+    text: str
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Point the process-wide cache at a fresh directory."""
+    cache = LLMCache(cache_dir=tmp_path, enabled=True)
+    monkeypatch.setattr(llm_cache, "_default_cache", cache)
+    return cache
+
+
+def _counting_call(value: BaseModel):
+    """Zero-argument call returning value and counting its invocations."""
+    calls = []
+
+    def call():
+        calls.append(1)
+        return value
+
+    return call, calls
+
+
+def test_cache_key_is_stable_and_order_independent():
+    key = make_cache_key(model="m", temperature=0.7, user="hello")
+    assert key == make_cache_key(user="hello", temperature=0.7, model="m")
+    assert key != make_cache_key(model="m", temperature=0.8, user="hello")
+
+
+def test_structured_cache_key_depends_on_schema_definition():
+    class Answer(BaseModel):
+        text: str
+
+    class AnswerV2(BaseModel):
+        text: str
+        score: int
+
+    AnswerV2.__name__ = "Answer"
+
+    assert schema_fingerprint(Answer) == schema_fingerprint(Answer)
+    assert structured_cache_key(Answer, user="x") != structured_cache_key(AnswerV2, user="x")
+
+
+def test_disk_round_trip(tmp_path):
+    LLMCache(cache_dir=tmp_path).set("abc123", {"text": "cached"})
+
+    fresh = LLMCache(cache_dir=tmp_path)
+    assert fresh.get("abc123") == {"text": "cached"}
+    assert fresh.hits == 1
+    assert fresh.get("missing") is None
+    assert fresh.misses == 1
+
+
+def test_disabled_cache_stores_nothing(tmp_path):
+    cache = LLMCache(cache_dir=tmp_path, enabled=False)
+    cache.set("abc123", {"text": "cached"})
+    assert cache.get("abc123") is None
+    assert not any(tmp_path.iterdir())
+
+
+def test_cached_structured_call_hits_after_first_call(disk_cache):
+    call, calls = _counting_call(_Answer(text="fresh"))
+
+    first = cached_structured_call(_Answer, call, model="m", user="hello")
+    second = cached_structured_call(_Answer, call, model="m", user="hello")
+
+    assert first == second == _Answer(text="fresh")
+    assert len(calls) == 1
+
+
+def test_schema_change_misses_old_entries(disk_cache):
+    call, calls = _counting_call(_Answer(text="v1"))
+    cached_structured_call(_Answer, call, model="m", user="hello")
+
+    class _AnswerV2(BaseModel):
+        text: str
+        score: int
+
+    _AnswerV2.__name__ = _Answer.__name__
+    call_v2, calls_v2 = _counting_call(_AnswerV2(text="v2", score=3))
+
+    result = cached_structured_call(_AnswerV2, call_v2, model="m", user="hello")
+    assert result == _AnswerV2(text="v2", score=3)
+    assert len(calls_v2) == 1
+
+
+def test_entry_failing_validation_is_a_miss(disk_cache):
+    key = structured_cache_key(_Answer, model="m", user="hello")
+    disk_cache.set(key, {"unexpected": "shape"})
+    call, calls = _counting_call(_Answer(text="fresh"))
+
+    result = cached_structured_call(_Answer, call, model="m", user="hello")
+
+    assert result == _Answer(text="fresh")
+    assert len(calls) == 1
+    assert LLMCache(cache_dir=disk_cache.cache_dir).get(key) == {"text": "fresh"}